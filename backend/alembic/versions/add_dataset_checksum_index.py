@@ -0,0 +1,28 @@
+"""Index datasets.checksum
+
+Profiling and PII detection look up previously analysed datasets with the
+same content by checksum.
+
+Revision ID: add_dataset_checksum_index
+Revises: migrate_to_better_auth
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_dataset_checksum_index'
+down_revision: Union[str, None] = 'migrate_to_better_auth'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_datasets_checksum', 'datasets', ['checksum'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_datasets_checksum', table_name='datasets')
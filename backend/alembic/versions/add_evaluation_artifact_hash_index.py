@@ -0,0 +1,27 @@
+"""Index evaluations.artifact_hash
+
+Lets identical reports be looked up by hash (dedup / integrity checks).
+
+Revision ID: add_evaluation_artifact_hash_index
+Revises: add_evaluation_list_indexes
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_evaluation_artifact_hash_index'
+down_revision: Union[str, None] = 'add_evaluation_list_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_evaluations_artifact_hash', 'evaluations', ['artifact_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_evaluations_artifact_hash', table_name='evaluations')
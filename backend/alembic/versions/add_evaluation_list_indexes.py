@@ -0,0 +1,39 @@
+"""Add composite indexes for evaluation listings
+
+Evaluations are listed per generator and per dataset, newest first.
+
+Revision ID: add_evaluation_list_indexes
+Revises: add_dataset_checksum_index
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_evaluation_list_indexes'
+down_revision: Union[str, None] = 'add_dataset_checksum_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_evaluations_generator_id_created_at',
+        'evaluations',
+        ['generator_id', 'created_at'],
+        unique=False
+    )
+    op.create_index(
+        'ix_evaluations_dataset_id_created_at',
+        'evaluations',
+        ['dataset_id', 'created_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_evaluations_dataset_id_created_at', table_name='evaluations')
+    op.drop_index('ix_evaluations_generator_id_created_at', table_name='evaluations')
@@ -0,0 +1,29 @@
+"""Index generators.created_by
+
+Evaluation and generator listings are scoped to the current user through
+generators.created_by; evaluations.generator_id is already covered by
+ix_evaluations_generator_id_created_at.
+
+Revision ID: add_generator_created_by_index
+Revises: add_insights_cache_table
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_generator_created_by_index'
+down_revision: Union[str, None] = 'add_insights_cache_table'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_generators_created_by', 'generators', ['created_by'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_generators_created_by', table_name='generators')
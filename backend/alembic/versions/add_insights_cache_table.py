@@ -0,0 +1,37 @@
+"""Add insights_cache table
+
+Content-addressed cache of LLM evaluation insights, so identical reports
+share one LLM call.
+
+Revision ID: add_insights_cache_table
+Revises: add_evaluation_artifact_hash_index
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_insights_cache_table'
+down_revision: Union[str, None] = 'add_evaluation_artifact_hash_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'insights_cache',
+        sa.Column('report_hash', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('insights', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('report_hash')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('insights_cache')
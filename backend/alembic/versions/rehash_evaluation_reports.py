@@ -0,0 +1,90 @@
+"""Re-hash evaluation reports with canonical orjson encoding
+
+Evaluation.compute_report_hash used to hash
+json.dumps(report, sort_keys=True, default=str) and now hashes the
+compact orjson encoding with sorted keys. The two differ byte for byte
+(separators, non-ASCII escaping), so artifact hashes stored before the
+change no longer match a recomputed hash. This rewrites them.
+
+Only rows whose stored hash matches their report under the old encoding
+are rewritten. A row that fails that check is left as is (and counted in
+the log), so re-hashing never makes a mismatching report look verified.
+
+Revision ID: rehash_evaluation_reports
+Revises: add_generator_created_by_index
+Create Date: 2026-10-18
+
+"""
+import hashlib
+import json
+import logging
+from typing import Callable, Sequence, Union
+
+from alembic import op
+import orjson
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'rehash_evaluation_reports'
+down_revision: Union[str, None] = 'add_generator_created_by_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+_BATCH_SIZE = 500
+
+evaluations = sa.table(
+    'evaluations',
+    sa.column('id', sa.Uuid()),
+    sa.column('report', sa.JSON()),
+    sa.column('artifact_hash', sa.String()),
+)
+
+
+def _json_hash(report: dict) -> str:
+    """Artifact hash as computed before this revision."""
+    return hashlib.sha256(json.dumps(report, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _orjson_hash(report: dict) -> str:
+    """Artifact hash as computed by Evaluation.compute_report_hash."""
+    return hashlib.sha256(orjson.dumps(report, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _rehash(old_hash: Callable[[dict], str], new_hash: Callable[[dict], str]) -> None:
+    """Replace every stored hash that verifies under `old_hash` with `new_hash`."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(evaluations.c.id, evaluations.c.report, evaluations.c.artifact_hash)
+        .where(evaluations.c.artifact_hash.isnot(None))
+        .execution_options(yield_per=_BATCH_SIZE)
+    )
+    updates, skipped = [], 0
+    for evaluation_id, report, artifact_hash in rows:
+        if old_hash(report or {}) != artifact_hash:
+            skipped += 1
+            continue
+        updates.append({"evaluation_id": evaluation_id, "artifact_hash": new_hash(report or {})})
+    rows.close()
+
+    statement = (
+        evaluations.update()
+        .where(evaluations.c.id == sa.bindparam("evaluation_id"))
+        .values(artifact_hash=sa.bindparam("artifact_hash"))
+    )
+    for start in range(0, len(updates), _BATCH_SIZE):
+        bind.execute(statement, updates[start:start + _BATCH_SIZE])
+
+    logger.info(f"Re-hashed {len(updates)} evaluation reports")
+    if skipped:
+        logger.warning(f"Left {skipped} evaluation hashes that don't match their report unchanged")
+
+
+def upgrade() -> None:
+    _rehash(_json_hash, _orjson_hash)
+
+
+def downgrade() -> None:
+    _rehash(_orjson_hash, _json_hash)
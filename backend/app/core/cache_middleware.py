@@ -6,17 +6,33 @@ Implements Vercel/GitHub/Cloudflare caching patterns
 # Standard library
 import hashlib
 import logging
-from typing import Callable
+from typing import Callable, Tuple
 
 # Third-party
 from starlette.datastructures import MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import FileResponse, Response, StreamingResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check if the client's If-None-Match matches an ETag"""
+    if not etag:
+        return False
+    
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    
+    # Handle multiple ETags in If-None-Match
+    client_etags = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in client_etags or "*" in client_etags
+
+
 class CacheControlMiddleware(BaseHTTPMiddleware):
     """
     Add Cache-Control and ETag headers based on route patterns.
@@ -179,16 +195,7 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
     
     def _check_etag_match(self, request: Request, etag: str) -> bool:
         """Check if client's If-None-Match matches current ETag"""
-        if not etag:
-            return False
-        
-        if_none_match = request.headers.get("If-None-Match")
-        if not if_none_match:
-            return False
-        
-        # Handle multiple ETags in If-None-Match
-        client_etags = [tag.strip() for tag in if_none_match.split(",")]
-        return etag in client_etags or "*" in client_etags
+        return etag_matches(request, etag)
 
 
 class TrailingSlashMiddleware(BaseHTTPMiddleware):
@@ -289,3 +296,29 @@ class CookieOptimizationMiddleware(BaseHTTPMiddleware):
             path.startswith('/_next/static/') or
             any(path.endswith(ext) for ext in static_extensions)
         )
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """
+    GZip compression that leaves file downloads alone.
+    
+    Compressing a FileResponse forces its body through Python chunk by chunk,
+    which defeats the server's zero-copy sendfile path. Downloads are already
+    sent with an explicit Content-Length, so they are passed through untouched.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        exclude_path_suffixes: Tuple[str, ...] = ("/download",),
+        **kwargs
+    ) -> None:
+        super().__init__(app, minimum_size=minimum_size, **kwargs)
+        self.exclude_path_suffixes = exclude_path_suffixes
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].rstrip("/").endswith(self.exclude_path_suffixes):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
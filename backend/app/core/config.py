@@ -41,6 +41,26 @@ class Settings:
     # Must start with a dot for subdomain sharing
     cookie_domain: str = os.getenv("COOKIE_DOMAIN", ".synthdata.studio")
     
+    # Dataset loading
+    # Parse CSVs with pyarrow's multithreaded CSV reader, whole or in chunks
+    # (falls back to the pandas C engine)
+    fast_csv: bool = os.getenv("FAST_CSV", "true").lower() == "true"
+    # Number of parsed datasets kept in the per-process DataFrame cache
+    dataset_cache_size: int = int(os.getenv("DATASET_CACHE_SIZE", "8"))
+    # Upper bound on the memory held by that cache (deep DataFrame size)
+    dataset_cache_max_mb: int = int(os.getenv("DATASET_CACHE_MAX_MB", "1024"))
+    # Files larger than this are profiled in chunks instead of loaded whole
+    profile_chunk_threshold_mb: int = int(os.getenv("PROFILE_CHUNK_THRESHOLD_MB", "256"))
+    
+    # Evaluation
+    # Worker processes used to run the statistical / ML utility / privacy
+    # evaluations of a quality report side by side (1 = run them in-process)
+    eval_workers: int = int(os.getenv("EVAL_WORKERS", str(min(3, os.cpu_count() or 1))))
+    # Quick evaluations of files larger than this stream them into a row sample
+    quick_eval_stream_threshold_mb: int = int(os.getenv("QUICK_EVAL_STREAM_THRESHOLD_MB", "256"))
+    # Rows in that sample (per dataset)
+    quick_eval_sample_rows: int = int(os.getenv("QUICK_EVAL_SAMPLE_ROWS", "200000"))
+    
     def __post_init__(self):
         """Validate critical settings after initialization."""
         import logging
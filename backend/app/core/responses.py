@@ -0,0 +1,33 @@
+"""
+Response classes shared by the API routers.
+"""
+
+# Standard library
+from typing import Any
+
+# Third-party
+import orjson
+from fastapi.responses import Response
+
+
+def orjson_dumps(content: Any) -> bytes:
+    """Serialize to JSON the way ORJSONResponse renders its content."""
+    return orjson.dumps(
+        content,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+class ORJSONResponse(Response):
+    """
+    JSON response rendered with orjson.
+
+    Meant to be returned directly from endpoints with large payloads
+    (evaluation reports): a returned Response skips FastAPI's response_model
+    validation and serialization passes, while the route's response_model
+    still documents the shape. orjson writes NaN/Infinity as null.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
@@ -26,14 +26,17 @@ def calculate_checksum(file_path: Union[str, Path]) -> str:
     """
     Calculate SHA-256 checksum of a file.
     
+    The file is streamed through the hash rather than read into memory, so
+    large uploads don't cause a file-sized allocation.
+    
     Args:
         file_path: Path to file
         
     Returns:
         Hex digest of SHA-256 hash
     """
-    file_path = Path(file_path)
-    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def format_bytes(size_bytes: int) -> str:
@@ -8,7 +8,7 @@ Centralizes common validation logic to ensure consistency and DRY principles.
 import re
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 
 # Third-party
 from fastapi import HTTPException
@@ -37,6 +37,29 @@ def validate_uuid(uuid_str: str, param_name: str = "id") -> uuid.UUID:
         )
 
 
+def validate_uuids(uuid_strs: Iterable[str], param_name: str = "id") -> List[uuid.UUID]:
+    """
+    Validate and convert several strings to UUIDs.
+    
+    Args:
+        uuid_strs: String representations of UUIDs
+        param_name: Name of the parameter (for error messages)
+        
+    Returns:
+        Validated UUID objects, in order
+        
+    Raises:
+        HTTPException: 422 if any UUID format is invalid
+    """
+    try:
+        return [uuid.UUID(uuid_str) for uuid_str in uuid_strs]
+    except (ValueError, AttributeError, TypeError):
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid UUID format for {param_name}"
+        )
+
+
 def validate_filename(filename: str, max_length: int = 200) -> str:
     """
     Sanitize filename for safe filesystem use.
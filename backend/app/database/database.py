@@ -6,6 +6,7 @@ import sys
 from pathlib import Path
 
 # Third-party
+import orjson
 from dotenv import load_dotenv
 from sqlalchemy import JSON, create_engine
 from sqlalchemy.dialects.postgresql import JSONB
@@ -35,6 +36,18 @@ if not db_url:
         print("=" * 60 + "\n")
         sys.exit(1)
 
+
+def json_serializer(obj) -> str:
+    """
+    Serialize JSON/JSONB column values with orjson.
+    
+    Besides being faster than the stdlib encoder, orjson writes NaN and
+    Infinity as null (PostgreSQL JSONB rejects them), so evaluation reports
+    can be stored as produced without a separate sanitizing pass.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
 # Production-ready connection pooling settings
 if "postgresql" in db_url:
     # PostgreSQL with connection pooling and keepalive
@@ -53,11 +66,12 @@ if "postgresql" in db_url:
         pool_timeout=30,  # Seconds to wait for connection
         pool_recycle=3600,  # Recycle connections after 1 hour (prevents SSL timeouts)
         pool_pre_ping=True,  # Test connection before using (auto-reconnect if dead)
+        json_serializer=json_serializer,
     )
 else:
     # SQLite
     connect_args = {"check_same_thread": False}
-    engine = create_engine(db_url, connect_args=connect_args)
+    engine = create_engine(db_url, connect_args=connect_args, json_serializer=json_serializer)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Session = SessionLocal
@@ -0,0 +1,526 @@
+"""
+Dataset file loading.
+
+Uploaded CSV/JSON files are parsed once and cached next to the original as a
+zstd-compressed Parquet sidecar (`<file>.parquet`). Every later read prefers
+the sidecar, which is columnar, so callers can project just the columns they
+need instead of re-parsing the whole text file.
+
+On top of that, recently loaded frames are memoized in-process, keyed by the
+source file's path, mtime and size, so the profile / PII / evaluation passes
+over the same upload don't each pay for a fresh load. The memo is bounded by
+both entry count and total bytes, so a few very wide uploads can't pin an
+unbounded amount of memory.
+"""
+
+# Standard library
+import logging
+import os
+import threading
+from collections import OrderedDict
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Third-party
+import numpy as np
+import orjson
+import pandas as pd
+
+# Internal
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# ijson (with its C backend) streams large JSON arrays record by record
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    logger.warning("ijson not available, large JSON uploads will be parsed in memory")
+
+# pyarrow's multithreaded CSV reader backs the fast CSV path
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_CSV_AVAILABLE = True
+except ImportError:
+    PYARROW_CSV_AVAILABLE = False
+    logger.warning("pyarrow not available, CSVs will be parsed with the pandas C engine")
+
+# Bytes of CSV text handed to each pyarrow parsing thread
+CSV_BLOCK_SIZE = 16 * 1024 * 1024
+# Bytes of CSV text pyarrow looks at to predict its own type inference
+CSV_SCHEMA_PEEK_SIZE = 1024 * 1024
+
+# JSON arrays above this size are streamed instead of parsed in one go
+JSON_STREAM_THRESHOLD_BYTES = 32 * 1024 * 1024
+# Records per DataFrame batch when streaming JSON
+JSON_BATCH_SIZE = 100_000
+
+
+class _FrameCache:
+    """Thread-safe LRU of DataFrames, bounded by entry count and total bytes."""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._frames: "OrderedDict[tuple, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is None:
+                return None
+            self._frames.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: tuple, df: pd.DataFrame) -> None:
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        if self.max_entries <= 0 or nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._frames.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._frames[key] = (df, nbytes)
+            self._bytes += nbytes
+            while len(self._frames) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._frames.popitem(last=False)
+                self._bytes -= evicted_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+
+
+_frame_cache = _FrameCache(
+    max_entries=settings.dataset_cache_size,
+    max_bytes=settings.dataset_cache_max_mb * 1024 * 1024,
+)
+
+
+def resolve_dataset_path(dataset) -> Path:
+    """Location of a dataset's file on disk (legacy rows only have the filename)."""
+    if dataset.file_path:
+        return Path(dataset.file_path)
+    return Path(settings.upload_dir) / dataset.original_filename
+
+
+def parquet_sidecar_path(file_path: Union[str, Path]) -> Path:
+    """Return the Parquet sidecar path for an uploaded dataset file."""
+    return Path(file_path).with_suffix(".parquet")
+
+
+def parse_dataset_file(file_path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Parse an uploaded CSV/JSON file into a DataFrame.
+
+    Args:
+        file_path: Path to the .csv or .json file
+
+    Returns:
+        Parsed DataFrame
+
+    Raises:
+        ValueError: If the file extension is not supported
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+
+    if suffix == ".csv":
+        return _read_csv(file_path)
+    elif suffix == ".json":
+        return _read_json(file_path)
+    else:
+        raise ValueError("Unsupported file format")
+
+
+def _read_csv(file_path: Path) -> pd.DataFrame:
+    """
+    Read a CSV, using pyarrow's multithreaded reader when enabled.
+
+    The Arrow table is converted with `self_destruct`, so its buffers are
+    released column by column instead of the table and the DataFrame both
+    being held in full at the peak.
+    """
+    if settings.fast_csv and PYARROW_CSV_AVAILABLE:
+        try:
+            table = pa_csv.read_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=_pandas_compatible_types(file_path),
+                    # pandas reads empty string cells as missing too
+                    strings_can_be_null=True
+                )
+            )
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        except Exception as e:
+            # The pyarrow engine is stricter about ragged/malformed rows
+            logger.warning(f"pyarrow CSV engine failed for {file_path}, using C engine: {e}")
+    return pd.read_csv(file_path)
+
+
+def _pandas_compatible_types(file_path: Path) -> Dict[str, "pa.DataType"]:
+    """
+    Column type overrides that make pyarrow type a CSV like pd.read_csv does.
+
+    pyarrow turns ISO dates, times and timestamps into temporal values and
+    all-empty columns into nulls, where pandas keeps strings and float NaN.
+    The overrides come from pyarrow's inference on the first block alone.
+    """
+    reader = pa_csv.open_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(block_size=CSV_SCHEMA_PEEK_SIZE)
+    )
+    try:
+        schema = reader.schema
+    finally:
+        reader.close()
+    overrides = {}
+    for field in schema:
+        if pa.types.is_temporal(field.type):
+            overrides[field.name] = pa.string()
+        elif pa.types.is_null(field.type):
+            overrides[field.name] = pa.float64()
+    return overrides
+
+
+def _read_json(file_path: Path) -> pd.DataFrame:
+    """
+    Read a JSON array of records, a single object, or JSON Lines.
+
+    Small files are parsed in one go with orjson. Large record arrays and
+    JSON Lines files are streamed and turned into DataFrames a batch at a
+    time, so the full tree of Python dicts never exists at once.
+    """
+    with open(file_path, "rb") as f:
+        first_line = f.readline()
+        is_json_lines = _is_json_lines(first_line, f)
+
+    if is_json_lines:
+        return _frame_from_record_batches(_iter_json_lines(file_path))
+
+    if IJSON_AVAILABLE and file_path.stat().st_size > JSON_STREAM_THRESHOLD_BYTES:
+        with open(file_path, "rb") as f:
+            if f.read(1024).lstrip()[:1] == b"[":
+                f.seek(0)
+                return _frame_from_record_batches(ijson.items(f, "item", use_float=True))
+
+    # orjson parses straight from bytes (no str decode) and is several
+    # times faster than the stdlib parser on large record arrays.
+    data = orjson.loads(file_path.read_bytes())
+    return pd.DataFrame.from_records(data if isinstance(data, list) else [data])
+
+
+def _is_json_lines(first_line: bytes, rest: BinaryIO) -> bool:
+    """Whether a file is JSON Lines: a complete object on line 1, then more."""
+    if not first_line.lstrip().startswith(b"{"):
+        return False
+    try:
+        orjson.loads(first_line)
+    except orjson.JSONDecodeError:
+        # Line 1 is only part of a (pretty-printed) document
+        return False
+    return any(line.strip() for line in rest)
+
+
+def _iter_json_lines(file_path: Path) -> Iterator[dict]:
+    """Yield one record per non-blank line of a JSON Lines file."""
+    with open(file_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def _frame_from_record_batches(records: Iterable[dict]) -> pd.DataFrame:
+    """Build a DataFrame from a record stream, JSON_BATCH_SIZE rows at a time."""
+    records = iter(records)
+    chunks = []
+    while batch := list(islice(records, JSON_BATCH_SIZE)):
+        chunks.append(pd.DataFrame.from_records(batch))
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+
+def write_parquet_sidecar(df: pd.DataFrame, file_path: Union[str, Path]) -> Optional[Path]:
+    """
+    Persist a parsed dataset as a Parquet sidecar next to its source file.
+
+    Best effort: frames that Arrow cannot represent (e.g. object columns with
+    mixed types) are skipped and readers fall back to the source file.
+
+    Args:
+        df: Parsed dataset
+        file_path: Path of the original uploaded file
+
+    Returns:
+        Sidecar path, or None if it could not be written
+    """
+    sidecar = parquet_sidecar_path(file_path)
+    try:
+        df.to_parquet(sidecar, engine="pyarrow", compression="zstd", index=False)
+        return sidecar
+    except Exception as e:
+        logger.warning(f"Could not write Parquet sidecar for {file_path}: {e}")
+        if sidecar.exists():
+            sidecar.unlink()
+        return None
+
+
+def read_dataset_file(
+    file_path: Union[str, Path],
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Load a dataset, preferring its Parquet sidecar over the original file.
+
+    Results are memoized per (path, mtime, size, columns), so repeated loads
+    of an unchanged file are served from memory (see DATASET_CACHE_SIZE and
+    DATASET_CACHE_MAX_MB). Each call returns a shallow copy that shares its
+    data with the cache: adding, replacing or dropping columns only affects
+    the caller's frame, but values must not be modified in place (`.loc` /
+    `.iloc` assignment, `inplace=True`).
+
+    Args:
+        file_path: Path of the original uploaded file
+        columns: Optional column projection; names not in the file are skipped
+
+    Returns:
+        Loaded DataFrame
+
+    Raises:
+        FileNotFoundError: If the source file does not exist
+        ValueError: If the file extension is not supported
+    """
+    file_path = Path(file_path)
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Dataset file not found: {file_path}")
+
+    projection = tuple(columns) if columns is not None else None
+    key = (str(file_path), stat.st_mtime_ns, stat.st_size, projection)
+
+    df = _frame_cache.get(key)
+    if df is None:
+        df = _load_dataset_file(file_path, stat.st_mtime_ns, projection)
+        _frame_cache.put(key, df)
+    return df.copy(deep=False)
+
+
+def _load_dataset_file(
+    file_path: Path,
+    mtime_ns: int,
+    columns: Optional[Tuple[str, ...]]
+) -> pd.DataFrame:
+    """
+    Uncached load behind `read_dataset_file`.
+
+    The sidecar is only trusted when it is at least as new as the source
+    file. If it is missing or stale, the source is parsed and a new sidecar
+    is written for next time.
+    """
+    sidecar = parquet_sidecar_path(file_path)
+    projection = list(columns) if columns is not None else None
+
+    try:
+        if sidecar.stat().st_mtime_ns >= mtime_ns:
+            if projection is not None:
+                import pyarrow.parquet as pq
+
+                present = set(pq.read_schema(sidecar).names)
+                projection = [c for c in projection if c in present]
+            else:
+                _prefetch(sidecar)
+            return pd.read_parquet(sidecar, columns=projection)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable Parquet sidecar {sidecar}: {e}")
+
+    _prefetch(file_path)
+    df = parse_dataset_file(file_path)
+    write_parquet_sidecar(df, file_path)
+
+    if projection is not None:
+        return df[[c for c in projection if c in df.columns]]
+    return df
+
+
+def _prefetch(file_path: Path) -> None:
+    """
+    Ask the kernel to start reading a whole file into the page cache.
+
+    Called right before a full sequential read: on a cold cache the disk
+    reads then run ahead of (and alongside) parsing instead of being issued
+    one readahead window at a time. A no-op where posix_fadvise is missing.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def iter_dataset_chunks(
+    file_path: Union[str, Path],
+    chunksize: int = 200_000
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a dataset as DataFrame chunks without loading it whole.
+
+    Reads record batches from a fresh Parquet sidecar when there is one,
+    otherwise streams the CSV (typed like a whole-file read, see
+    `_iter_csv_chunks`). JSON has no cheap chunked reader, so it is parsed
+    once and sliced.
+
+    Args:
+        file_path: Path of the original uploaded file
+        chunksize: Rows per chunk
+
+    Raises:
+        FileNotFoundError: If the source file does not exist
+        ValueError: If the file extension is not supported
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"Dataset file not found: {file_path}")
+
+    sidecar = parquet_sidecar_path(file_path)
+    if sidecar.exists() and sidecar.stat().st_mtime_ns >= file_path.stat().st_mtime_ns:
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(sidecar).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+        return
+
+    if file_path.suffix.lower() == ".csv":
+        yield from _iter_csv_chunks(file_path, chunksize)
+        return
+
+    df = parse_dataset_file(file_path)
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize]
+
+
+def _iter_csv_chunks(file_path: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV as DataFrame chunks of `chunksize` rows.
+
+    Uses pyarrow's streaming reader with the same `_pandas_compatible_types`
+    overrides as `_read_csv`, so chunks are typed like a whole-file read.
+    pyarrow fixes column types from the first block; if a later block
+    doesn't fit them (or a row is malformed), the rest of the file is read
+    with the pandas C engine, starting after the rows already yielded.
+
+    Chunks are converted to NumPy/object dtypes rather than
+    dtype_backend="pyarrow", like whole-file reads: the profilers
+    (select_dtypes, to_numpy(dtype=float)) and sampling rely on them, and a
+    chunk is bounded in size anyway.
+    """
+    rows_read = 0
+    if settings.fast_csv and PYARROW_CSV_AVAILABLE:
+        try:
+            reader = pa_csv.open_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=_pandas_compatible_types(file_path),
+                    strings_can_be_null=True
+                )
+            )
+            pending: List["pa.RecordBatch"] = []
+            pending_rows = 0
+            for batch in reader:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                while pending_rows >= chunksize:
+                    table = pa.Table.from_batches(pending, schema=reader.schema)
+                    yield table.slice(0, chunksize).to_pandas()
+                    rows_read += chunksize
+                    rest = table.slice(chunksize)
+                    pending, pending_rows = rest.to_batches(), rest.num_rows
+            if pending_rows:
+                yield pa.Table.from_batches(pending, schema=reader.schema).to_pandas()
+            return
+        except pa.ArrowInvalid as e:
+            logger.warning(
+                f"pyarrow CSV engine failed for {file_path} after {rows_read} rows, "
+                f"using C engine for the rest: {e}"
+            )
+
+    with pd.read_csv(file_path, chunksize=chunksize) as reader:
+        for chunk in reader:
+            # Skipped by record rather than with skiprows, which counts lines
+            if rows_read >= len(chunk):
+                rows_read -= len(chunk)
+                continue
+            yield chunk.iloc[rows_read:]
+            rows_read = 0
+
+
+def sample_dataset_file(
+    file_path: Union[str, Path],
+    max_rows: int,
+    seed: int = 0
+) -> pd.DataFrame:
+    """
+    Load a uniform random sample of at most `max_rows` rows of a dataset.
+
+    The file is streamed with `iter_dataset_chunks`, so peak memory is the
+    sample plus one chunk however large the file is. Every row gets a random
+    key and the `max_rows` smallest keys are kept ("bottom-k" sampling),
+    which needs no row count up front. The same seed always picks the same
+    rows, and results are memoized like `read_dataset_file`.
+
+    Args:
+        file_path: Path of the original uploaded file
+        max_rows: Sample size; smaller datasets come back whole
+        seed: Random seed
+
+    Returns:
+        Sampled DataFrame, rows in file order
+
+    Raises:
+        FileNotFoundError: If the source file does not exist
+        ValueError: If the file extension is not supported
+    """
+    file_path = Path(file_path)
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Dataset file not found: {file_path}")
+
+    key = (str(file_path), stat.st_mtime_ns, stat.st_size, ("__sample__", max_rows, seed))
+    df = _frame_cache.get(key)
+    if df is None:
+        rng = np.random.default_rng(seed)
+        sample, sample_keys = None, None
+        for chunk in iter_dataset_chunks(file_path):
+            chunk_keys = rng.random(len(chunk))
+            if sample is None:
+                sample, sample_keys = chunk, chunk_keys
+            else:
+                sample = pd.concat([sample, chunk], ignore_index=True)
+                sample_keys = np.concatenate([sample_keys, chunk_keys])
+            if len(sample) > max_rows:
+                keep = np.sort(np.argpartition(sample_keys, max_rows)[:max_rows])
+                sample = sample.iloc[keep].reset_index(drop=True)
+                sample_keys = sample_keys[keep]
+        df = sample if sample is not None else pd.DataFrame()
+        _frame_cache.put(key, df)
+    return df.copy(deep=False)
@@ -31,7 +31,7 @@ class Dataset(SQLModel, table=True):
     # Renamed from 'schema_json' to 'schema_data' to avoid SQLModel reserved word warning
     schema_data: dict = Field(default_factory=dict, sa_column=Column(JSONType))
     status: str = Field(default="uploaded")
-    checksum: str
+    checksum: str = Field(index=True)  # SHA-256 of file content (used to reuse profiling/PII results)
     # Store PII detection results (full dictionary with confidence, types, recommendations)
     pii_flags: Optional[dict] = Field(default=None, sa_column=Column(JSONType))
     # Store comprehensive profiling results (statistics, distributions, correlations)
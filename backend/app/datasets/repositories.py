@@ -5,9 +5,10 @@ import datetime
 import logging
 import uuid
 from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 # Third-party
-from sqlmodel import Session
+from sqlmodel import Session, select, update
 
 # Internal
 from .models import Dataset, DatasetFile
@@ -22,6 +23,50 @@ def get_dataset_by_id(db: Session, dataset_id: str):
     return db.get(Dataset, uuid.UUID(dataset_id))
 
 
+def list_datasets_by_ids(db: Session, dataset_ids: Iterable[str]) -> Dict[str, Dataset]:
+    """Fetch several datasets in one query, keyed by their string ID (None IDs are skipped)."""
+    ds_uuids = {uuid.UUID(str(d)) for d in dataset_ids if d is not None}
+    if not ds_uuids:
+        return {}
+    datasets = db.exec(select(Dataset).where(Dataset.id.in_(ds_uuids))).all()
+    return {str(d.id): d for d in datasets}
+
+
+def get_dataset_with_same_content(db: Session, dataset: Dataset, field: str) -> Optional[Tuple[uuid.UUID, Any]]:
+    """
+    Find another dataset with identical file content that already has `field`.
+
+    Profiling and PII results are pure functions of the file bytes, so a
+    dataset with the same checksum can donate its results.
+
+    Returns:
+        (donor dataset ID, its `field` value), or None
+    """
+    column = getattr(Dataset, field)
+    statement = select(Dataset.id, column).where(
+        Dataset.checksum == dataset.checksum,
+        Dataset.id != dataset.id,
+        column.isnot(None),
+    )
+    # Only the ID and the one column are loaded. JSON columns may also hold
+    # JSON 'null' (or an empty object), so stop at the first truthy value
+    for donor_id, value in db.exec(statement):
+        if value:
+            return donor_id, value
+    return None
+
+
+def update_dataset_fields(db: Session, dataset_id: uuid.UUID, **values):
+    """
+    Set a few columns on a dataset with a single targeted UPDATE and commit.
+
+    Used for large analysis results (profile, PII flags): nothing is
+    re-selected afterwards, since callers already hold the values.
+    """
+    db.exec(update(Dataset).where(Dataset.id == dataset_id).values(**values))
+    db.commit()
+
+
 def create_dataset(db: Session, dataset: Dataset):
     db.add(dataset)
     db.commit()
@@ -29,6 +74,19 @@ def create_dataset(db: Session, dataset: Dataset):
     return dataset
 
 
+def create_dataset_with_file(db: Session, dataset: Dataset, dataset_file: DatasetFile):
+    """Create a dataset and its file record in one transaction (one commit)."""
+    # The models define no relationship(), so the unit of work won't order
+    # the INSERTs by foreign key. Flush the dataset first; the flush stays
+    # inside the same transaction, so there is still a single commit.
+    db.add(dataset)
+    db.flush()
+    db.add(dataset_file)
+    db.commit()
+    db.refresh(dataset)
+    return dataset
+
+
 def delete_dataset(db: Session, dataset_id: str):
     """Delete a dataset (hard delete - removes file and database record)."""
     
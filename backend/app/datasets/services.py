@@ -1,24 +1,85 @@
 """Business logic for datasets."""
 
 # Standard library
-import json
+import gc
 import logging
+import re
 import uuid
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
 # Third-party
+import numpy as np
 import pandas as pd
 from sqlmodel import Session
 
 # Internal
+from app.core.config import settings
 from app.core.utils import calculate_checksum
-from app.services.profiling import profile_dataset
+from app.services.profiling import profile_dataset, profile_dataset_chunks
+from .loaders import (
+    iter_dataset_chunks,
+    parse_dataset_file,
+    read_dataset_file,
+    write_parquet_sidecar,
+)
 from .models import Dataset, DatasetFile
-from .repositories import create_dataset, get_dataset_by_id, get_datasets
+from .repositories import (
+    create_dataset_with_file,
+    get_dataset_by_id,
+    get_dataset_with_same_content,
+    get_datasets,
+    update_dataset_fields,
+)
 
 logger = logging.getLogger(__name__)
 
+# Polars evaluates the PII regexes for all columns in parallel in one scan
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+    logger.warning("Polars not available, PII pattern scan will use pandas")
+
+# Cheap prefilter for date-like strings (ISO / year-first, day-month-year,
+# "5 Jan 2020", "Jan 5, 2020"); only columns that pass it are handed to
+# pd.to_datetime, whose format inference is expensive.
+_DATE_PREFIX_RE = re.compile(
+    r"^\s*(?:"
+    r"\d{4}[-/.]\d{1,2}[-/.]\d{1,2}"
+    r"|\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4}"
+    r"|\d{1,2}\s+[A-Za-z]{3,9}\.?,?\s+\d{2,4}"
+    r"|[A-Za-z]{3,9}\.?\s+\d{1,2},?\s+\d{2,4}"
+    r")"
+)
+
+# Column names containing any of these keywords are flagged as potential PII
+_SENSITIVE_COLUMN_RE = re.compile(r"email|phone|ssn|name|address|social")
+
+# Candidate hits checked against a PII type's validator before giving up
+_PII_VALIDATION_CANDIDATES = 100
+
+
+def _luhn_valid(value: str) -> bool:
+    """Whether the digits of a card-number match pass the Luhn checksum."""
+    digits = [int(ch) for ch in value if ch.isdigit()]
+    checksum = 0
+    for i, digit in enumerate(reversed(digits)):
+        if i % 2 == 1:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        checksum += digit
+    return len(digits) >= 13 and checksum % 10 == 0
+
+
+# Extra checks a regex hit must pass to count, keyed by PII type
+_PII_VALIDATORS = {
+    "credit_card": _luhn_valid,
+}
+
 
 async def process_uploaded_file(
     file_path: Path,
@@ -42,47 +103,22 @@ async def process_uploaded_file(
     """
 
     # Read file and detect schema
-    if filename.endswith('.csv'):
-        df = pd.read_csv(file_path)
-    elif filename.endswith('.json'):
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            df = pd.DataFrame(data)
-        else:
-            df = pd.DataFrame([data])
-    else:
+    if not filename.endswith(('.csv', '.json')):
         raise ValueError("Unsupported file format")
+    df = parse_dataset_file(file_path)
+
+    # Cache the parsed frame as Parquet so later reads skip re-parsing
+    write_parquet_sidecar(df, file_path)
 
     # Calculate checksum
     checksum = calculate_checksum(file_path)
 
     # Basic schema detection
     schema = {}
-    for col in df.columns:
-        dtype = str(df[col].dtype)
-        if dtype == 'object':
-            # Check if looks like date by sampling values
-            sample = df[col].dropna().head(5)
-            if len(sample) > 0:
-                try:
-                    # Try parsing with infer_datetime_format disabled to avoid warnings
-                    parsed = pd.to_datetime(sample, errors='coerce', format='mixed')
-                    # If most values parsed successfully, it's likely a date
-                    if parsed.notna().sum() >= len(sample) * 0.8:
-                        schema[col] = 'datetime'
-                    else:
-                        schema[col] = 'string'
-                except Exception:
-                    schema[col] = 'string'
-            else:
-                schema[col] = 'string'
-        elif 'int' in dtype:
-            schema[col] = 'integer'
-        elif 'float' in dtype:
-            schema[col] = 'float'
-        else:
-            schema[col] = dtype
+    for col, dtype in df.dtypes.items():
+        schema[col] = _detect_column_type(df[col], dtype)
+
+    size_bytes = file_path.stat().st_size
 
     # Create dataset record
     # IMPORTANT: Store unique_filename so we can find the file later!
@@ -92,7 +128,7 @@ async def process_uploaded_file(
         original_filename=unique_filename,  # Store the UUID-prefixed filename
         file_path=str(file_path),  # Store full path
         s3_key=s3_key,  # Store S3 key if uploaded to S3
-        size_bytes=file_path.stat().st_size,
+        size_bytes=size_bytes,
         row_count=len(df),
         column_count=len(df.columns),  # Store column count directly
         schema_data=schema,
@@ -100,24 +136,79 @@ async def process_uploaded_file(
         uploader_id=uploader_id  # Set owner
     )
 
-    # Save to DB
-    db_dataset = create_dataset(db, dataset)
-
-    # Create dataset file record
+    # Create dataset file record (the dataset id is assigned client-side)
     dataset_file = DatasetFile(
-        dataset_id=db_dataset.id,
+        dataset_id=dataset.id,
         uploader_id=uploader_id,
         file_path=str(file_path),
-        size_bytes=file_path.stat().st_size,
+        size_bytes=size_bytes,
         checksum=checksum
     )
 
-    db.add(dataset_file)
-    db.commit()
+    # Save both rows in a single transaction
+    db_dataset = create_dataset_with_file(db, dataset, dataset_file)
 
     return db_dataset
 
 
+# Schema type per dtype check, tried in order. Each check inspects only the
+# dtype object (nullable Int64/Float32/boolean and pyarrow dtypes included).
+_SCHEMA_DTYPE_CHECKS = (
+    (pd.api.types.is_bool_dtype, 'boolean'),
+    (pd.api.types.is_integer_dtype, 'integer'),
+    (pd.api.types.is_float_dtype, 'float'),
+    (pd.api.types.is_datetime64_any_dtype, 'datetime'),
+)
+
+
+def _detect_column_type(values: pd.Series, dtype) -> str:
+    """
+    Map a column to its schema type.
+    
+    Args:
+        values: Column values (only sampled for string columns)
+        dtype: The column's dtype
+        
+    Returns:
+        Schema type name; unrecognised dtypes keep their dtype name
+    """
+    for check, schema_type in _SCHEMA_DTYPE_CHECKS:
+        if check(dtype):
+            return schema_type
+    
+    if pd.api.types.is_string_dtype(dtype):
+        # Check if looks like date by sampling values
+        sample = values.dropna().head(20).astype(str)
+        return 'datetime' if _looks_like_dates(sample) else 'string'
+    
+    return str(dtype)
+
+
+def _looks_like_dates(sample: pd.Series) -> bool:
+    """
+    Decide whether a sample of string values holds dates.
+    
+    Args:
+        sample: Non-null values, already converted to str
+        
+    Returns:
+        True if most values parse as dates
+    """
+    if len(sample) == 0:
+        return False
+    
+    # Reject obvious non-dates without touching the datetime parser
+    if sample.str.match(_DATE_PREFIX_RE).mean() <= 0.5:
+        return False
+    
+    try:
+        parsed = pd.to_datetime(sample, errors='coerce', format='mixed')
+    except (ValueError, TypeError, OverflowError):
+        return False
+    # If most values parsed successfully, it's likely a date
+    return parsed.notna().sum() >= len(sample) * 0.8
+
+
 def get_all_datasets(db: Session):
     """Get all datasets for current user."""
     return get_datasets(db)
@@ -145,22 +236,31 @@ def profile_uploaded_dataset(dataset_id: str, db: Session) -> Dict[str, Any]:
     if not file_path.exists():
         raise FileNotFoundError(f"Dataset file not found: {file_path}")
     
-    # Load data based on file type
-    if dataset.original_filename.endswith('.csv'):
-        df = pd.read_csv(file_path)
-    elif dataset.original_filename.endswith('.json'):
-        df = pd.read_json(file_path)
-    else:
-        raise ValueError("Unsupported file format")
-    
-    # Generate profile
+    # Generate profile. Identical content that was already profiled is
+    # reused; files above the threshold are profiled chunk by chunk so
+    # memory stays bounded; smaller ones are loaded whole (from the Parquet
+    # sidecar when available).
     logger.info(f"Profiling dataset {dataset_id}")
-    profiling_results = profile_dataset(df)
+    same_content = get_dataset_with_same_content(db, dataset, "profiling_data")
+    if same_content:
+        donor_id, profiling_results = same_content
+        logger.info(f"✓ Reusing profile of dataset {donor_id} (same checksum)")
+        # Stamped as profiled now, for this dataset, rather than when the donor was
+        profiling_results = {**profiling_results, "profiling_timestamp": datetime.utcnow().isoformat()}
+    elif file_path.stat().st_size > settings.profile_chunk_threshold_mb * 1024 * 1024:
+        profiling_results = profile_dataset_chunks(iter_dataset_chunks(file_path))
+    else:
+        df = read_dataset_file(file_path)
+        try:
+            profiling_results = profile_dataset(df)
+        finally:
+            # Free the frame and the profiler's intermediates now rather than
+            # whenever the generational GC next reaches them
+            del df
+            gc.collect()
     
     # Store profiling results in dataset
-    dataset.profiling_data = profiling_results
-    db.commit()
-    db.refresh(dataset)
+    update_dataset_fields(db, dataset.id, profiling_data=profiling_results)
     
     return profiling_results
 
@@ -187,26 +287,27 @@ def detect_dataset_pii(dataset_id: str, db: Session) -> Dict[str, Any]:
     if not file_path.exists():
         raise FileNotFoundError(f"Dataset file not found: {file_path}")
     
-    # Load data based on file type
-    if dataset.original_filename.endswith('.csv'):
-        df = pd.read_csv(file_path)
-    elif dataset.original_filename.endswith('.json'):
-        df = pd.read_json(file_path)
-    else:
-        raise ValueError("Unsupported file format")
-    
-    # Detect PII
+    # Detect PII (reusing results for identical content when available)
     logger.info(f"Detecting PII in dataset {dataset_id}")
-    pii_results = detect_pii(df)
-    recommendations = get_pii_recommendations(df)
-    
-    # Add recommendations to results
-    pii_results["recommendations"] = recommendations
+    same_content = get_dataset_with_same_content(db, dataset, "pii_flags")
+    if same_content:
+        donor_id, pii_results = same_content
+        logger.info(f"✓ Reusing PII flags of dataset {donor_id} (same checksum)")
+    else:
+        # Load data (from the Parquet sidecar when available)
+        df = read_dataset_file(file_path)
+        try:
+            pii_results = detect_pii(df)
+            recommendations = get_pii_recommendations(df)
+        finally:
+            del df
+            gc.collect()
+        
+        # Add recommendations to results
+        pii_results["recommendations"] = recommendations
     
     # Store PII flags in dataset
-    dataset.pii_flags = pii_results
-    db.commit()
-    db.refresh(dataset)
+    update_dataset_fields(db, dataset.id, pii_flags=pii_results)
     
     return pii_results
 
@@ -217,9 +318,6 @@ def detect_pii(df: pd.DataFrame) -> Dict[str, Any]:
     Compatibility wrapper for old PII detection API.
     Now uses basic pattern matching since enhanced detector requires async context.
     """
-    import re
-    from typing import Dict, List, Any
-
     results = {
         "columns": {},
         "summary": {
@@ -237,7 +335,9 @@ def detect_pii(df: pd.DataFrame) -> Dict[str, Any]:
         "credit_card": r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',
     }
 
-    for col in df.columns:
+    pattern_matches = _match_pii_patterns(df, patterns)
+
+    for col, col_matches in zip(df.columns, pattern_matches):
         col_results = {
             "pii_detected": False,
             "pii_types": [],
@@ -245,22 +345,17 @@ def detect_pii(df: pd.DataFrame) -> Dict[str, Any]:
             "sample_matches": []
         }
 
-        col_str = df[col].astype(str)
-
-        for pii_type, pattern in patterns.items():
-            matches = col_str.str.contains(pattern, regex=True, na=False)
-            if matches.any():
+        for pii_type in patterns:
+            sample_matches = col_matches[pii_type]
+            if sample_matches:
                 col_results["pii_detected"] = True
                 col_results["pii_types"].append(pii_type)
                 col_results["confidence"] = min(1.0, col_results["confidence"] + 0.8)
-                # Get sample matches (up to 3)
-                sample_matches = col_str[matches].head(3).tolist()
+                # Sample matches (up to 3)
                 col_results["sample_matches"].extend(sample_matches)
 
         # Check column name for sensitive keywords
-        col_lower = col.lower()
-        sensitive_keywords = ["email", "phone", "ssn", "name", "address", "social"]
-        if any(keyword in col_lower for keyword in sensitive_keywords):
+        if _SENSITIVE_COLUMN_RE.search(str(col).lower()) is not None:
             if not col_results["pii_detected"]:
                 col_results["pii_detected"] = True
                 col_results["pii_types"].append("potential_pii")
@@ -275,6 +370,122 @@ def detect_pii(df: pd.DataFrame) -> Dict[str, Any]:
     return results
 
 
+def _match_pii_patterns(
+    df: pd.DataFrame,
+    patterns: Dict[str, str]
+) -> List[Dict[str, List[str]]]:
+    """
+    Run every PII pattern against every column.
+    
+    All patterns are first combined into one alternation, so a column is
+    scanned once for "any PII at all"; only columns with a hit are scanned
+    again per pattern to attribute the type. Most columns hold no PII, so
+    this is one pass instead of one per pattern. Hits of types listed in
+    `_PII_VALIDATORS` (e.g. Luhn for card numbers) must also pass their
+    validator.
+    
+    Args:
+        df: DataFrame to scan
+        patterns: Mapping of PII type to regex
+        
+    Returns:
+        One dict per column (in column order) mapping each PII type to up to
+        3 matching values; an empty list means no match.
+    """
+    if POLARS_AVAILABLE and len(df.columns) > 0:
+        try:
+            return _match_pii_patterns_polars(df, patterns)
+        except Exception as e:
+            logger.warning(f"Polars PII scan failed, falling back to pandas: {e}")
+    
+    any_pattern = "|".join(f"(?:{pattern})" for pattern in patterns.values())
+    results = []
+    for col_idx in range(len(df.columns)):
+        col_str = df.iloc[:, col_idx].astype(str)
+        col_matches = {pii_type: [] for pii_type in patterns}
+        if col_str.str.contains(any_pattern, regex=True, na=False).any():
+            values = col_str.to_numpy()
+            for pii_type, pattern in patterns.items():
+                matches = col_str.str.contains(pattern, regex=True, na=False)
+                # Take hits by position instead of building the full filtered
+                # Series just to slice it
+                limit = _PII_VALIDATION_CANDIDATES if pii_type in _PII_VALIDATORS else 3
+                candidates = values[np.flatnonzero(matches.to_numpy())[:limit]].tolist()
+                col_matches[pii_type] = _validate_pii_matches(pii_type, pattern, candidates)
+        results.append(col_matches)
+    return results
+
+
+def _match_pii_patterns_polars(
+    df: pd.DataFrame,
+    patterns: Dict[str, str]
+) -> List[Dict[str, List[str]]]:
+    """
+    Polars implementation of `_match_pii_patterns`.
+    
+    Columns are renamed positionally so duplicate or non-string pandas labels
+    are safe, and each phase collects all of its expressions in a single
+    query that polars runs across its thread pool (its regex engine is a
+    linear-time automaton, so the combined alternation costs one pass).
+    """
+    # Stringify via pandas so matching sees exactly what astype(str) produces
+    frame = pl.DataFrame([
+        pl.Series(f"c{i}", df.iloc[:, i].astype(str).tolist(), dtype=pl.String)
+        for i in range(len(df.columns))
+    ]).lazy()
+    
+    # Phase 1: which columns contain any PII at all
+    any_pattern = "|".join(f"(?:{pattern})" for pattern in patterns.values())
+    has_hit = frame.select([
+        pl.col(f"c{i}").str.contains(any_pattern).any()
+        for i in range(len(df.columns))
+    ]).collect().row(0)
+    hit_cols = [i for i, hit in enumerate(has_hit) if hit]
+    
+    results = [{pii_type: [] for pii_type in patterns} for _ in df.columns]
+    if not hit_cols:
+        return results
+    
+    # Phase 2: attribute PII types within the columns that hit
+    exprs = [
+        pl.col(f"c{i}")
+        .filter(pl.col(f"c{i}").str.contains(pattern))
+        .head(_PII_VALIDATION_CANDIDATES if pii_type in _PII_VALIDATORS else 3)
+        .implode()
+        .alias(f"c{i}:{pii_type}")
+        for i in hit_cols
+        for pii_type, pattern in patterns.items()
+    ]
+    row = frame.select(exprs).collect().row(0, named=True)
+    
+    for i in hit_cols:
+        for pii_type, pattern in patterns.items():
+            results[i][pii_type] = _validate_pii_matches(
+                pii_type, pattern, row[f"c{i}:{pii_type}"]
+            )
+    return results
+
+
+def _validate_pii_matches(
+    pii_type: str,
+    pattern: str,
+    candidates: List[str]
+) -> List[str]:
+    """Keep up to 3 candidate values whose match passes the type's validator."""
+    validator = _PII_VALIDATORS.get(pii_type)
+    if validator is None:
+        return candidates[:3]
+    
+    regex = re.compile(pattern)
+    valid = []
+    for value in candidates:
+        if any(validator(m.group(0)) for m in regex.finditer(value)):
+            valid.append(value)
+            if len(valid) == 3:
+                break
+    return valid
+
+
 def get_pii_recommendations(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """
     Compatibility wrapper for PII redaction recommendations.
@@ -7,19 +7,22 @@ models trained on real data.
 
 # Standard library
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple
 
 # Third-party
 import pandas as pd
 import numpy as np
+from sklearn import config_context
 from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingClassifier, HistGradientBoostingRegressor
 from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.metrics import (
     accuracy_score, precision_score, recall_score, f1_score,
     mean_squared_error, mean_absolute_error, r2_score
 )
-from sklearn.preprocessing import LabelEncoder
+from threadpoolctl import threadpool_limits
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +57,16 @@ class MLUtilityEvaluator:
         self.synthetic_data = synthetic_data
         self.target_column = target_column
         
+        # Category dictionaries shared by the real and synthetic frames so a
+        # given level gets the same integer code in both (built lazily)
+        self._category_dtypes: Optional[Dict[str, pd.CategoricalDtype]] = None
+        self._native_categoricals: set = set()
+        
+        # Prepared (X_train, X_test, y_train, y_test) splits, shared by all
+        # train_on_* methods (built lazily)
+        self._real_split: Optional[tuple] = None
+        self._synth_split: Optional[tuple] = None
+        
         # Determine task type
         if task_type == 'auto':
             self.task_type = self._detect_task_type()
@@ -74,6 +87,133 @@ class MLUtilityEvaluator:
         
         return 'classification'
     
+    def _get_category_dtypes(self) -> Dict[str, pd.CategoricalDtype]:
+        """
+        Build one sorted category dictionary per categorical column.
+        
+        Levels are taken from the real and synthetic frames together, so
+        encodings line up between models trained on one and tested on the
+        other. A column numeric in both frames (e.g. an int target that the
+        generator wrote back as float) is compared as float64, so 1 and 1.0
+        are one level; anything else is compared as strings.
+        
+        Returns:
+            Mapping of column name to CategoricalDtype
+        """
+        if self._category_dtypes is None:
+            columns = [
+                col for col in self.real_data.columns
+                if col in self.synthetic_data.columns and (
+                    col == self.target_column
+                    or not pd.api.types.is_numeric_dtype(self.real_data[col])
+                    or not pd.api.types.is_numeric_dtype(self.synthetic_data[col])
+                )
+            ]
+            self._category_dtypes = {}
+            for col in columns:
+                numeric = (
+                    pd.api.types.is_numeric_dtype(self.real_data[col])
+                    and pd.api.types.is_numeric_dtype(self.synthetic_data[col])
+                )
+                levels = pd.concat([
+                    self._category_values(self.real_data[col], numeric),
+                    self._category_values(self.synthetic_data[col], numeric)
+                ]).dropna().unique()
+                self._category_dtypes[col] = pd.CategoricalDtype(np.sort(levels))
+            # Features that are code-encoded in both frames and fit in the
+            # model's bins can be treated as native categoricals
+            self._native_categoricals = {
+                col for col, dtype in self._category_dtypes.items()
+                if col != self.target_column
+                and len(dtype.categories) <= 255
+                and self._is_categorical(self.real_data[col])
+                and self._is_categorical(self.synthetic_data[col])
+            }
+        return self._category_dtypes
+    
+    @staticmethod
+    def _is_categorical(values: pd.Series) -> bool:
+        """Whether `_prepare_data` encodes this column to category codes."""
+        return (
+            pd.api.types.is_object_dtype(values)
+            or isinstance(values.dtype, pd.CategoricalDtype)
+        )
+    
+    @staticmethod
+    def _category_values(values: pd.Series, numeric: bool) -> pd.Series:
+        """Values as category levels are built from: float64 if numeric, else strings."""
+        if numeric:
+            return pd.Series(
+                values.to_numpy(dtype=np.float64, na_value=np.nan),
+                index=values.index,
+                name=values.name
+            )
+        return values.astype(str)
+    
+    @classmethod
+    def _encode_categorical(
+        cls,
+        values: pd.Series,
+        dtype: Optional[pd.CategoricalDtype]
+    ) -> pd.Series:
+        """Map values to integer codes with pandas' C factorization."""
+        if dtype is None:
+            # Column only exists in one of the frames; factorize on its own
+            numeric = pd.api.types.is_numeric_dtype(values)
+            dtype = pd.CategoricalDtype(np.sort(cls._category_values(values, numeric).dropna().unique()))
+        else:
+            numeric = pd.api.types.is_numeric_dtype(dtype.categories)
+        return cls._category_values(values, numeric).astype(dtype).cat.codes.astype('int32')
+    
+    @staticmethod
+    def _as_float32(X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert features to a single float32 block.
+        
+        Missing values are left as NaN: HistGradientBoosting routes them
+        natively, so no imputation pass is needed.
+        
+        Args:
+            X: Feature frame (categoricals already encoded)
+        
+        Returns:
+            float32 frame with the same index and columns
+        """
+        try:
+            arr = X.to_numpy(dtype=np.float32, copy=True)
+        except (TypeError, ValueError):
+            # Non-numeric leftovers (e.g. datetimes) are passed through as-is
+            return X
+        return pd.DataFrame(arr, index=X.index, columns=X.columns)
+    
+    def _create_model(self, feature_columns: pd.Index):
+        """
+        Build the estimator used by every train_on_* method.
+        
+        HistGradientBoosting bins features into histograms, so split finding
+        is linear in the number of rows, and it handles NaN and categorical
+        codes natively.
+        
+        Args:
+            feature_columns: Columns the model will be fitted on
+        
+        Returns:
+            Unfitted classifier or regressor
+        """
+        self._get_category_dtypes()
+        categorical_features = [
+            col for col in feature_columns if col in self._native_categoricals
+        ]
+        params = dict(
+            categorical_features=categorical_features or None,
+            early_stopping='auto',
+            n_iter_no_change=10,
+            random_state=42
+        )
+        if self.task_type == 'classification':
+            return HistGradientBoostingClassifier(**params)
+        return HistGradientBoostingRegressor(**params)
+    
     def _prepare_data(
         self,
         data: pd.DataFrame,
@@ -89,25 +229,34 @@ class MLUtilityEvaluator:
         Returns:
             Tuple of (X_train, X_test, y_train, y_test)
         """
-        df = data.copy()
-        
-        # Separate features and target
-        y = df[self.target_column]
-        X = df.drop(columns=[self.target_column])
-        
-        # Handle categorical features
-        categorical_cols = X.select_dtypes(include=['object', 'category']).columns
-        for col in categorical_cols:
-            le = LabelEncoder()
-            X[col] = le.fit_transform(X[col].astype(str))
-        
-        # Handle missing values
-        X = X.fillna(X.mean())
-        
-        # Encode target if classification
-        if self.task_type == 'classification':
-            le = LabelEncoder()
-            y = le.fit_transform(y.astype(str))
+        # Copy-on-write (the default from pandas 3.0 on) lets the drop/select/
+        # astype intermediates below share buffers with their source until
+        # written. Scoped here rather than set globally at import time
+        with pd.option_context("mode.copy_on_write", True):
+            # Separate features and target. No defensive copy of `data`: with
+            # copy-on-write, drop() shares buffers and the encoding below
+            # assigns new columns on X without touching the caller's frame.
+            y = data[self.target_column]
+            X = data.drop(columns=[self.target_column])
+        
+            # Handle categorical features
+            category_dtypes = self._get_category_dtypes()
+            categorical_cols = X.select_dtypes(include=['object', 'category']).columns
+            if len(categorical_cols) > 0:
+                X[categorical_cols] = X[categorical_cols].apply(
+                    lambda s: self._encode_categorical(s, category_dtypes.get(s.name))
+                )
+        
+            # Missing values are handled natively by the model; just hand it one
+            # contiguous float32 block
+            X = self._as_float32(X)
+        
+            # Encode target if classification
+            if self.task_type == 'classification':
+                y = self._encode_categorical(y, category_dtypes.get(self.target_column)).to_numpy()
+            elif not np.isfinite(y.to_numpy(dtype=np.float64, na_value=np.nan)).all():
+                # Validated once here; the trainers run with assume_finite
+                raise ValueError(f"Target column '{self.target_column}' contains missing or infinite values")
         
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(
@@ -116,6 +265,20 @@ class MLUtilityEvaluator:
         
         return X_train, X_test, y_train, y_test
     
+    @property
+    def _real_splits(self) -> tuple:
+        """Prepared real-data splits (80/20), computed once per evaluator."""
+        if self._real_split is None:
+            self._real_split = self._prepare_data(self.real_data)
+        return self._real_split
+    
+    @property
+    def _synth_splits(self) -> tuple:
+        """Prepared synthetic-data splits (nearly all train), computed once."""
+        if self._synth_split is None:
+            self._synth_split = self._prepare_data(self.synthetic_data, test_size=0.01)
+        return self._synth_split
+    
     def train_on_real_test_on_real(self) -> Dict[str, Any]:
         """
         Baseline: Train on real data, test on real data.
@@ -125,13 +288,10 @@ class MLUtilityEvaluator:
         """
         logger.info("Training baseline model (real → real)...")
         
-        X_train, X_test, y_train, y_test = self._prepare_data(self.real_data)
+        X_train, X_test, y_train, y_test = self._real_splits
         
         # Train model
-        if self.task_type == 'classification':
-            model = RandomForestClassifier(n_estimators=100, random_state=42)
-        else:
-            model = RandomForestRegressor(n_estimators=100, random_state=42)
+        model = self._create_model(X_train.columns)
         
         model.fit(X_train, y_train)
         y_pred = model.predict(X_test)
@@ -155,21 +315,19 @@ class MLUtilityEvaluator:
         logger.info("Training synthetic model (synthetic → real)...")
         
         # Prepare synthetic for training
-        X_train_synth, _, y_train_synth, _ = self._prepare_data(self.synthetic_data, test_size=0.01)
+        X_train_synth, _, y_train_synth, _ = self._synth_splits
         
         # Prepare real for testing
-        _, X_test_real, _, y_test_real = self._prepare_data(self.real_data)
+        _, X_test_real, _, y_test_real = self._real_splits
         
-        # Ensure same features
-        common_features = list(set(X_train_synth.columns) & set(X_test_real.columns))
-        X_train_synth = X_train_synth[common_features]
-        X_test_real = X_test_real[common_features]
+        # Ensure same features (in a stable order; usually already identical)
+        if not X_train_synth.columns.equals(X_test_real.columns):
+            common_features = X_train_synth.columns.intersection(X_test_real.columns, sort=False)
+            X_train_synth = X_train_synth[common_features]
+            X_test_real = X_test_real[common_features]
         
         # Train model
-        if self.task_type == 'classification':
-            model = RandomForestClassifier(n_estimators=100, random_state=42)
-        else:
-            model = RandomForestRegressor(n_estimators=100, random_state=42)
+        model = self._create_model(X_train_synth.columns)
         
         model.fit(X_train_synth, y_train_synth)
         y_pred = model.predict(X_test_real)
@@ -194,35 +352,42 @@ class MLUtilityEvaluator:
         logger.info(f"Training mixed model (ratio={synthetic_ratio})...")
         
         # Prepare data
-        X_train_real, X_test_real, y_train_real, y_test_real = self._prepare_data(self.real_data)
-        X_train_synth, _, y_train_synth, _ = self._prepare_data(self.synthetic_data, test_size=0.01)
+        X_train_real, X_test_real, y_train_real, y_test_real = self._real_splits
+        X_train_synth, _, y_train_synth, _ = self._synth_splits
         
-        # Ensure same features
-        common_features = list(set(X_train_real.columns) & set(X_train_synth.columns))
-        X_train_real = X_train_real[common_features]
-        X_train_synth = X_train_synth[common_features]
-        X_test_real = X_test_real[common_features]
+        # Ensure same features (in a stable order; usually already identical)
+        if not X_train_real.columns.equals(X_train_synth.columns):
+            common_features = X_train_real.columns.intersection(X_train_synth.columns, sort=False)
+            X_train_real = X_train_real[common_features]
+            X_train_synth = X_train_synth[common_features]
+            X_test_real = X_test_real[common_features]
         
         # Mix data
         n_synth = int(len(X_train_real) * synthetic_ratio / (1 - synthetic_ratio))
         if n_synth > len(X_train_synth):
             n_synth = len(X_train_synth)
         
-        # Sample synthetic data (FIXED: add seed for reproducibility)
-        np.random.seed(42)
-        sample_indices = np.random.choice(len(X_train_synth), size=n_synth, replace=False)
-        X_train_synth_sample = X_train_synth.iloc[sample_indices].reset_index(drop=True)
-        y_train_synth_sample = y_train_synth[sample_indices] if isinstance(y_train_synth, np.ndarray) else y_train_synth.iloc[sample_indices].values
-        
-        # Mix data
-        X_train_mixed = pd.concat([X_train_real.reset_index(drop=True), X_train_synth_sample], ignore_index=True)
-        y_train_mixed = np.concatenate([y_train_real, y_train_synth_sample])
+        # Sample synthetic data with a local seeded generator (reproducible,
+        # and leaves the global RNG alone for concurrent evaluations)
+        rng = np.random.default_rng(42)
+        sample_indices = rng.choice(len(X_train_synth), size=n_synth, replace=False)
+        
+        # Mix data: gather and stack the float32 blocks in numpy rather than
+        # through DataFrame iloc/concat, which rebuilds index and columns
+        X_train_mixed = pd.DataFrame(
+            np.vstack([
+                X_train_real.to_numpy(),
+                X_train_synth.to_numpy().take(sample_indices, axis=0)
+            ]),
+            columns=X_train_real.columns
+        )
+        y_train_mixed = np.concatenate([
+            np.asarray(y_train_real),
+            np.asarray(y_train_synth).take(sample_indices)
+        ])
         
         # Train model
-        if self.task_type == 'classification':
-            model = RandomForestClassifier(n_estimators=100, random_state=42)
-        else:
-            model = RandomForestRegressor(n_estimators=100, random_state=42)
+        model = self._create_model(X_train_mixed.columns)
         
         model.fit(X_train_mixed, y_train_mixed)
         y_pred = model.predict(X_test_real)
@@ -251,6 +416,21 @@ class MLUtilityEvaluator:
                 'mae': float(mean_absolute_error(y_true, y_pred))
             }
     
+    @staticmethod
+    def _run_in_worker(trainer, openmp_threads: int) -> Dict[str, Any]:
+        """
+        Run a trainer on a worker thread with its OpenMP pool capped.
+        
+        Targets are checked once in `_prepare_data` and missing features are
+        handled by the model, so the repeated full-array np.isfinite passes
+        in fit/predict/metrics validation are redundant and sklearn's
+        finiteness scans are disabled. Both settings are per thread (an
+        OpenMP thread count set on the calling thread isn't seen by the
+        executor's threads), hence entering them inside the worker.
+        """
+        with threadpool_limits(limits=openmp_threads, user_api='openmp'), config_context(assume_finite=True):
+            return trainer()
+    
     def evaluate_all(self) -> Dict[str, Any]:
         """
         Run all ML utility tests and compile comprehensive report.
@@ -266,10 +446,26 @@ class MLUtilityEvaluator:
             "models": {}
         }
         
-        # Train all models
-        baseline = self.train_on_real_test_on_real()
-        synthetic = self.train_on_synthetic_test_on_real()
-        mixed = self.train_on_mixed_test_on_real()
+        # Build the shared encodings/splits up front so the worker threads
+        # only read them
+        self._real_splits
+        self._synth_splits
+        
+        # Train all models concurrently. The estimators release the GIL while
+        # fitting, so threads overlap; each fit's OpenMP pool is capped to a
+        # share of the cores to avoid oversubscription.
+        trainers = [
+            self.train_on_real_test_on_real,
+            self.train_on_synthetic_test_on_real,
+            self.train_on_mixed_test_on_real,
+        ]
+        threads_per_fit = max(1, (os.cpu_count() or 1) // len(trainers))
+        with ThreadPoolExecutor(max_workers=len(trainers)) as executor:
+            futures = [
+                executor.submit(self._run_in_worker, trainer, threads_per_fit)
+                for trainer in trainers
+            ]
+            baseline, synthetic, mixed = [future.result() for future in futures]
         
         results["models"]["baseline"] = baseline
         results["models"]["synthetic"] = synthetic
@@ -3,19 +3,60 @@
 # Standard library
 import datetime
 import hashlib
-import json
 import uuid
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 # Third-party
+import orjson
+from sqlalchemy import Index
 from sqlmodel import Column, Field, SQLModel
 
 # Internal
 from app.database.database import JSONType
 
+# Canonical JSON used for report hashes
+_REPORT_HASH_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Dict levels that are walked in Python; deeper values are encoded whole
+_REPORT_HASH_STREAM_DEPTH = 2
+
+
+def _iter_canonical_json(value: Any, depth: int = 0) -> Iterator[bytes]:
+    """
+    Yield the canonical JSON encoding of `value` in pieces.
+    
+    The pieces concatenate to exactly `orjson.dumps(value, option=_REPORT_HASH_OPTIONS)`;
+    the top dict levels are emitted key by key so only one section is
+    encoded at a time.
+    """
+    if (
+        depth < _REPORT_HASH_STREAM_DEPTH
+        and isinstance(value, dict)
+        and all(type(key) is str for key in value)
+    ):
+        yield b"{"
+        for i, key in enumerate(sorted(value)):
+            if i:
+                yield b","
+            yield orjson.dumps(key)
+            yield b":"
+            yield from _iter_canonical_json(value[key], depth + 1)
+        yield b"}"
+    else:
+        yield orjson.dumps(value, default=str, option=_REPORT_HASH_OPTIONS)
+
+
+# Report fields that differ between otherwise identical runs
+_INSIGHTS_KEY_EXCLUDED_FIELDS = ("generated_at",)
+
 
 class Evaluation(SQLModel, table=True):
     __tablename__ = "evaluations"
+    __table_args__ = (
+        # Per-generator / per-dataset listings, newest first
+        Index("ix_evaluations_generator_id_created_at", "generator_id", "created_at"),
+        Index("ix_evaluations_dataset_id_created_at", "dataset_id", "created_at"),
+    )
 
     id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
     generator_id: uuid.UUID = Field(foreign_key="generators.id")
@@ -28,7 +69,7 @@ class Evaluation(SQLModel, table=True):
     
     # AUDIT FIELDS (added for governance)
     created_by: Optional[uuid.UUID] = Field(default=None, foreign_key="users.id")  # Who ran the evaluation
-    artifact_hash: Optional[str] = Field(default=None)  # SHA256 hash of report for integrity
+    artifact_hash: Optional[str] = Field(default=None, index=True)  # SHA256 hash of report for integrity
     
     # SOFT DELETE (added for audit trail - evaluations are never truly deleted)
     deleted_at: Optional[datetime.datetime] = Field(default=None)  # Soft delete timestamp
@@ -38,6 +79,55 @@ class Evaluation(SQLModel, table=True):
     
     @staticmethod
     def compute_report_hash(report: dict) -> str:
-        """Compute SHA256 hash of report for integrity verification."""
-        report_json = json.dumps(report, sort_keys=True, default=str)
-        return hashlib.sha256(report_json.encode()).hexdigest()
+        """
+        Compute SHA256 hash of report for integrity verification.
+        
+        Hashes the canonical orjson encoding (see _iter_canonical_json).
+        Hashes stored under the earlier json.dumps encoding are rewritten by
+        the rehash_evaluation_reports migration.
+        """
+        digest = hashlib.sha256()
+        for chunk in _iter_canonical_json(report):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+class InsightsCache(SQLModel, table=True):
+    """LLM insights keyed by report content, shared by identical reports (or comparisons)."""
+    __tablename__ = "insights_cache"
+
+    report_hash: str = Field(primary_key=True)
+    insights: dict = Field(default_factory=dict, sa_column=Column(JSONType))
+    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+
+    @staticmethod
+    def compute_report_key(report: dict) -> str:
+        """
+        Content key for a report's insights.
+
+        Same canonical JSON as the artifact hash, minus the run timestamp, so
+        re-running a generator on the same data hits the same entry.
+        """
+        content = {
+            key: value for key, value in report.items()
+            if key not in _INSIGHTS_KEY_EXCLUDED_FIELDS
+        }
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in _iter_canonical_json(content):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def compute_comparison_key(evaluations: List[Dict[str, Any]]) -> str:
+        """
+        Content key for an LLM comparison of evaluations.
+
+        Covers what the comparison prompt is built from: each evaluation's
+        generator type and report content key, in order (the comparison
+        refers to generations by position).
+        """
+        digest = hashlib.blake2b(b"comparison:", digest_size=16)
+        for evaluation in evaluations:
+            report_key = InsightsCache.compute_report_key(evaluation["metrics"])
+            digest.update(f"{evaluation['generator_type']}:{report_key};".encode())
+        return digest.hexdigest()
@@ -14,14 +14,94 @@ from typing import Dict, Any, List, Optional
 # Third-party
 import pandas as pd
 import numpy as np
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
-from sklearn.neighbors import NearestNeighbors
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, roc_auc_score
 
 logger = logging.getLogger(__name__)
 
+# Numba fuses the distance computation and the min-reduction for DCR
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available, high-dimensional DCR will use a KD-tree")
+
+# On a CUDA device, torch.cdist (a GEMM underneath) beats any CPU path for
+# large euclidean DCR
+try:
+    import torch
+    CUDA_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    CUDA_AVAILABLE = False
+
+# Metrics answered with a KD-tree, as the Minkowski p they correspond to
+_KDTREE_MINKOWSKI_P = {
+    'euclidean': 2,
+    'manhattan': 1,
+    'cityblock': 1,
+    'chebyshev': np.inf,
+}
+
+# Bytes of distance matrix computed per block for other metrics (~L2/L3 size)
+_DCR_BLOCK_BYTES = 8 * 1024 * 1024
+
+# Membership-attack AUC above which the linear attacker is followed up with
+# gradient boosting for a tighter bound
+_MIA_ESCALATION_AUC = 0.55
+
+# Attribute-inference targets with at most this many classes use gradient
+# boosting; it fits one tree per class per iteration, so beyond this a random
+# forest (one multi-class tree per estimator) is faster
+_HGB_MAX_CLASSES = 20
+
+# Euclidean DCR over at least this many synthetic x real pairs goes to the GPU
+_DCR_GPU_MIN_PAIRS = 10 ** 8
+
+# Bytes of float32 distance matrix computed per block on the GPU
+_DCR_GPU_BLOCK_BYTES = 256 * 1024 * 1024
+
+# From this many features on, KD-tree pruning stops paying off and the fused
+# brute-force kernel is faster for euclidean DCR
+_DCR_NUMBA_MIN_FEATURES = 16
+
+
+if NUMBA_AVAILABLE:
+    # cache=True keeps the compiled kernel in __pycache__, so new workers load
+    # it instead of spending a second JIT-compiling it on their first DCR
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _dcr_euclidean(synthetic, real, out):
+        """Fill `out` with each synthetic row's euclidean distance to its closest real row."""
+        for i in prange(synthetic.shape[0]):
+            best = np.inf
+            for j in range(real.shape[0]):
+                dist = 0.0
+                for k in range(synthetic.shape[1]):
+                    diff = synthetic[i, k] - real[j, k]
+                    dist += diff * diff
+                    # Partial sums only grow; stop once this row can't win
+                    if dist >= best:
+                        break
+                if dist < best:
+                    best = dist
+            out[i] = np.sqrt(best)
+
+
+def warm_up() -> None:
+    """
+    Compile the numba DCR kernel for the float32 inputs it is called with.
+    
+    Compiling a parallel kernel starts numba's thread pool, so call this from
+    the main thread (see main._compile_kernels).
+    """
+    if NUMBA_AVAILABLE:
+        # By signature, so no dummy data has to be run through the kernel
+        _dcr_euclidean.compile("(float32[:, ::1], float32[:, ::1], float64[::1])")
+
 
 class PrivacyEvaluator:
     """
@@ -55,28 +135,46 @@ class PrivacyEvaluator:
         self.real_numerical = self._prepare_numerical(real_data)
         self.synthetic_numerical = self._prepare_numerical(synthetic_data)
         
+        # Integer-encoded frames for attribute inference, built on first use
+        # and shared by every sensitive column
+        self._encoded_frames: Optional[tuple] = None
+        
         logger.info(f"Initialized PrivacyEvaluator with {len(real_data)} real and {len(synthetic_data)} synthetic records")
     
     def _prepare_numerical(self, df: pd.DataFrame) -> np.ndarray:
-        """Convert DataFrame to numerical array for distance calculations."""
-        df_copy = df.copy()
-        
-        # Encode categorical variables
-        categorical_cols = df_copy.select_dtypes(include=['object', 'category']).columns
-        for col in categorical_cols:
-            df_copy[col] = pd.Categorical(df_copy[col]).codes
-        
-        # Fill NaN
-        df_copy = df_copy.fillna(0)
-        
-        # Normalize to [0, 1]
-        from sklearn.preprocessing import MinMaxScaler
-        scaler = MinMaxScaler()
-        normalized = scaler.fit_transform(df_copy)
+        """
+        Convert DataFrame to numerical array for distance calculations.
         
-        return normalized
+        Columns are written straight into one float32 buffer (categoricals
+        as codes, missing numbers as 0), which is then min-max scaled to
+        [0, 1] in place, so no intermediate frames are materialised.
+        """
+        out = np.empty((len(df), len(df.columns)), dtype=np.float32)
+        
+        for i in range(len(df.columns)):
+            values = df.iloc[:, i]
+            if (
+                isinstance(values.dtype, pd.CategoricalDtype)
+                or pd.api.types.is_string_dtype(values.dtype)
+            ):
+                # Encode categorical variables (missing -> -1)
+                out[:, i] = pd.Categorical(values).codes
+            else:
+                out[:, i] = values.to_numpy(dtype=np.float32, na_value=0)
+        
+        # Normalize to [0, 1]; constant columns become 0
+        col_min = out.min(axis=0)
+        col_range = out.max(axis=0) - col_min
+        np.subtract(out, col_min, out=out)
+        np.divide(out, col_range, out=out, where=col_range != 0)
+        
+        return out
     
-    def distance_to_closest_record(self, metric: str = 'euclidean') -> Dict[str, Any]:
+    def distance_to_closest_record(
+        self,
+        metric: str = 'euclidean',
+        max_rows_per_side: int = 50_000
+    ) -> Dict[str, Any]:
         """
         Calculate Distance to Closest Record (DCR) for each synthetic record.
         
@@ -85,43 +183,47 @@ class PrivacyEvaluator:
         
         Args:
             metric: Distance metric ('euclidean', 'manhattan', 'cosine')
+            max_rows_per_side: Real and synthetic records are each uniformly
+                subsampled (fixed seed) to at most this many rows; the work is
+                O(synthetic x real) at worst, while the reported quantiles and
+                risk percentages are stable under subsampling
         
         Returns:
             Dictionary with DCR statistics and privacy assessment
         """
         logger.info(f"Calculating Distance to Closest Record ({metric})...")
         
-        # MEMORY LIMIT CHECK: cdist on large matrices can exhaust memory
-        # Limit to max 10,000 x 10,000 comparisons (~800MB for float64)
-        MAX_RECORDS = 10000
         real_sample = self.real_numerical
         synth_sample = self.synthetic_numerical
+        subsampled = (
+            len(real_sample) > max_rows_per_side
+            or len(synth_sample) > max_rows_per_side
+        )
         
-        if len(self.real_numerical) > MAX_RECORDS or len(self.synthetic_numerical) > MAX_RECORDS:
-            logger.warning(f"Large dataset detected: sampling to {MAX_RECORDS} records for DCR calculation")
-            np.random.seed(42)  # Reproducibility
-            if len(self.real_numerical) > MAX_RECORDS:
-                real_idx = np.random.choice(len(self.real_numerical), MAX_RECORDS, replace=False)
-                real_sample = self.real_numerical[real_idx]
-            if len(self.synthetic_numerical) > MAX_RECORDS:
-                synth_idx = np.random.choice(len(self.synthetic_numerical), MAX_RECORDS, replace=False)
-                synth_sample = self.synthetic_numerical[synth_idx]
-        
-        # Calculate pairwise distances
-        distances = cdist(synth_sample, real_sample, metric=metric)
-        
-        # Find minimum distance for each synthetic record
-        min_distances = distances.min(axis=1)
-        
-        # Statistics
+        if subsampled:
+            logger.warning(f"Large dataset detected: sampling to {max_rows_per_side} records for DCR calculation")
+            rng = np.random.default_rng(42)  # Reproducibility
+            if len(real_sample) > max_rows_per_side:
+                real_idx = rng.choice(len(real_sample), max_rows_per_side, replace=False)
+                real_sample = real_sample[real_idx]
+            if len(synth_sample) > max_rows_per_side:
+                synth_idx = rng.choice(len(synth_sample), max_rows_per_side, replace=False)
+                synth_sample = synth_sample[synth_idx]
+        
+        # Distance from each synthetic record to its nearest real record
+        min_distances = self._nearest_distances(synth_sample, real_sample, metric)
+        
+        # Statistics. Order statistics are read off one sorted copy (which
+        # the risk buckets below reuse); only mean/std need a reduction.
+        sorted_distances = np.sort(min_distances)
         dcr_stats = {
-            "mean": float(np.mean(min_distances)),
-            "median": float(np.median(min_distances)),
-            "std": float(np.std(min_distances)),
-            "min": float(np.min(min_distances)),
-            "max": float(np.max(min_distances)),
-            "q25": float(np.percentile(min_distances, 25)),
-            "q75": float(np.percentile(min_distances, 75))
+            "mean": float(sorted_distances.mean()),
+            "median": self._sorted_quantile(sorted_distances, 0.5),
+            "std": float(sorted_distances.std()),
+            "min": float(sorted_distances[0]),
+            "max": float(sorted_distances[-1]),
+            "q25": self._sorted_quantile(sorted_distances, 0.25),
+            "q75": self._sorted_quantile(sorted_distances, 0.75)
         }
         
         # Risk assessment
@@ -129,12 +231,15 @@ class PrivacyEvaluator:
         threshold_high_risk = 0.05
         threshold_medium_risk = 0.10
         
-        high_risk = (min_distances < threshold_high_risk).sum()
-        medium_risk = ((min_distances >= threshold_high_risk) & 
-                      (min_distances < threshold_medium_risk)).sum()
-        low_risk = (min_distances >= threshold_medium_risk).sum()
+        # Bucket counts from two binary searches instead of three boolean
+        # masks over the whole array
+        high_risk, high_or_medium = np.searchsorted(
+            sorted_distances, [threshold_high_risk, threshold_medium_risk], side='left'
+        )
+        medium_risk = high_or_medium - high_risk
         
-        total = len(min_distances)
+        total = len(sorted_distances)
+        low_risk = total - high_or_medium
         
         # Overall risk level
         if high_risk / total > 0.1:
@@ -150,6 +255,11 @@ class PrivacyEvaluator:
         return {
             "test": "Distance to Closest Record",
             "metric": metric,
+            "subsampled": subsampled,
+            "sample_sizes": {
+                "real": int(len(real_sample)),
+                "synthetic": int(len(synth_sample))
+            },
             "statistics": dcr_stats,
             "risk_distribution": {
                 "high_risk": int(high_risk),
@@ -163,6 +273,119 @@ class PrivacyEvaluator:
             "interpretation": interpretation
         }
     
+    @staticmethod
+    def _sorted_quantile(sorted_values: np.ndarray, q: float) -> float:
+        """Quantile of an ascending array, interpolated like np.percentile's default."""
+        position = q * (len(sorted_values) - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, len(sorted_values) - 1)
+        fraction = position - lower
+        return float(
+            sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+        )
+    
+    @staticmethod
+    def _nearest_distances(
+        synthetic: np.ndarray,
+        real: np.ndarray,
+        metric: str
+    ) -> np.ndarray:
+        """
+        Distance from each synthetic row to its closest real row.
+        
+        Uses a 1-NN query (or, for metrics a KD-tree can't answer, cdist in
+        row blocks) instead of the full synthetic x real distance matrix, so
+        memory stays O(rows) rather than O(rows^2).
+        
+        Args:
+            synthetic: Synthetic records (rows)
+            real: Real records (rows)
+            metric: Distance metric name (scipy/sklearn naming)
+        
+        Returns:
+            Array of minimum distances, one per synthetic row
+        """
+        if (
+            metric == 'euclidean'
+            and CUDA_AVAILABLE
+            and len(synthetic) * len(real) >= _DCR_GPU_MIN_PAIRS
+        ):
+            return PrivacyEvaluator._nearest_distances_torch(synthetic, real, "cuda")
+        
+        if (
+            metric == 'euclidean'
+            and NUMBA_AVAILABLE
+            and synthetic.shape[1] >= _DCR_NUMBA_MIN_FEATURES
+        ):
+            min_distances = np.empty(len(synthetic), dtype=np.float64)
+            _dcr_euclidean(
+                np.ascontiguousarray(synthetic),
+                np.ascontiguousarray(real),
+                min_distances
+            )
+            return min_distances
+        
+        if metric in _KDTREE_MINKOWSKI_P:
+            distances, _ = cKDTree(real).query(
+                synthetic, k=1, p=_KDTREE_MINKOWSKI_P[metric], workers=-1
+            )
+            return distances
+        
+        if metric == 'cosine':
+            # On unit vectors, squared euclidean distance = 2 * cosine distance
+            def unit_rows(x):
+                norms = np.linalg.norm(x, axis=1, keepdims=True)
+                return np.divide(x, norms, out=np.zeros_like(x), where=norms > 0)
+            
+            distances, _ = cKDTree(unit_rows(real)).query(unit_rows(synthetic), k=1, workers=-1)
+            return distances ** 2 / 2
+        
+        # Any other scipy metric: blocked cdist with a running row minimum,
+        # so only a block x real slab of the matrix exists at a time
+        block = max(1, _DCR_BLOCK_BYTES // (max(len(real), 1) * 8))
+        min_distances = np.empty(len(synthetic))
+        for start in range(0, len(synthetic), block):
+            stop = start + block
+            min_distances[start:stop] = cdist(
+                synthetic[start:stop], real, metric=metric
+            ).min(axis=1)
+        return min_distances
+    
+    @staticmethod
+    def _nearest_distances_torch(
+        synthetic: np.ndarray,
+        real: np.ndarray,
+        device: str
+    ) -> np.ndarray:
+        """
+        Euclidean distance from each synthetic row to its closest real row, via torch.cdist.
+        
+        The real rows are copied to the device once and the synthetic rows
+        are streamed in blocks, so neither the full distance matrix nor a
+        host-side copy of it ever exists.
+        
+        Args:
+            synthetic: Synthetic records (rows)
+            real: Real records (rows)
+            device: Torch device to compute on
+        
+        Returns:
+            Array of minimum distances, one per synthetic row
+        """
+        block = max(1, _DCR_GPU_BLOCK_BYTES // (max(len(real), 1) * 4))
+        min_distances = np.empty(len(synthetic), dtype=np.float64)
+        with torch.no_grad():
+            real_t = torch.as_tensor(real, dtype=torch.float32, device=device)
+            for start in range(0, len(synthetic), block):
+                stop = start + block
+                synthetic_t = torch.as_tensor(
+                    synthetic[start:stop], dtype=torch.float32, device=device
+                )
+                min_distances[start:stop] = (
+                    torch.cdist(synthetic_t, real_t).min(dim=1).values.cpu().numpy()
+                )
+        return min_distances
+    
     def membership_inference_attack(self) -> Dict[str, Any]:
         """
         Test vulnerability to membership inference attacks.
@@ -180,32 +403,44 @@ class PrivacyEvaluator:
         
         # Prepare data
         # Label: 1 = real (member), 0 = synthetic (non-member)
-        real_labeled = np.column_stack([self.real_numerical, np.ones(len(self.real_numerical))])
-        synth_labeled = np.column_stack([self.synthetic_numerical, np.zeros(len(self.synthetic_numerical))])
-        
-        # Combine and shuffle (FIXED: add seed for reproducibility)
-        combined = np.vstack([real_labeled, synth_labeled])
-        np.random.seed(42)  # Reproducibility fix
-        np.random.shuffle(combined)
-        
-        X = combined[:, :-1]
-        y = combined[:, -1]
-        
-        # Split for training the attacker
+        n_real = len(self.real_numerical)
+        n_synth = len(self.synthetic_numerical)
+        X = np.empty((n_real + n_synth, self.real_numerical.shape[1]), dtype=np.float32)
+        X[:n_real] = self.real_numerical
+        X[n_real:] = self.synthetic_numerical
+        y = np.concatenate([np.ones(n_real, dtype=np.int8), np.zeros(n_synth, dtype=np.int8)])
+        
+        # Split for training the attacker (train_test_split shuffles with
+        # its own seeded RNG, so no separate shuffle pass is needed)
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=0.3, random_state=42
         )
         
-        # Train attacker model
-        attacker = RandomForestClassifier(n_estimators=100, random_state=42)
-        attacker.fit(X_train, y_train)
-        
-        # Evaluate attack
-        y_pred = attacker.predict(X_test)
-        y_pred_proba = attacker.predict_proba(X_test)[:, 1]
-        
-        accuracy = accuracy_score(y_test, y_pred)
-        auc = roc_auc_score(y_test, y_pred_proba)
+        # Train attacker models, cheapest first: the features are already
+        # scaled to [0, 1], so a linear model exposes gross distribution
+        # gaps in a single solve. Only when it finds signal is the boosted
+        # attacker trained, and the stronger of the two attacks is reported.
+        # Early stopping ends boosting as soon as the attack stops
+        # improving on a held-out slice, so little signal = few iterations.
+        attacker_model = "logistic_regression"
+        accuracy, auc = self._run_membership_attacker(
+            LogisticRegression(max_iter=1000, random_state=42),
+            X_train, X_test, y_train, y_test
+        )
+        if auc > _MIA_ESCALATION_AUC:
+            gb_accuracy, gb_auc = self._run_membership_attacker(
+                HistGradientBoostingClassifier(
+                    max_iter=200,
+                    early_stopping=True,
+                    validation_fraction=0.1,
+                    n_iter_no_change=5,
+                    random_state=42
+                ),
+                X_train, X_test, y_train, y_test
+            )
+            if gb_auc > auc:
+                attacker_model = "gradient_boosting"
+                accuracy, auc = gb_accuracy, gb_auc
         
         # Vulnerability assessment
         # Random guessing = 50% accuracy
@@ -227,12 +462,21 @@ class PrivacyEvaluator:
             "attack_accuracy": float(accuracy),
             "attack_auc": float(auc),
             "attack_advantage": float(advantage),
+            "attacker_model": attacker_model,
             "vulnerability": vulnerability,
             "interpretation": interpretation,
             "baseline_accuracy": 0.5,
             "note": "Lower attack accuracy = better privacy"
         }
     
+    @staticmethod
+    def _run_membership_attacker(attacker, X_train, X_test, y_train, y_test) -> tuple:
+        """Fit a membership attacker and return its (accuracy, AUC) on the held-out rows."""
+        attacker.fit(X_train, y_train)
+        y_pred = attacker.predict(X_test)
+        y_pred_proba = attacker.predict_proba(X_test)[:, 1]
+        return accuracy_score(y_test, y_pred), roc_auc_score(y_test, y_pred_proba)
+    
     def attribute_inference_attack(self, target_column: str) -> Dict[str, Any]:
         """
         Test vulnerability to attribute inference attacks.
@@ -256,16 +500,7 @@ class PrivacyEvaluator:
             }
         
         # Prepare data
-        real_df = self.real_data.copy()
-        synth_df = self.synthetic_data.copy()
-        
-        # Encode categorical
-        from sklearn.preprocessing import LabelEncoder
-        for col in real_df.select_dtypes(include=['object', 'category']).columns:
-            le = LabelEncoder()
-            real_df[col] = le.fit_transform(real_df[col].astype(str))
-            if col in synth_df.columns:
-                synth_df[col] = le.transform(synth_df[col].astype(str))
+        real_df, synth_df = self._encoded
         
         # Prepare features and target
         X_real = real_df.drop(columns=[target_column]).fillna(0)
@@ -280,11 +515,16 @@ class PrivacyEvaluator:
         X_synth = X_synth[common_cols]
         
         # Train on synthetic, test on real
-        attacker = RandomForestClassifier(n_estimators=100, random_state=42)
+        if y_synth.nunique() <= _HGB_MAX_CLASSES:
+            attacker = HistGradientBoostingClassifier(max_iter=100, random_state=42)
+        else:
+            attacker = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
         attacker.fit(X_synth, y_synth)
         
+        # Stratify the held-out real rows when every class can be split
+        stratify = y_real if y_real.value_counts().min() >= 2 else None
         X_real_train, X_real_test, y_real_train, y_real_test = train_test_split(
-            X_real, y_real, test_size=0.3, random_state=42
+            X_real, y_real, test_size=0.3, random_state=42, stratify=stratify
         )
         
         y_pred = attacker.predict(X_real_test)
@@ -310,6 +550,49 @@ class PrivacyEvaluator:
             "interpretation": interpretation
         }
     
+    @property
+    def _encoded(self) -> tuple:
+        """(real, synthetic) frames with categoricals encoded, computed once."""
+        if self._encoded_frames is None:
+            self._encoded_frames = self._encode_categoricals(self.real_data, self.synthetic_data)
+        return self._encoded_frames
+    
+    @staticmethod
+    def _encode_categoricals(
+        real_df: pd.DataFrame,
+        synth_df: pd.DataFrame
+    ) -> tuple:
+        """
+        Encode the real data's categorical columns as integer codes in both frames.
+        
+        Codes come from the sorted union of both frames' values (as strings),
+        so categories that only occur in the synthetic data still encode
+        instead of raising, and a value gets the same code in both frames.
+        Codes are not those of a LabelEncoder fitted on the real data alone:
+        a synthetic-only value that sorts first shifts the real ones.
+        
+        Args:
+            real_df: Real dataset
+            synth_df: Synthetic dataset
+        
+        Returns:
+            Tuple of (encoded real, encoded synthetic) frames
+        """
+        real_df = real_df.copy()
+        synth_df = synth_df.copy()
+        
+        for col in real_df.select_dtypes(include=['object', 'category']).columns:
+            real_values = real_df[col].astype(str)
+            if col in synth_df.columns:
+                synth_values = synth_df[col].astype(str)
+                categories = np.union1d(real_values.unique(), synth_values.unique())
+                synth_df[col] = pd.Categorical(synth_values, categories=categories).codes.astype(np.int32)
+            else:
+                categories = np.sort(real_values.unique())
+            real_df[col] = pd.Categorical(real_values, categories=categories).codes.astype(np.int32)
+        
+        return real_df, synth_df
+    
     def evaluate_all(self) -> Dict[str, Any]:
         """
         Run all privacy tests and compile comprehensive report.
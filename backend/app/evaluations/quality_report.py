@@ -5,13 +5,21 @@ Combines statistical, ML utility, and privacy tests into a unified report.
 """
 
 # Standard library
+import functools
 import logging
-from typing import Dict, Any, Optional, List
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Hashable, List, Optional
 from datetime import datetime
 
 # Third-party
 import pandas as pd
 
+# Local - Core
+from app.core.config import settings
+
 # Local - Module
 from .statistical_tests import StatisticalEvaluator
 from .ml_utility import MLUtilityEvaluator
@@ -19,6 +27,144 @@ from .privacy_tests import PrivacyEvaluator
 
 logger = logging.getLogger(__name__)
 
+# Default weight of each dimension in the overall quality score
+DEFAULT_SCORING_WEIGHTS = {
+    "statistical": 0.4,
+    "ml_utility": 0.3,
+    "privacy": 0.3
+}
+
+
+def _run_statistical(
+    real_data: pd.DataFrame,
+    synthetic_data: pd.DataFrame,
+    columns: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Statistical similarity tests (module level so it can run in a worker process)."""
+    try:
+        results = StatisticalEvaluator(real_data, synthetic_data).evaluate_all(columns=columns)
+        logger.info("✓ Statistical evaluation complete")
+        return results
+    except Exception as e:
+        logger.error(f"Statistical evaluation failed: {e}")
+        return {"status": "error", "error": str(e)}
+
+
+def _run_ml_utility(
+    real_data: pd.DataFrame,
+    synthetic_data: pd.DataFrame,
+    target_column: str
+) -> Dict[str, Any]:
+    """ML utility tests (module level so it can run in a worker process)."""
+    try:
+        results = MLUtilityEvaluator(real_data, synthetic_data, target_column).evaluate_all()
+        logger.info("✓ ML utility evaluation complete")
+        return results
+    except Exception as e:
+        logger.error(f"ML utility evaluation failed: {e}")
+        return {"status": "error", "error": str(e)}
+
+
+def _run_privacy(
+    real_data: pd.DataFrame,
+    synthetic_data: pd.DataFrame,
+    sensitive_columns: List[str]
+) -> Dict[str, Any]:
+    """Privacy leakage tests (module level so it can run in a worker process)."""
+    try:
+        results = PrivacyEvaluator(real_data, synthetic_data, sensitive_columns).evaluate_all()
+        logger.info("✓ Privacy evaluation complete")
+        return results
+    except Exception as e:
+        logger.error(f"Privacy evaluation failed: {e}")
+        return {"status": "error", "error": str(e)}
+
+
+def run_summary_report(
+    real_data: pd.DataFrame,
+    synthetic_data: pd.DataFrame,
+    generator_id: str,
+    generator_type: str,
+    real_data_key: Optional[Hashable] = None
+) -> Dict[str, Any]:
+    """Quick summary report (module level so it can run in a worker process)."""
+    return QualityReportGenerator(
+        real_data, synthetic_data, generator_id, generator_type, real_data_key
+    ).generate_summary_report()
+
+
+# Worker processes shared by all evaluations, so each one doesn't pay for
+# spawning workers and re-importing pandas/sklearn in them
+_report_pool: Optional[ProcessPoolExecutor] = None
+_report_pool_lock = threading.Lock()
+
+# Workers are started from a clean server process rather than forked from
+# the API process, whose numba/OpenMP/database threads a fork would copy
+# mid-flight (a lock held by one of them stays held in the child forever)
+_REPORT_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _report_pool_context():
+    """Multiprocessing context the evaluation workers are started with."""
+    context = multiprocessing.get_context(_REPORT_POOL_START_METHOD)
+    if _REPORT_POOL_START_METHOD == "forkserver":
+        # The fork server imports the evaluation stack once (it starts no
+        # threads doing so); workers forked from it then start warm
+        context.set_forkserver_preload([__name__])
+    return context
+
+
+def get_report_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Shared evaluation worker pool, created on first use.
+    
+    Returns None when evaluations should run in the calling process:
+    EVAL_WORKERS is 1, or we are already inside a daemonic worker (which
+    can't spawn children).
+    """
+    global _report_pool
+    if settings.eval_workers <= 1 or multiprocessing.current_process().daemon:
+        return None
+    with _report_pool_lock:
+        if _report_pool is None:
+            _report_pool = ProcessPoolExecutor(
+                max_workers=settings.eval_workers,
+                mp_context=_report_pool_context()
+            )
+        return _report_pool
+
+
+def submit_report_task(fn: Callable, *args) -> Future:
+    """
+    Run `fn(*args)` on the shared evaluation workers.
+    
+    A worker dying (e.g. OOM-killed) breaks the whole pool, after which
+    every submit fails; the broken pool is then replaced and the task
+    submitted to the new one. Only call this when get_report_pool() isn't None.
+    """
+    global _report_pool
+    pool = get_report_pool()
+    try:
+        return pool.submit(fn, *args)
+    except BrokenProcessPool:
+        logger.warning("Evaluation worker pool is broken, starting a new one")
+        with _report_pool_lock:
+            if _report_pool is pool:
+                _report_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        return get_report_pool().submit(fn, *args)
+
+
+def shutdown_report_pool() -> None:
+    """Stop the shared evaluation workers (on application shutdown)."""
+    global _report_pool
+    with _report_pool_lock:
+        if _report_pool is not None:
+            _report_pool.shutdown(wait=False, cancel_futures=True)
+            _report_pool = None
+
 
 class QualityReportGenerator:
     """
@@ -35,7 +181,8 @@ class QualityReportGenerator:
         real_data: pd.DataFrame,
         synthetic_data: pd.DataFrame,
         generator_id: str,
-        generator_type: str
+        generator_type: str,
+        real_data_key: Optional[Hashable] = None
     ):
         """
         Initialize quality report generator.
@@ -45,14 +192,45 @@ class QualityReportGenerator:
             synthetic_data: Generated synthetic dataset
             generator_id: ID of the generator
             generator_type: Type of generator (ctgan, dp-ctgan, etc.)
+            real_data_key: Identifies this version of the real dataset (see
+                StatisticalEvaluator)
         """
         self.real_data = real_data
         self.synthetic_data = synthetic_data
         self.generator_id = generator_id
         self.generator_type = generator_type
+        self.real_data_key = real_data_key
+        # Last all-columns statistical result, reused by generate_summary_report
+        self._last_stat_result: Optional[Dict[str, Any]] = None
         
         logger.info(f"Initialized QualityReportGenerator for {generator_type}")
     
+    @staticmethod
+    def required_columns(
+        target_column: Optional[str] = None,
+        include_statistical: bool = True,
+        include_ml_utility: bool = True,
+        include_privacy: bool = True,
+        statistical_columns: Optional[List[str]] = None
+    ) -> Optional[List[str]]:
+        """
+        Columns a generate_full_report call with these options will read.
+        
+        ML utility and privacy tests use every column as a feature, so only a
+        statistical-only report over explicit statistical_columns can be
+        served from a column subset. Lets callers project at load time.
+        
+        Returns:
+            Column names, or None if the whole dataset is needed
+        """
+        if include_ml_utility and target_column:
+            return None
+        if include_privacy:
+            return None
+        if include_statistical and statistical_columns:
+            return list(dict.fromkeys(statistical_columns))
+        return None
+    
     def generate_full_report(
         self,
         target_column: Optional[str] = None,
@@ -101,79 +279,96 @@ class QualityReportGenerator:
             "evaluations": {}
         }
         
-        # Statistical similarity
+        tasks = []
         if include_statistical:
-            try:
-                stat_evaluator = StatisticalEvaluator(self.real_data, self.synthetic_data)
-                stat_results = stat_evaluator.evaluate_all(columns=statistical_columns)
-                report["evaluations"]["statistical_similarity"] = stat_results
-                logger.info("✓ Statistical evaluation complete")
-            except Exception as e:
-                logger.error(f"Statistical evaluation failed: {e}")
-                report["evaluations"]["statistical_similarity"] = {
-                    "status": "error",
-                    "error": str(e)
-                }
-        
-        # ML utility
+            tasks.append(("statistical_similarity", _run_statistical, (statistical_columns,)))
         if include_ml_utility and target_column:
-            try:
-                ml_evaluator = MLUtilityEvaluator(
-                    self.real_data,
-                    self.synthetic_data,
-                    target_column
-                )
-                ml_results = ml_evaluator.evaluate_all()
-                report["evaluations"]["ml_utility"] = ml_results
-                logger.info("✓ ML utility evaluation complete")
-            except Exception as e:
-                logger.error(f"ML utility evaluation failed: {e}")
-                report["evaluations"]["ml_utility"] = {
-                    "status": "error",
-                    "error": str(e)
-                }
-        
-        # Privacy leakage
+            tasks.append(("ml_utility", _run_ml_utility, (target_column,)))
         if include_privacy:
-            try:
-                privacy_evaluator = PrivacyEvaluator(
-                    self.real_data,
-                    self.synthetic_data,
-                    sensitive_columns or []
-                )
-                privacy_results = privacy_evaluator.evaluate_all()
-                report["evaluations"]["privacy"] = privacy_results
-                logger.info("✓ Privacy evaluation complete")
-            except Exception as e:
-                logger.error(f"Privacy evaluation failed: {e}")
-                report["evaluations"]["privacy"] = {
-                    "status": "error",
-                    "error": str(e)
-                }
+            tasks.append(("privacy", _run_privacy, (sensitive_columns or [],)))
+        
+        results = self._run_evaluations(tasks)
+        # Keep the report's section order independent of completion order
+        for name, _, _ in tasks:
+            report["evaluations"][name] = results[name]
+        
+        stat_results = results.get("statistical_similarity")
+        if statistical_columns is None and stat_results and "summary" in stat_results:
+            self._last_stat_result = stat_results
         
         # Overall quality score
-        report["overall_assessment"] = self._calculate_overall_score(report["evaluations"])
+        report["overall_assessment"] = self._calculate_overall_score(
+            report["evaluations"],
+            report["scoring_weights"]
+        )
         
         logger.info(f"✓ Comprehensive quality report generated: {report['overall_assessment']['overall_quality']}")
         
         return report
     
-    def _calculate_overall_score(self, evaluations: Dict[str, Any]) -> Dict[str, Any]:
+    @functools.cached_property
+    def _stat_evaluator(self) -> StatisticalEvaluator:
+        """Statistical evaluator for the summary report, built on first use."""
+        return StatisticalEvaluator(self.real_data, self.synthetic_data, self.real_data_key)
+    
+    def _run_evaluations(self, tasks: List[tuple]) -> Dict[str, Any]:
+        """
+        Run independent evaluations, in parallel worker processes when possible.
+        
+        The evaluators only read the two DataFrames and are CPU bound (random
+        forests, distance matrices), so separate processes let them overlap
+        instead of taking turns on the GIL. Falls back to running them one
+        after another when there's a single task, EVAL_WORKERS is 1, or we
+        are already inside a daemonic worker (which can't spawn children).
+        
+        Args:
+            tasks: (name, runner, extra_args) tuples; each runner is called as
+                runner(real_data, synthetic_data, *extra_args)
+        
+        Returns:
+            Results keyed by task name
+        """
+        pool = get_report_pool() if len(tasks) > 1 else None
+        if pool is None:
+            return {
+                name: runner(self.real_data, self.synthetic_data, *args)
+                for name, runner, args in tasks
+            }
+        
+        results = {}
+        futures = {
+            submit_report_task(runner, self.real_data, self.synthetic_data, *args): name
+            for name, runner, args in tasks
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                # Runners catch their own errors; this is the worker
+                # process itself dying (e.g. OOM-killed)
+                logger.error(f"Evaluation worker for {name} failed: {e}")
+                results[name] = {"status": "error", "error": str(e)}
+        return results
+    
+    def _calculate_overall_score(
+        self,
+        evaluations: Dict[str, Any],
+        weights: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
         """
         Calculate overall quality score from all evaluations.
         
         Args:
             evaluations: Dictionary of all evaluation results
+            weights: Weight per dimension ('statistical', 'ml_utility',
+                'privacy'); defaults to the generate_full_report defaults
         
         Returns:
             Overall assessment with scores and recommendations
         """
         scores = {}
-        weights = {
-            "statistical": 0.4,
-            "ml_utility": 0.3,
-            "privacy": 0.3
-        }
+        weights = weights or DEFAULT_SCORING_WEIGHTS
         
         # Statistical score
         if "statistical_similarity" in evaluations and "summary" in evaluations["statistical_similarity"]:
@@ -192,9 +387,9 @@ class QualityReportGenerator:
             scores["privacy"] = privacy_map.get(privacy_level, 0.5)
         
         # Calculate weighted average
-        if scores:
-            total_weight = sum(weights[k] for k in scores.keys())
-            overall_score = sum(scores[k] * weights.get(k, 0) for k in scores.keys()) / total_weight
+        total_weight = sum(weights.get(k, 0) for k in scores)
+        if total_weight > 0:
+            overall_score = sum(scores[k] * weights.get(k, 0) for k in scores) / total_weight
         else:
             overall_score = 0.0
         
@@ -236,8 +431,10 @@ class QualityReportGenerator:
         """
         logger.info("Generating summary quality report...")
         
-        stat_evaluator = StatisticalEvaluator(self.real_data, self.synthetic_data)
-        stat_results = stat_evaluator.evaluate_all()
+        # Reuse the statistical pass of an earlier full report on this data
+        if self._last_stat_result is None:
+            self._last_stat_result = self._stat_evaluator.evaluate_all()
+        stat_results = self._last_stat_result
         
         return {
             "report_id": f"{self.generator_id}_summary",
@@ -9,20 +9,48 @@ from datetime import datetime
 from typing import List, Optional
 
 # Third-party
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, defer
 
 # Internal
-from .models import Evaluation
+from .models import Evaluation, InsightsCache
 
 logger = logging.getLogger(__name__)
 
+# Hot list queries, built once at import instead of on every call. Both are
+# served by the (fk, created_at) composite indexes on `evaluations`.
+_LIST_BY_GENERATOR = (
+    select(Evaluation)
+    .where(Evaluation.generator_id == bindparam("generator_id"))
+    .order_by(Evaluation.created_at.desc())
+)
+_LIST_BY_DATASET = (
+    select(Evaluation)
+    .where(Evaluation.dataset_id == bindparam("dataset_id"))
+    .order_by(Evaluation.created_at.desc())
+)
+
+
+def _paged(statement, limit: Optional[int], offset: int, include_report: bool):
+    """Apply pagination and optional deferral of the `report` blob to a list query."""
+    if not include_report:
+        # The report is only loaded if an instance's .report is accessed
+        statement = statement.options(defer(Evaluation.report))
+    if limit is not None:
+        statement = statement.limit(limit)
+    if offset:
+        statement = statement.offset(offset)
+    return statement
+
 
 def create_evaluation(
     db: Session,
     generator_id: str,
     dataset_id: str,
     report: dict,
-    created_by: str = None  # ADDED: User ID for audit trail
+    created_by: str = None,  # ADDED: User ID for audit trail
+    evaluation_id: str = None
 ) -> Evaluation:
     """
     Create new evaluation record.
@@ -33,6 +61,8 @@ def create_evaluation(
         dataset_id: Dataset ID
         report: Quality report dictionary
         created_by: User ID who ran the evaluation
+        evaluation_id: ID to store it under (e.g. one handed out when the
+            evaluation was queued); generated if omitted
     
     Returns:
         Created evaluation record
@@ -46,6 +76,7 @@ def create_evaluation(
     artifact_hash = Evaluation.compute_report_hash(report)
     
     evaluation = Evaluation(
+        id=uuid.UUID(evaluation_id) if evaluation_id else uuid.uuid4(),
         generator_id=gen_uuid,
         dataset_id=ds_uuid,
         report=report,
@@ -62,53 +93,81 @@ def create_evaluation(
     return evaluation
 
 
-def get_evaluation(db: Session, evaluation_id: str) -> Optional[Evaluation]:
+def get_evaluation(
+    db: Session,
+    evaluation_id: str,
+    include_report: bool = True
+) -> Optional[Evaluation]:
     """
     Get evaluation by ID.
     
     Args:
         db: Database session
         evaluation_id: Evaluation ID
+        include_report: Load the report JSON up front; set False when only
+            metadata, insights or risk details are needed (the report is
+            still loaded on first access)
     
     Returns:
         Evaluation record or None
     """
     eval_uuid = uuid.UUID(evaluation_id) if isinstance(evaluation_id, str) else evaluation_id
-    return db.query(Evaluation).filter(Evaluation.id == eval_uuid).first()
+    query = db.query(Evaluation).filter(Evaluation.id == eval_uuid)
+    if not include_report:
+        query = query.options(defer(Evaluation.report))
+    return query.first()
 
 
-def list_evaluations_by_generator(db: Session, generator_id: str) -> List[Evaluation]:
+def list_evaluations_by_generator(
+    db: Session,
+    generator_id: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    include_report: bool = True
+) -> List[Evaluation]:
     """
-    List all evaluations for a generator.
+    List evaluations for a generator, newest first.
     
     Args:
         db: Database session
         generator_id: Generator ID
+        limit: Maximum number of evaluations to return (None = all)
+        offset: Number of evaluations to skip
+        include_report: Load the report JSON up front; set False for
+            listings that don't show it
     
     Returns:
         List of evaluations
     """
     gen_uuid = uuid.UUID(generator_id) if isinstance(generator_id, str) else generator_id
-    return db.query(Evaluation).filter(
-        Evaluation.generator_id == gen_uuid
-    ).order_by(Evaluation.created_at.desc()).all()
+    statement = _paged(_LIST_BY_GENERATOR, limit, offset, include_report)
+    return db.execute(statement, {"generator_id": gen_uuid}).scalars().all()
 
 
-def list_evaluations_by_dataset(db: Session, dataset_id: str) -> List[Evaluation]:
+def list_evaluations_by_dataset(
+    db: Session,
+    dataset_id: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    include_report: bool = True
+) -> List[Evaluation]:
     """
-    List all evaluations for a dataset.
+    List evaluations for a dataset, newest first.
     
     Args:
         db: Database session
         dataset_id: Dataset ID
+        limit: Maximum number of evaluations to return (None = all)
+        offset: Number of evaluations to skip
+        include_report: Load the report JSON up front; set False for
+            listings that don't show it
     
     Returns:
         List of evaluations
     """
     ds_uuid = uuid.UUID(dataset_id) if isinstance(dataset_id, str) else dataset_id
-    return db.query(Evaluation).filter(
-        Evaluation.dataset_id == ds_uuid
-    ).order_by(Evaluation.created_at.desc()).all()
+    statement = _paged(_LIST_BY_DATASET, limit, offset, include_report)
+    return db.execute(statement, {"dataset_id": ds_uuid}).scalars().all()
 
 
 def delete_evaluation(db: Session, evaluation_id: str, deleted_by: str = None) -> bool:
@@ -121,23 +180,63 @@ def delete_evaluation(db: Session, evaluation_id: str, deleted_by: str = None) -
         deleted_by: User ID who is deleting
     
     Returns:
-        True if soft-deleted, False if not found
+        True if soft-deleted, False if not found or already deleted
     """
-    from datetime import datetime
-    
     eval_uuid = uuid.UUID(evaluation_id) if isinstance(evaluation_id, str) else evaluation_id
-    evaluation = get_evaluation(db, str(eval_uuid))
-    if not evaluation:
-        return False
-    
-    # SOFT DELETE: Set deleted_at timestamp instead of removing record
-    evaluation.deleted_at = datetime.utcnow()
-    if deleted_by:
-        evaluation.deleted_by = uuid.UUID(deleted_by) if isinstance(deleted_by, str) else deleted_by
-    
-    db.add(evaluation)
+    user_uuid = uuid.UUID(deleted_by) if deleted_by and isinstance(deleted_by, str) else deleted_by
+    
+    # SOFT DELETE: Set deleted_at timestamp instead of removing record, in a
+    # single UPDATE ... RETURNING (no SELECT, and the report is never loaded).
+    # Already-deleted rows are left alone so the original deletion stays recorded
+    values = {"deleted_at": datetime.utcnow()}
+    if user_uuid:
+        values["deleted_by"] = user_uuid
+    deleted = db.execute(
+        update(Evaluation)
+        .where(Evaluation.id == eval_uuid, Evaluation.deleted_at.is_(None))
+        .values(**values)
+        .returning(Evaluation.id)
+    ).first()
     db.commit()
     
+    if deleted is None:
+        return False
+    
     logger.info(f"Soft-deleted evaluation {evaluation_id} by user {deleted_by}")
     
     return True
+
+
+def get_cached_insights(db: Session, report_hash: str) -> Optional[dict]:
+    """
+    Get LLM insights cached for a report content hash.
+    
+    Args:
+        db: Database session
+        report_hash: InsightsCache.compute_report_key of the report
+    
+    Returns:
+        Cached insights or None
+    """
+    entry = db.get(InsightsCache, report_hash)
+    return entry.insights if entry else None
+
+
+def save_cached_insights(db: Session, report_hash: str, insights: dict) -> None:
+    """
+    Cache LLM insights for a report content hash.
+    
+    First writer wins: if another request cached the same report meanwhile,
+    its entry is kept. Commits (or rolls back) on its own, so call it after
+    any other pending changes have been committed.
+    
+    Args:
+        db: Database session
+        report_hash: InsightsCache.compute_report_key of the report
+        insights: Insights to cache
+    """
+    db.add(InsightsCache(report_hash=report_hash, insights=insights))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
@@ -5,41 +5,63 @@
 # ============================================================================
 
 # Standard library
-import math
+import asyncio
+import hashlib
 import logging
 import uuid
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Union
 
 # Third-party
-import pandas as pd
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, defer
 from sqlmodel import select
 
 # Local - Core
 from app.core.dependencies import get_db, get_current_user
-from app.core.validators import validate_uuid
+from app.core.validators import validate_uuid, validate_uuids
 from app.core.config import settings
+from app.core.cache_middleware import etag_matches
+from app.core.responses import ORJSONResponse
 
 # Local - Services
-from app.datasets.repositories import get_dataset_by_id
-from app.generators.repositories import get_generator_by_id
-from app.services.llm.report_translator import ReportTranslator
+from app.datasets.loaders import read_dataset_file, resolve_dataset_path, sample_dataset_file
+from app.datasets.repositories import list_datasets_by_ids
+from app.generators.repositories import get_generator_by_id, list_generators_by_ids
+from app.services.llm.report_translator import get_report_translator
 from app.services.risk import RiskAssessor
-from .models import Evaluation
+from app.observability import track_insights_cache
+from .models import Evaluation, InsightsCache
+from app.datasets.models import Dataset
 from app.generators.models import Generator
+from app.jobs.models import Job
+from app.jobs.repositories import create_job, update_job_status
 
 
 # Local - Module
-from .quality_report import QualityReportGenerator
+from .quality_report import (
+    QualityReportGenerator,
+    get_report_pool,
+    run_summary_report,
+    submit_report_task
+)
 from .repositories import (
     get_evaluation,
     create_evaluation,
     list_evaluations_by_generator,
-    delete_evaluation
+    delete_evaluation,
+    get_cached_insights,
+    save_cached_insights
+)
+from .schemas import (
+    EvaluationRequest,
+    EvaluationResponse,
+    EvaluationSummaryResponse,
+    EvaluationQueuedResponse,
+    ComparisonRequest,
+    QuickEvaluationBatchRequest
 )
-from .schemas import EvaluationRequest, EvaluationResponse, ComparisonRequest
 
 # ============================================================================
 # SETUP
@@ -53,35 +75,226 @@ router = APIRouter(prefix="/evaluations", tags=["evaluations"])
 # ENDPOINTS
 # ============================================================================
 
-def sanitize_json_floats(obj):
+def _evaluation_model(
+    evaluation: Evaluation,
+    generator_id: Optional[str] = None
+) -> EvaluationResponse:
+    """
+    Build an EvaluationResponse from a stored evaluation without validation.
+    
+    The fields come straight from the database row, so model_construct skips
+    walking the (potentially large) report dict; FastAPI doesn't revalidate
+    model instances it is handed either. Listings of a single generator pass
+    its `generator_id` string so it isn't re-formatted for every row.
+    """
+    return EvaluationResponse.model_construct(
+        id=str(evaluation.id),
+        generator_id=generator_id or str(evaluation.generator_id),
+        dataset_id=str(evaluation.dataset_id),
+        status="completed",
+        report=evaluation.report,
+        created_at=evaluation.created_at
+    )
+
+
+def _evaluation_summary_model(
+    evaluation: Evaluation,
+    generator_id: Optional[str] = None
+) -> EvaluationSummaryResponse:
+    """Like `_evaluation_model`, for listings that leave the report out."""
+    return EvaluationSummaryResponse.model_construct(
+        id=str(evaluation.id),
+        generator_id=generator_id or str(evaluation.generator_id),
+        dataset_id=str(evaluation.dataset_id),
+        status="completed",
+        created_at=evaluation.created_at
+    )
+
+
+def _evaluation_response(
+    evaluation: Evaluation,
+    report: Dict[str, Any],
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[Dict[str, str]] = None
+) -> ORJSONResponse:
+    """Render an EvaluationResponse with orjson, bypassing response_model re-validation."""
+    return ORJSONResponse(
+        {**_evaluation_summary_dict(evaluation), "report": report},
+        status_code=status_code,
+        headers=headers
+    )
+
+
+def _evaluation_summary_dict(evaluation: Evaluation) -> Dict[str, Any]:
+    """An EvaluationSummaryResponse as a plain dict, ready for orjson."""
+    return {
+        "id": str(evaluation.id),
+        "generator_id": str(evaluation.generator_id),
+        "dataset_id": str(evaluation.dataset_id),
+        "status": "completed",
+        "created_at": evaluation.created_at
+    }
+
+
+# Evaluations fetched from the database per round trip when streaming a listing
+_STREAM_BATCH_SIZE = 100
+
+
+def _stream_evaluations(db: Session, statement, include_report: bool) -> Iterator[bytes]:
+    """
+    Yield a listing as a JSON array, one evaluation at a time.
+    
+    Rows are fetched in batches over a server-side cursor, so neither the
+    evaluations nor the response body are ever held in memory all at once.
+    A streamed body bypasses the route's response_model, so each item is
+    validated and serialized by its response model here instead.
+    """
+    response_model = EvaluationResponse if include_report else EvaluationSummaryResponse
+    statement = statement.execution_options(yield_per=_STREAM_BATCH_SIZE)
+    separator = b"["
+    for evaluation in db.execute(statement).scalars():
+        item = _evaluation_summary_dict(evaluation)
+        if include_report:
+            item["report"] = evaluation.report
+        yield separator + response_model.model_validate(item).model_dump_json().encode()
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+# Same policy CacheControlMiddleware applies to these routes; setting it here
+# makes the middleware leave the response (and our ETag) alone
+_REVALIDATE_HEADERS = {"Cache-Control": "private, no-cache, must-revalidate"}
+
+
+def _evaluation_etag(evaluation: Evaluation) -> str:
+    """ETag for a stored evaluation, without serializing its report."""
+    # Evaluations are never modified after creation, so the report hash
+    # persisted on write identifies the response body
+    report_hash = evaluation.artifact_hash or Evaluation.compute_report_hash(evaluation.report)
+    return f'W/"{report_hash}"'
+
+
+def _evaluation_list_etag(evaluations: List[Evaluation], include_report: bool) -> str:
+    """ETag for a list of stored evaluations, from their IDs and report hashes."""
+    # Summaries and full reports are different bodies, so they get different tags
+    digest = hashlib.blake2b(b"reports" if include_report else b"summaries", digest_size=16)
+    for evaluation in evaluations:
+        digest.update(f"{evaluation.id}:{evaluation.artifact_hash};".encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _not_modified(etag: str) -> Response:
+    """Empty 304 response for a client that already has the current body."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**_REVALIDATE_HEADERS, "ETag": etag})
+
+
+def _require_evaluable(generator: Generator) -> None:
+    """Reject generators that are not trained or have no synthetic output yet."""
+    # Check if generator has been trained
+    if generator.status != "completed":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Generator status is {generator.status}. Must be 'completed' to evaluate."
+        )
+    
+    # Check if synthetic data exists
+    if not generator.output_dataset_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Generator has no synthetic data output"
+        )
+
+
+async def _read_real_and_synthetic(
+    real_path: Path,
+    synth_path: Path,
+    columns: Optional[List[str]] = None
+):
     """
-    Recursively replace NaN, Infinity, and -Infinity with None (null in JSON).
-    PostgreSQL JSONB does not support NaN/Infinity.
+    Load the real and synthetic datasets concurrently, off the event loop.
+    
+    Goes through the dataset loader, so after the first parse each file is
+    read from its Parquet sidecar (or the in-process cache) instead of
+    re-tokenizing the CSV on every evaluation. `columns` projects both
+    datasets at load time.
     """
-    if isinstance(obj, float):
-        if math.isnan(obj) or math.isinf(obj):
-            return None
-        return obj
-    elif isinstance(obj, dict):
-        return {k: sanitize_json_floats(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [sanitize_json_floats(v) for v in obj]
-    return obj
+    return await asyncio.gather(
+        asyncio.to_thread(read_dataset_file, real_path, columns),
+        asyncio.to_thread(read_dataset_file, synth_path, columns)
+    )
 
 
-@router.get("", response_model=List[EvaluationResponse])
-@router.get("/", response_model=List[EvaluationResponse])
+def _summary_sample_rows(file_path: Path) -> Optional[int]:
+    """Rows to sample from a dataset for a quick summary report (None: all)."""
+    if file_path.stat().st_size > settings.quick_eval_stream_threshold_mb * 1024 * 1024:
+        return settings.quick_eval_sample_rows
+    return None
+
+
+def _read_for_summary(file_path: Path):
+    """
+    Load a dataset for a quick summary report.
+    
+    Files above QUICK_EVAL_STREAM_THRESHOLD_MB are streamed into a uniform
+    sample of QUICK_EVAL_SAMPLE_ROWS rows instead of loaded whole, so memory
+    stays bounded; the summary statistics are then estimated on the sample.
+    """
+    sample_rows = _summary_sample_rows(file_path)
+    if sample_rows is not None:
+        logger.info(f"Sampling {sample_rows} rows of {file_path} for quick evaluation")
+        return sample_dataset_file(file_path, sample_rows)
+    return read_dataset_file(file_path)
+
+
+def _summary_data_key(file_path: Path) -> tuple:
+    """Identifies what `_read_for_summary` returns for this version of a file."""
+    stat = file_path.stat()
+    return (str(file_path), stat.st_mtime_ns, stat.st_size, _summary_sample_rows(file_path))
+
+
+async def _summary_report(
+    real_data,
+    synthetic_data,
+    generator_id: str,
+    generator_type: str,
+    real_path: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Run a quick summary report off the event loop.
+    
+    Uses the shared evaluation workers, which stay warm between requests,
+    or a thread when they are disabled (EVAL_WORKERS=1). Given the real
+    dataset's path, real-side statistics are shared with earlier reports on
+    the same version of it (e.g. when comparing generators).
+    """
+    real_data_key = _summary_data_key(real_path) if real_path is not None else None
+    args = (real_data, synthetic_data, generator_id, generator_type, real_data_key)
+    if get_report_pool() is None:
+        return await asyncio.to_thread(run_summary_report, *args)
+    return await asyncio.wrap_future(submit_report_task(run_summary_report, *args))
+
+
+# Listings can leave out each evaluation's report (often kilobytes of JSON)
+_INCLUDE_REPORT = Query(True, description="Include each evaluation's full report")
+
+
+@router.get("", response_model=List[Union[EvaluationResponse, EvaluationSummaryResponse]])
+@router.get("/", response_model=List[Union[EvaluationResponse, EvaluationSummaryResponse]])
 def list_evaluations(
+    include_report: bool = _INCLUDE_REPORT,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
-) -> List[EvaluationResponse]:
+) -> StreamingResponse:
     """
     List all evaluations for the current user.
     
-    Returns evaluations where the user created the generator being evaluated.
+    Returns evaluations where the user created the generator being evaluated,
+    newest first, streamed as they are read. With `include_report=false` the
+    report column isn't even read.
     """
- 
-    
+    # The rows are read while the body streams, on the request's session:
+    # FastAPI closes yield dependencies after the response is sent (again
+    # since 0.118, which requirements-prod.txt pins)
     # Join evaluations with generators to filter by generator owner
     # Exclude soft-deleted evaluations (where deleted_at is set)
     statement = (
@@ -89,20 +302,15 @@ def list_evaluations(
         .join(Generator, Evaluation.generator_id == Generator.id)
         .where(Generator.created_by == current_user.id)
         .where(Evaluation.deleted_at == None)  # Filter out soft-deleted
+        .order_by(Evaluation.created_at.desc())
+    )
+    if not include_report:
+        statement = statement.options(defer(Evaluation.report))
+    
+    return StreamingResponse(
+        _stream_evaluations(db, statement, include_report),
+        media_type="application/json"
     )
-    evaluations = db.exec(statement).all()
-    
-    return [
-        EvaluationResponse(
-            id=str(e.id),
-            generator_id=str(e.generator_id),
-            dataset_id=str(e.dataset_id),
-            status="completed",
-            report=e.report,
-            created_at=e.created_at
-        )
-        for e in evaluations
-    ]
 
 
 @router.get("/{evaluation_id}/details")
@@ -115,23 +323,26 @@ def get_evaluation_details(
     Get evaluation with generator and dataset in a single call.
     OPTIMIZATION: Reduces multiple API calls to 1.
     """
-    # Get evaluation
-    stmt = select(Evaluation).where(Evaluation.id == evaluation_id)
-    evaluation = db.exec(stmt).first()
+    # Validate UUID format
+    eval_uuid = validate_uuid(evaluation_id, "evaluation_id")
     
-    if not evaluation:
+    # Get evaluation with its generator and dataset in one query
+    stmt = (
+        select(Evaluation, Generator, Dataset)
+        .outerjoin(Generator, Generator.id == Evaluation.generator_id)
+        .outerjoin(Dataset, Dataset.id == Evaluation.dataset_id)
+        .where(Evaluation.id == eval_uuid)
+    )
+    row = db.exec(stmt).first()
+    
+    if not row:
         raise HTTPException(status_code=404, detail="Evaluation not found")
+    evaluation, generator, dataset = row
     
     # Verify user owns the generator
-    generator = get_generator_by_id(db, str(evaluation.generator_id))
     if not generator or generator.created_by != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    # Get dataset
-    dataset = None
-    if evaluation.dataset_id:
-        dataset = get_dataset_by_id(db, str(evaluation.dataset_id))
-    
     return {
         "evaluation": evaluation,
         "generator": generator,
@@ -139,12 +350,18 @@ def get_evaluation_details(
     }
 
 
-@router.post("/run", response_model=EvaluationResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/run",
+    response_model=EvaluationQueuedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={status.HTTP_201_CREATED: {"model": EvaluationResponse}}
+)
 async def run_evaluation(
     request: EvaluationRequest,
+    sync: bool = Query(False, description="Run inline and return the report (201) instead of queueing"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
-) -> EvaluationResponse:
+) -> ORJSONResponse:
     """
     Run comprehensive quality evaluation on generated synthetic data.
     
@@ -153,13 +370,19 @@ async def run_evaluation(
     - ML utility (can you train good models?)
     - Privacy leakage risks
     
+    The evaluation is queued to a background worker and 202 is returned at
+    once, with the ID it will be saved under and a job to poll
+    (GET /jobs/{job_id}). With `sync=true` it runs inline instead.
+    
     Args:
         request: Evaluation configuration
+        sync: Run inline instead of queueing
         db: Database session
         current_user: Authenticated user
     
     Returns:
-        Comprehensive quality report with scores and recommendations
+        The queued evaluation's IDs, or (sync) the comprehensive quality
+        report with scores and recommendations
     """
     logger.info(f"Running evaluation for generator {request.generator_id}")
     
@@ -175,46 +398,43 @@ async def run_evaluation(
             detail=f"Generator {request.generator_id} not found"
         )
     
-    # Load dataset
-    dataset = get_dataset_by_id(db, request.dataset_id)
+    # Load the real dataset and the generator's output dataset in one query
+    datasets = list_datasets_by_ids(db, [request.dataset_id, generator.output_dataset_id])
+    dataset = datasets.get(str(uuid.UUID(request.dataset_id)))
     if not dataset:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Dataset {request.dataset_id} not found"
         )
     
-    # Check if generator has been trained
-    if generator.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Generator status is {generator.status}. Must be 'completed' to evaluate."
-        )
+    _require_evaluable(generator)
     
-    # Check if synthetic data exists
-    if not generator.output_dataset_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Generator has no synthetic data output"
-        )
+    if not sync:
+        # Fail now rather than in the worker when there is nothing to compare
+        if str(generator.output_dataset_id) not in datasets:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Output dataset {generator.output_dataset_id} not found"
+            )
+        return _queue_evaluation(db, request, generator, dataset, current_user)
     
     try:
-        # Load real data
-        if dataset.file_path:
-            real_data = pd.read_csv(dataset.file_path)
-        else:
-            file_path = Path(settings.upload_dir) / dataset.original_filename
-            real_data = pd.read_csv(file_path)
-        
-        # Load synthetic data from output dataset
-        output_dataset = get_dataset_by_id(db, str(generator.output_dataset_id))
+        # Synthetic data lives in the generator's output dataset
+        output_dataset = datasets.get(str(generator.output_dataset_id))
         if not output_dataset:
             raise FileNotFoundError(f"Output dataset {generator.output_dataset_id} not found")
         
-        if output_dataset.file_path:
-            synthetic_data = pd.read_csv(output_dataset.file_path)
-        else:
-            synth_file_path = Path(settings.upload_dir) / output_dataset.original_filename
-            synthetic_data = pd.read_csv(synth_file_path)
+        # Load real and synthetic data, only the columns the report will use
+        needed_columns = QualityReportGenerator.required_columns(
+            target_column=request.target_column,
+            include_statistical=request.include_statistical,
+            include_ml_utility=request.include_ml_utility,
+            include_privacy=request.include_privacy,
+            statistical_columns=request.statistical_columns
+        )
+        real_data, synthetic_data = await _read_real_and_synthetic(
+            resolve_dataset_path(dataset), resolve_dataset_path(output_dataset), needed_columns
+        )
         
         # Generate quality report
         report_generator = QualityReportGenerator(
@@ -224,7 +444,10 @@ async def run_evaluation(
             generator_type=generator.type
         )
         
-        report = report_generator.generate_full_report(
+        # Report generation is seconds to minutes of pandas/sklearn work;
+        # run it in a thread so the event loop keeps serving requests
+        report = await asyncio.to_thread(
+            report_generator.generate_full_report,
             target_column=request.target_column,
             sensitive_columns=request.sensitive_columns,
             include_statistical=request.include_statistical,
@@ -233,9 +456,6 @@ async def run_evaluation(
             statistical_columns=request.statistical_columns
         )
         
-        # Sanitize report for JSON compliance (remove NaN/Infinity)
-        report = sanitize_json_floats(report)
-        
         # Save evaluation to database
         evaluation = create_evaluation(
             db=db,
@@ -247,14 +467,7 @@ async def run_evaluation(
         
         logger.info(f"✓ Evaluation {evaluation.id} completed: {report['overall_assessment']['overall_quality']}")
         
-        return EvaluationResponse(
-            id=str(evaluation.id),
-            generator_id=str(evaluation.generator_id),
-            dataset_id=str(evaluation.dataset_id),
-            status="completed",
-            report=report,
-            created_at=evaluation.created_at
-        )
+        return _evaluation_response(evaluation, report, status.HTTP_201_CREATED)
         
     except FileNotFoundError as e:
         logger.error(f"Data file not found: {e}")
@@ -270,52 +483,116 @@ async def run_evaluation(
         )
 
 
+def _queue_evaluation(
+    db: Session,
+    request: EvaluationRequest,
+    generator: Generator,
+    dataset: Dataset,
+    current_user
+) -> ORJSONResponse:
+    """Queue a full evaluation to a Celery worker, tracked by a Job."""
+    job = create_job(db, Job(
+        project_id=dataset.project_id,
+        initiated_by=current_user.id,
+        dataset_id=dataset.id,
+        generator_id=generator.id,
+        type="evaluation",
+        status="queued"
+    ))
+    evaluation_id = str(uuid.uuid4())
+    
+    # Dispatch to Celery (lazy import to avoid circular import)
+    from app.tasks.evaluations import run_evaluation_task
+    try:
+        task = run_evaluation_task.delay(
+            evaluation_id, str(job.id), request.model_dump(), str(current_user.id)
+        )
+    except Exception as e:
+        logger.error(f"Could not queue evaluation: {e!r}")
+        update_job_status(db, str(job.id), "failed", error_message=repr(e)[:500])
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Evaluation queue unavailable; retry later or use ?sync=true"
+        )
+    
+    job.celery_task_id = task.id
+    db.add(job)
+    db.commit()
+    
+    logger.info(f"✓ Evaluation {evaluation_id} queued (Job {job.id})")
+    
+    return ORJSONResponse(
+        EvaluationQueuedResponse(
+            message="Evaluation queued",
+            evaluation_id=evaluation_id,
+            job_id=str(job.id),
+            task_id=task.id
+        ).model_dump(),
+        status_code=status.HTTP_202_ACCEPTED
+    )
+
+
 @router.get("/{evaluation_id}", response_model=EvaluationResponse)
 def get_evaluation_endpoint(
     evaluation_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
-) -> EvaluationResponse:
+) -> Response:
     """Get a specific evaluation by ID."""
     # Validate UUID format
     eval_uuid = validate_uuid(evaluation_id, "evaluation_id")
     
-    evaluation = get_evaluation(db, str(eval_uuid))
-    if not evaluation:
+    # The evaluation and its owner in one query, leaving the report out:
+    # it is only read once the caller is authorized and actually needs it
+    row = db.exec(
+        select(Evaluation, Generator.created_by)
+        .outerjoin(Generator, Generator.id == Evaluation.generator_id)
+        .where(Evaluation.id == eval_uuid)
+        .options(defer(Evaluation.report))
+    ).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Evaluation {evaluation_id} not found"
         )
+    evaluation, owner_id = row
     
     # SECURITY: Ownership check - verify user owns the generator
-    generator = get_generator_by_id(db, str(evaluation.generator_id))
-    if not generator or generator.created_by != current_user.id:
+    if owner_id is None or owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to view this evaluation"
         )
     
-    return EvaluationResponse(
-        id=str(evaluation.id),
-        generator_id=str(evaluation.generator_id),
-        dataset_id=str(evaluation.dataset_id),
-        status="completed",
-        report=evaluation.report,
-        created_at=evaluation.created_at
-    )
+    # Pollers that already have the report get a 304 before it is even loaded
+    etag = _evaluation_etag(evaluation)
+    if etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    return _evaluation_response(evaluation, evaluation.report, headers={**_REVALIDATE_HEADERS, "ETag": etag})
 
 
-@router.get("/generator/{generator_id}", response_model=List[EvaluationResponse])
+@router.get(
+    "/generator/{generator_id}",
+    response_model=List[Union[EvaluationResponse, EvaluationSummaryResponse]]
+)
 async def list_generator_evaluations(
     generator_id: str,
+    request: Request,
+    response: Response,
+    include_report: bool = _INCLUDE_REPORT,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
-) -> List[EvaluationResponse]:
+) -> List[Union[EvaluationResponse, EvaluationSummaryResponse]]:
     """
     List all evaluations for a specific generator.
     
     Args:
         generator_id: Generator ID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag)
+        include_report: Include each evaluation's report
         db: Database session
         current_user: Authenticated user
     
@@ -333,22 +610,118 @@ async def list_generator_evaluations(
             detail="Not authorized to view evaluations for this generator"
         )
     
-    evaluations = list_evaluations_by_generator(db, generator_id)
+    # Check the ETag before loading any reports
+    evaluations = list_evaluations_by_generator(db, generator_id, include_report=False)
     
     # Filter out soft-deleted evaluations
     active_evaluations = [e for e in evaluations if e.deleted_at is None]
     
-    return [
-        EvaluationResponse(
-            id=str(e.id),
-            generator_id=str(e.generator_id),
-            dataset_id=str(e.dataset_id),
-            status="completed",
-            report=e.report,
-            created_at=e.created_at
+    etag = _evaluation_list_etag(active_evaluations, include_report)
+    if etag_matches(request, etag):
+        return _not_modified(etag)
+    response.headers.update({**_REVALIDATE_HEADERS, "ETag": etag})
+    
+    generator_id = str(generator.id)
+    if not include_report:
+        return [_evaluation_summary_model(e, generator_id) for e in active_evaluations]
+    
+    # Changed since the client last saw it: load the reports in one query
+    # (touching the deferred .report per row would issue one query each)
+    evaluations = list_evaluations_by_generator(db, generator_id)
+    return [_evaluation_model(e, generator_id) for e in evaluations if e.deleted_at is None]
+
+
+# Registered before /quick/{generator_id}, which would otherwise match "batch"
+@router.post("/quick/batch", response_model=List[Dict[str, Any]])
+async def quick_evaluation_batch(
+    request: QuickEvaluationBatchRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+) -> ORJSONResponse:
+    """
+    Run quick statistical evaluations for several generators at once.
+    
+    Each dataset file is loaded once however many of the generators share
+    it, and the reports run concurrently on the shared evaluation workers.
+    
+    Args:
+        request: Generator IDs to evaluate
+        db: Database session
+        current_user: Authenticated user
+    
+    Returns:
+        Summary reports in the order of `generator_ids`. A generator whose
+        evaluation failed gets {"generator_id", "status": "error", "error"}
+        instead, so one bad dataset doesn't fail the whole batch.
+    """
+    generator_ids = request.generator_ids
+    logger.info(f"Running quick evaluation for {len(generator_ids)} generators")
+    
+    # Validate UUIDs; lookups below are keyed by canonical string form
+    generator_keys = dict(zip(generator_ids, map(str, validate_uuids(generator_ids, "generator_id"))))
+    
+    if len(generator_ids) > 20:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Maximum 20 generators can be evaluated at once"
         )
-        for e in active_evaluations
+    
+    # Load all generators, then all their datasets, in one query each
+    generators = list_generators_by_ids(db, generator_ids)
+    missing = [
+        generator_id for generator_id in generator_ids
+        if generator_keys[generator_id] not in generators
     ]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Generator {', '.join(missing)} not found"
+        )
+    
+    for generator in generators.values():
+        # SECURITY: Ownership check - verify user owns every generator
+        if generator.created_by != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Not authorized to evaluate generator {generator.id}"
+            )
+        _require_evaluable(generator)
+    
+    datasets = list_datasets_by_ids(
+        db,
+        [ds_id for g in generators.values() for ds_id in (g.dataset_id, g.output_dataset_id)]
+    )
+    
+    # One load per distinct file, shared by every generator that needs it
+    loads: Dict[Path, asyncio.Task] = {}
+    
+    def load(dataset) -> asyncio.Task:
+        path = resolve_dataset_path(dataset)
+        if path not in loads:
+            loads[path] = asyncio.create_task(asyncio.to_thread(_read_for_summary, path))
+        return loads[path]
+    
+    async def evaluate(generator_id: str) -> Dict[str, Any]:
+        generator = generators[generator_keys[generator_id]]
+        try:
+            dataset = datasets.get(str(generator.dataset_id))
+            output_dataset = datasets.get(str(generator.output_dataset_id))
+            if not dataset or not output_dataset:
+                raise FileNotFoundError(f"Datasets for generator {generator_id} not found")
+            real_data, synthetic_data = await asyncio.gather(load(dataset), load(output_dataset))
+            return await _summary_report(
+                real_data, synthetic_data, generator_id, generator.type, resolve_dataset_path(dataset)
+            )
+        except Exception as e:
+            logger.error(f"Quick evaluation of generator {generator_id} failed: {e}")
+            return {"generator_id": generator_id, "status": "error", "error": str(e)}
+    
+    unique_ids = list(dict.fromkeys(generator_ids))
+    summaries = dict(zip(unique_ids, await asyncio.gather(*map(evaluate, unique_ids))))
+    
+    logger.info(f"✓ Quick evaluation complete for {len(unique_ids)} generators")
+    
+    return ORJSONResponse([summaries[generator_id] for generator_id in generator_ids])
 
 
 @router.post("/quick/{generator_id}", response_model=Dict[str, Any])
@@ -356,7 +729,7 @@ async def quick_evaluation(
     generator_id: str,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Run quick statistical evaluation (no ML utility or privacy tests).
     
@@ -383,49 +756,30 @@ async def quick_evaluation(
             detail=f"Generator {generator_id} not found"
         )
     
-    if generator.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Generator status is {generator.status}. Must be 'completed' to evaluate."
-        )
-    
-    if not generator.output_dataset_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Generator has no synthetic data output"
-        )
+    _require_evaluable(generator)
     
     try:
-        # Load data
-        dataset = get_dataset_by_id(db, str(generator.dataset_id))
-        if dataset.file_path:
-            real_data = pd.read_csv(dataset.file_path)
-        else:
-            real_data = pd.read_csv(Path("uploads") / dataset.original_filename)
-        
-        # Load synthetic data
-        output_dataset = get_dataset_by_id(db, str(generator.output_dataset_id))
+        datasets = list_datasets_by_ids(db, [generator.dataset_id, generator.output_dataset_id])
+        dataset = datasets.get(str(generator.dataset_id))
+        output_dataset = datasets.get(str(generator.output_dataset_id))
         if not output_dataset:
             raise FileNotFoundError(f"Output dataset {generator.output_dataset_id} not found")
         
-        if output_dataset.file_path:
-            synthetic_data = pd.read_csv(output_dataset.file_path)
-        else:
-            synthetic_data = pd.read_csv(Path("uploads") / output_dataset.original_filename)
+        # Load real and synthetic data
+        real_path = resolve_dataset_path(dataset)
+        real_data, synthetic_data = await asyncio.gather(
+            asyncio.to_thread(_read_for_summary, real_path),
+            asyncio.to_thread(_read_for_summary, resolve_dataset_path(output_dataset))
+        )
         
         # Quick report
-        report_generator = QualityReportGenerator(
-            real_data=real_data,
-            synthetic_data=synthetic_data,
-            generator_id=generator_id,
-            generator_type=generator.type
+        summary = await _summary_report(
+            real_data, synthetic_data, generator_id, generator.type, real_path
         )
         
-        summary = report_generator.generate_summary_report()
-        
         logger.info(f"✓ Quick evaluation complete: {summary['quality_level']}")
         
-        return summary
+        return ORJSONResponse(summary)
         
     except Exception as e:
         logger.error(f"Quick evaluation failed: {e}")
@@ -435,6 +789,18 @@ async def quick_evaluation(
         )
 
 
+def _share_insights(db: Session, key: str, insights: Dict[str, Any]) -> None:
+    """Cache LLM output under its content key for identical later requests."""
+    # Rule-based fallbacks aren't worth sharing; the LLM may be back next time
+    if insights.get("_metadata", {}).get("provider") == "fallback":
+        return
+    try:
+        save_cached_insights(db, key, insights)
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Could not cache insights: {e}")
+
+
 @router.post("/{evaluation_id}/explain", response_model=Dict[str, Any])
 async def explain_evaluation(
     evaluation_id: str,
@@ -463,8 +829,8 @@ async def explain_evaluation(
     # Validate UUID
     validate_uuid(evaluation_id, "evaluation_id")
     
-    # Get evaluation
-    evaluation = get_evaluation(db, evaluation_id)
+    # Get evaluation; the report is only read if insights must be generated
+    evaluation = get_evaluation(db, evaluation_id, include_report=False)
     if not evaluation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -476,10 +842,21 @@ async def explain_evaluation(
         logger.info("Returning cached insights")
         return evaluation.insights
     
+    # Identical reports (e.g. a generator re-run on the same data) share insights
+    report_key = InsightsCache.compute_report_key(evaluation.report)
+    insights = get_cached_insights(db, report_key)
+    track_insights_cache(hit=insights is not None)
+    if insights is not None:
+        logger.info(f"Reusing insights cached for report {report_key}")
+        evaluation.insights = insights
+        db.commit()
+        return insights
+    
     try:
         # Generate insights using LLM
-        translator = ReportTranslator()
+        translator = get_report_translator()
         insights = await translator.translate_evaluation(evaluation.report)
+        _share_insights(db, report_key, insights)
         
         # Save insights to database (if insights column exists)
         try:
@@ -522,9 +899,8 @@ async def compare_evaluations(
     evaluation_ids = request.evaluation_ids
     logger.info(f"Comparing {len(evaluation_ids)} evaluations")
     
-    # Validate UUIDs
-    for eval_id in evaluation_ids:
-        validate_uuid(eval_id, "evaluation_id")
+    # Validate UUIDs; lookups below are keyed by canonical string form
+    eval_keys = [str(u) for u in validate_uuids(evaluation_ids, "evaluation_id")]
     
     if len(evaluation_ids) < 2:
         raise HTTPException(
@@ -538,29 +914,46 @@ async def compare_evaluations(
             detail="Maximum 5 evaluations can be compared at once"
         )
     
-    # Load all evaluations
+    # All evaluations with their generator's type, in one query
+    rows = db.exec(
+        select(Evaluation, Generator.type)
+        .outerjoin(Generator, Generator.id == Evaluation.generator_id)
+        .where(Evaluation.id.in_({uuid.UUID(key) for key in eval_keys}))
+    ).all()
+    evaluations = {str(evaluation.id): (evaluation, generator_type) for evaluation, generator_type in rows}
+    missing = [
+        eval_id for eval_id, key in zip(evaluation_ids, eval_keys)
+        if key not in evaluations
+    ]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Evaluation {', '.join(missing)} not found"
+        )
+    
     evaluations_data = []
-    for eval_id in evaluation_ids:
-        evaluation = get_evaluation(db, eval_id)
-        if not evaluation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Evaluation {eval_id} not found"
-            )
-        
-        # Get generator info
-        generator = get_generator_by_id(db, str(evaluation.generator_id))
+    for key in eval_keys:
+        evaluation, generator_type = evaluations[key]
         
         evaluations_data.append({
             "evaluation_id": str(evaluation.id),
-            "generator_type": generator.type if generator else "unknown",
+            "generator_type": generator_type or "unknown",
             "metrics": evaluation.report
         })
     
+    # Comparing the same reports again reuses the earlier comparison
+    comparison_key = InsightsCache.compute_comparison_key(evaluations_data)
+    comparison = get_cached_insights(db, comparison_key)
+    track_insights_cache(hit=comparison is not None)
+    if comparison is not None:
+        logger.info(f"Reusing comparison cached for {comparison_key}")
+        return comparison
+    
     try:
         # Generate comparison using LLM
-        translator = ReportTranslator()
+        translator = get_report_translator()
         comparison = await translator.compare_evaluations(evaluations_data)
+        _share_insights(db, comparison_key, comparison)
         
         logger.info("✓ Comparison generated successfully")
         return comparison
@@ -667,8 +1060,8 @@ async def get_risk_report(
     # Validate UUID
     validate_uuid(evaluation_id, "evaluation_id")
     
-    # Get evaluation
-    evaluation = get_evaluation(db, evaluation_id)
+    # Get evaluation (only its stored risk assessment is needed)
+    evaluation = get_evaluation(db, evaluation_id, include_report=False)
     if not evaluation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -707,19 +1100,23 @@ def delete_evaluation_endpoint(
     logger.info(f"Deleting evaluation {evaluation_id}")
     
     # Validate UUID
-    validate_uuid(evaluation_id, "evaluation_id")
+    eval_uuid = validate_uuid(evaluation_id, "evaluation_id")
     
-    # Get evaluation first to check ownership
-    evaluation = get_evaluation(db, evaluation_id)
-    if not evaluation:
+    # Check ownership first: the evaluation's owner, without loading the row
+    row = db.exec(
+        select(Evaluation.id, Generator.created_by)
+        .outerjoin(Generator, Generator.id == Evaluation.generator_id)
+        .where(Evaluation.id == eval_uuid, Evaluation.deleted_at.is_(None))
+    ).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Evaluation {evaluation_id} not found"
         )
     
     # Verify user owns the generator
-    generator = get_generator_by_id(db, str(evaluation.generator_id))
-    if not generator or generator.created_by != current_user.id:
+    owner_id = row[1]
+    if owner_id is None or owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this evaluation"
@@ -29,6 +29,11 @@ class EvaluationRequest(BaseModel):
     statistical_columns: Optional[List[str]] = None
 
 
+class QuickEvaluationBatchRequest(BaseModel):
+    """Request model for quick evaluation of several generators."""
+    generator_ids: List[str]
+
+
 # ============================================================================
 # RESPONSE SCHEMAS
 # ============================================================================
@@ -45,6 +50,23 @@ class EvaluationResponse(BaseModel):
     created_at: Optional[datetime] = None
 
 
+class EvaluationSummaryResponse(BaseModel):
+    """Response model for an evaluation listed without its report."""
+    id: str
+    generator_id: str
+    dataset_id: str
+    status: str
+    created_at: Optional[datetime] = None
+
+
+class EvaluationQueuedResponse(BaseModel):
+    """Response for an evaluation queued to run in the background."""
+    message: str
+    evaluation_id: str
+    job_id: str
+    task_id: Optional[str] = None
+
+
 class EvaluationListResponse(BaseModel):
     """Response for list of evaluations."""
     evaluations: List[EvaluationResponse]
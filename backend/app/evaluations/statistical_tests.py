@@ -7,7 +7,9 @@ matches the real data distribution.
 
 # Standard library
 import logging
-from typing import Dict, Any, List, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Hashable, List, Optional, Tuple
 
 # Third-party
 import pandas as pd
@@ -18,6 +20,143 @@ from scipy.stats import ks_2samp, chi2_contingency, wasserstein_distance
 
 logger = logging.getLogger(__name__)
 
+# Numba computes the KS statistics and Wasserstein distances of all numerical
+# columns in one parallel pass
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available, KS and Wasserstein tests will use scipy per column")
+
+# Real datasets whose profiles are kept (per process) between evaluations
+REAL_PROFILE_CACHE_SIZE = 4
+
+# Sample size above which ks_2samp's default method uses the asymptotic
+# p-value, which only needs the statistic; exact p-values stay with scipy
+_KS_EXACT_MAX_N = 10000
+
+
+def arr_to_jsonable(values) -> List[Any]:
+    """
+    Convert a numeric array (or Series) to a JSON-safe list of floats.
+    
+    NaN and +/-Infinity become None in one vectorized pass, so the values are
+    plain JSON-safe floats whichever encoder ends up writing the report.
+    """
+    arr = np.asarray(values, dtype=float)
+    return np.where(np.isfinite(arr), arr, None).tolist()
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: numerical columns may hold +/-inf, which it assumes away
+    @njit(parallel=True, cache=True)
+    def _col_stats(real, synth, real_counts, synth_counts, out):
+        """
+        Fill `out` with each column's Wasserstein distance and KS statistic.
+        
+        Rows of `real` / `synth` are columns sorted ascending, with their
+        `*_counts` non-missing values first; `out[c]` gets (distance,
+        statistic) for column c, NaN for empty columns.
+        """
+        for c in prange(real.shape[0]):
+            n = real_counts[c]
+            m = synth_counts[c]
+            if n == 0 or m == 0:
+                out[c, 0] = np.nan
+                out[c, 1] = np.nan
+                continue
+            # Walk both empirical CDFs through the distinct values: integrate
+            # |F_real - F_synth| between them and track its maximum
+            i = 0
+            j = 0
+            prev = min(real[c, 0], synth[c, 0])
+            total = 0.0
+            statistic = 0.0
+            while i < n or j < m:
+                if j >= m or (i < n and real[c, i] <= synth[c, j]):
+                    x = real[c, i]
+                else:
+                    x = synth[c, j]
+                total += abs(i / n - j / m) * (x - prev)
+                while i < n and real[c, i] == x:
+                    i += 1
+                while j < m and synth[c, j] == x:
+                    j += 1
+                statistic = max(statistic, abs(i / n - j / m))
+                prev = x
+            out[c, 0] = total
+            out[c, 1] = statistic
+
+
+def warm_up() -> None:
+    """
+    Compile the numba column-statistics kernel for the inputs it is called with.
+    
+    Like privacy_tests.warm_up, call this from the main thread.
+    """
+    if NUMBA_AVAILABLE:
+        _col_stats.compile("(float64[:, ::1], float64[:, ::1], int64[::1], int64[::1], float64[:, ::1])")
+
+
+def _sorted_columns(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Columns of `data` as sorted rows (missing values last) and their non-missing counts."""
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan).T
+    return np.ascontiguousarray(np.sort(values, axis=1)), (~np.isnan(values)).sum(axis=1)
+
+
+class RealDataProfile:
+    """
+    Real-data-only intermediates of the statistical tests.
+    
+    Comparing several generators against the same dataset recomputes the
+    same real-side value counts and correlation matrix every time; a profile
+    computes each once and is shared by every evaluator given the same key.
+    """
+    
+    def __init__(self):
+        self._value_counts: Dict[str, pd.Series] = {}
+        self._correlations: Dict[Tuple[str, ...], pd.DataFrame] = {}
+    
+    def value_counts(self, real_data: pd.DataFrame, column: str) -> pd.Series:
+        """Counts of the non-null values of a real column."""
+        counts = self._value_counts.get(column)
+        if counts is None:
+            counts = self._value_counts[column] = real_data[column].value_counts()
+        return counts
+    
+    def correlation(self, real_numerical: pd.DataFrame) -> pd.DataFrame:
+        """Correlation matrix of the given real numerical columns."""
+        key = tuple(real_numerical.columns)
+        corr = self._correlations.get(key)
+        if corr is None:
+            corr = self._correlations[key] = real_numerical.corr()
+        return corr
+
+
+_real_profiles: "OrderedDict[Hashable, RealDataProfile]" = OrderedDict()
+_real_profiles_lock = threading.Lock()
+
+
+def real_data_profile(key: Optional[Hashable]) -> RealDataProfile:
+    """
+    Shared profile for the real dataset identified by `key`.
+    
+    The key must change whenever the data does (e.g. file path, mtime and
+    size). Without a key the profile is private to the caller.
+    """
+    if key is None:
+        return RealDataProfile()
+    with _real_profiles_lock:
+        profile = _real_profiles.get(key)
+        if profile is None:
+            profile = _real_profiles[key] = RealDataProfile()
+            while len(_real_profiles) > REAL_PROFILE_CACHE_SIZE:
+                _real_profiles.popitem(last=False)
+        else:
+            _real_profiles.move_to_end(key)
+        return profile
+
 
 class StatisticalEvaluator:
     """
@@ -31,16 +170,24 @@ class StatisticalEvaluator:
     - Correlation comparison
     """
     
-    def __init__(self, real_data: pd.DataFrame, synthetic_data: pd.DataFrame):
+    def __init__(
+        self,
+        real_data: pd.DataFrame,
+        synthetic_data: pd.DataFrame,
+        real_data_key: Optional[Hashable] = None
+    ):
         """
         Initialize evaluator with real and synthetic datasets.
         
         Args:
             real_data: Original real dataset
             synthetic_data: Generated synthetic dataset
+            real_data_key: Identifies this version of the real dataset, so
+                real-side statistics are shared with other evaluations of it
         """
         self.real_data = real_data
         self.synthetic_data = synthetic_data
+        self.real_profile = real_data_profile(real_data_key)
         
         # Ensure same columns (with warning for dropped columns)
         real_cols = set(real_data.columns)
@@ -60,7 +207,11 @@ class StatisticalEvaluator:
         
         logger.info(f"Initialized StatisticalEvaluator with {len(common_cols)} columns")
     
-    def kolmogorov_smirnov_test(self, column: str) -> Dict[str, Any]:
+    def kolmogorov_smirnov_test(
+        self,
+        column: str,
+        result: Optional[Tuple[float, float]] = None
+    ) -> Dict[str, Any]:
         """
         Perform Kolmogorov-Smirnov test for numerical column.
         
@@ -68,6 +219,8 @@ class StatisticalEvaluator:
         
         Args:
             column: Column name to test
+            result: (statistic, p_value) already computed by
+                numerical_column_stats (optional)
         
         Returns:
             Dictionary with statistic, p-value, and interpretation
@@ -87,7 +240,7 @@ class StatisticalEvaluator:
                 "passed": False
             }
         
-        statistic, p_value = ks_2samp(real_col, synth_col)
+        statistic, p_value = result if result is not None else ks_2samp(real_col, synth_col)
         
         # Interpretation
         if p_value > 0.05:
@@ -140,7 +293,7 @@ class StatisticalEvaluator:
         # Check if categorical or numerical
         if real_col.dtype == 'object' or real_col.dtype.name == 'category':
             # Categorical: use value counts
-            real_counts = real_col.value_counts()
+            real_counts = self.real_profile.value_counts(self.real_data, column)
             synth_counts = synth_col.value_counts()
             
             # Align categories
@@ -184,7 +337,51 @@ class StatisticalEvaluator:
             "passed": bool(p_value > 0.05)
         }
     
-    def wasserstein_distance_test(self, column: str) -> Dict[str, Any]:
+    def _column_stats(self, columns: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run the numba kernel: (distance, statistic) per column, and the non-missing counts."""
+        real_sorted, real_counts = _sorted_columns(self.real_data[columns])
+        synth_sorted, synth_counts = _sorted_columns(self.synthetic_data[columns])
+        out = np.empty((len(columns), 2))
+        _col_stats(real_sorted, synth_sorted, real_counts, synth_counts, out)
+        return out, real_counts, synth_counts
+    
+    def numerical_column_stats(
+        self,
+        columns: List[str]
+    ) -> Tuple[Dict[str, Tuple[float, float]], Dict[str, float]]:
+        """
+        Calculate KS and Wasserstein results for several numerical columns at once.
+        
+        Each column is sorted once and both statistics come from one pass over
+        it. KS p-values are computed here (batched) where ks_2samp would use
+        the asymptotic distribution; smaller columns are left out of the KS
+        results so the test computes their exact p-value itself.
+        
+        Args:
+            columns: Numerical column names
+        
+        Returns:
+            Tuple of (column -> (KS statistic, p-value), column -> Wasserstein
+            distance); empty if numba is unavailable
+        """
+        if not NUMBA_AVAILABLE or not columns:
+            return {}, {}
+        
+        out, real_counts, synth_counts = self._column_stats(columns)
+        
+        # Same p-value as ks_2samp(method='auto') for these sample sizes
+        asymptotic = (
+            (np.maximum(real_counts, synth_counts) > _KS_EXACT_MAX_N)
+            & (np.minimum(real_counts, synth_counts) > 0)
+        )
+        n, m = real_counts[asymptotic], synth_counts[asymptotic]
+        statistics = out[asymptotic, 1]
+        p_values = np.clip(stats.kstwo.sf(statistics, np.round(n * m / (n + m))), 0, 1)
+        ks_columns = [column for column, is_asymptotic in zip(columns, asymptotic) if is_asymptotic]
+        ks_results = dict(zip(ks_columns, zip(statistics.tolist(), p_values.tolist())))
+        return ks_results, dict(zip(columns, out[:, 0].tolist()))
+    
+    def wasserstein_distance_test(self, column: str, distance: Optional[float] = None) -> Dict[str, Any]:
         """
         Calculate Wasserstein distance (Earth Mover's Distance) for numerical column.
         
@@ -193,6 +390,7 @@ class StatisticalEvaluator:
         
         Args:
             column: Column name to test
+            distance: Distance already computed by wasserstein_distances (optional)
         
         Returns:
             Dictionary with distance and interpretation
@@ -211,7 +409,11 @@ class StatisticalEvaluator:
                 "interpretation": "SKIP: Insufficient data for statistical test"
             }
         
-        distance = wasserstein_distance(real_col, synth_col)
+        if distance is None:
+            if NUMBA_AVAILABLE:
+                distance = self._column_stats([column])[0][0, 0]
+            else:
+                distance = wasserstein_distance(real_col, synth_col)
         
         # Normalize by data range
         data_range = real_col.max() - real_col.min()
@@ -309,16 +511,22 @@ class StatisticalEvaluator:
             "interpretation": interpretation
         }
     
-    def correlation_comparison(self) -> Dict[str, Any]:
+    def correlation_comparison(self, columns: List[str] = None) -> Dict[str, Any]:
         """
         Compare correlation matrices between real and synthetic data.
         
+        Args:
+            columns: Numerical columns to compare (optional). If None, uses all.
+        
         Returns:
             Dictionary with correlation difference metrics
         """
         # Select only numerical columns
         real_numerical = self.real_data.select_dtypes(include=[np.number])
         synth_numerical = self.synthetic_data.select_dtypes(include=[np.number])
+        if columns is not None:
+            real_numerical = real_numerical[columns]
+            synth_numerical = synth_numerical[columns]
         
         if len(real_numerical.columns) < 2:
             return {
@@ -328,7 +536,7 @@ class StatisticalEvaluator:
             }
         
         # Calculate correlation matrices
-        real_corr = real_numerical.corr()
+        real_corr = self.real_profile.correlation(real_numerical)
         synth_corr = synth_numerical.corr()
         
         # Calculate Frobenius norm of difference
@@ -404,8 +612,8 @@ class StatisticalEvaluator:
         # Format for frontend (labels as strings for simple charting)
         distribution_data = {
             "labels": [f"{x:.2f}" for x in bin_centers],
-            "real": real_hist.tolist(),
-            "synth": synth_hist.tolist()
+            "real": arr_to_jsonable(real_hist),
+            "synth": arr_to_jsonable(synth_hist)
         }
         
         return {
@@ -447,17 +655,18 @@ class StatisticalEvaluator:
         total_tests = 0
         passed_tests = 0
         
+        ks_results, distances = self.numerical_column_stats(numerical_cols)
         for col in numerical_cols:
             col_results = []
             
             # KS test
-            ks_result = self.kolmogorov_smirnov_test(col)
+            ks_result = self.kolmogorov_smirnov_test(col, ks_results.get(col))
             col_results.append(ks_result)
             total_tests += 1
             if ks_result.get('passed'): passed_tests += 1
             
             # Wasserstein distance
-            ws_result = self.wasserstein_distance_test(col)
+            ws_result = self.wasserstein_distance_test(col, distances.get(col))
             col_results.append(ws_result)
             
             # JS divergence
@@ -484,18 +693,19 @@ class StatisticalEvaluator:
             if chi_result.get('passed'): passed_tests += 1
             
             # For categorical, "distribution" is just relative frequency
-            real_counts = self.real_data[col].value_counts(normalize=True)
+            real_counts = self.real_profile.value_counts(self.real_data, col)
+            real_counts = real_counts / real_counts.sum()
             synth_counts = self.synthetic_data[col].value_counts(normalize=True)
             all_cats = sorted(list(set(real_counts.index) | set(synth_counts.index)))[:15] # Top 15 cats
             
             results["distributions"][col] = {
                 "labels": [str(c) for c in all_cats],
-                "real": [real_counts.get(c, 0) for c in all_cats],
-                "synth": [synth_counts.get(c, 0) for c in all_cats]
+                "real": arr_to_jsonable(real_counts.reindex(all_cats, fill_value=0)),
+                "synth": arr_to_jsonable(synth_counts.reindex(all_cats, fill_value=0))
             }
         
         # Overall tests
-        corr_result = self.correlation_comparison()
+        corr_result = self.correlation_comparison(numerical_cols if columns else None)
         results["overall_tests"]["correlation"] = corr_result
         
         # Summary
@@ -38,6 +38,6 @@ class Generator(SQLModel, table=True):
     training_metadata: Optional[dict] = Field(default=None, sa_column=Column(JSONType))
     privacy_config: Optional[dict] = Field(default=None, sa_column=Column(JSONType))
     privacy_spent: Optional[dict] = Field(default=None, sa_column=Column(JSONType))
-    created_by: uuid.UUID = Field(foreign_key="users.id")
+    created_by: uuid.UUID = Field(foreign_key="users.id", index=True)  # Per-user listings
     created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
     updated_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
@@ -3,7 +3,7 @@
 # Standard library
 import datetime
 import uuid
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 # Third-party
 from sqlmodel import Session, select
@@ -20,6 +20,15 @@ def get_generator_by_id(db: Session, generator_id: str):
     return db.get(Generator, uuid.UUID(generator_id))
 
 
+def list_generators_by_ids(db: Session, generator_ids: Iterable[str]) -> Dict[str, Generator]:
+    """Fetch several generators in one query, keyed by their string ID."""
+    gen_uuids = {uuid.UUID(str(g)) for g in generator_ids}
+    if not gen_uuids:
+        return {}
+    generators = db.exec(select(Generator).where(Generator.id.in_(gen_uuids))).all()
+    return {str(g.id): g for g in generators}
+
+
 def create_generator(db: Session, generator: Generator):
     db.add(generator)
     db.commit()
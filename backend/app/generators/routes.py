@@ -11,7 +11,6 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 
 # Third-party
-import pandas as pd
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 from sqlmodel import Session
 from sqlmodel import select
@@ -31,6 +30,7 @@ from app.storage.s3 import (
 )
 
 # Local - Services
+from app.datasets.loaders import read_dataset_file
 from app.datasets.repositories import get_dataset_by_id
 from app.evaluations.repositories import list_evaluations_by_generator
 from app.services.llm.compliance_writer import ComplianceWriter
@@ -714,6 +714,18 @@ def get_privacy_report(
     return report
 
 
+def _dataset_size(dataset, file_path: Path) -> int:
+    """
+    Number of rows in a dataset.
+    
+    Uploads record the row count, so the file is only parsed for datasets
+    that predate it (through the loader's cache and Parquet sidecar).
+    """
+    if dataset.row_count is not None:
+        return dataset.row_count
+    return len(read_dataset_file(file_path))
+
+
 @router.get("/dp/parameter-limits/{dataset_id}")
 def get_dp_parameter_limits(
     dataset_id: str,
@@ -741,8 +753,7 @@ def get_dp_parameter_limits(
     
     # Get dataset size
     try:
-        df = pd.read_csv(dataset.file_path)
-        dataset_size = len(df)
+        dataset_size = _dataset_size(dataset, Path(dataset.file_path))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Could not read dataset: {str(e)}")
     
@@ -795,8 +806,7 @@ def validate_dp_config(
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Dataset file not found")
     
-    df = pd.read_csv(file_path)
-    dataset_size = len(df)
+    dataset_size = _dataset_size(dataset, file_path)
     
     # Validate configuration
     is_valid, errors, warnings = DPConfigValidator.validate_config(
@@ -850,8 +860,7 @@ def get_recommended_config(
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Dataset file not found")
     
-    df = pd.read_csv(file_path)
-    dataset_size = len(df)
+    dataset_size = _dataset_size(dataset, file_path)
     
     # Get recommended config
     recommended = DPConfigValidator.get_recommended_config(
@@ -896,7 +905,7 @@ async def generate_model_card(
     dataset = get_dataset_by_id(db, str(generator.dataset_id)) if generator.dataset_id else None
     
     # Get latest evaluation if available
-    evaluations = list_evaluations_by_generator(db, generator_id)
+    evaluations = list_evaluations_by_generator(db, generator_id, limit=1)
     latest_eval = evaluations[0] if evaluations else None
     
     # Build metadata
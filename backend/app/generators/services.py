@@ -31,6 +31,7 @@ from app.storage.s3 import (
 )
 
 # Local - Services
+from app.datasets.loaders import read_dataset_file
 from app.datasets.models import Dataset
 from app.datasets.repositories import create_dataset, get_dataset_by_id
 from app.services.synthesis import CTGANService, TVAEService
@@ -201,13 +202,10 @@ def _generate_from_dataset(generator: Generator, db: Session) -> Dataset:
     # Download from S3 if needed (critical for Celery workers)
     data_file = _download_from_s3_if_needed(source_dataset)
 
-    # Load data based on file type
-    if data_file.suffix == '.csv':
-        real_data = pd.read_csv(data_file)
-    elif data_file.suffix == '.json':
-        real_data = pd.read_json(data_file)
-    else:
+    # Load data based on file type (from the Parquet sidecar once it exists)
+    if data_file.suffix not in ('.csv', '.json'):
         raise ValueError(f"Unsupported file format: {data_file.suffix}")
+    real_data = read_dataset_file(data_file)
 
     # Route to appropriate generator
     generator_type = generator.type.lower()
@@ -6,20 +6,26 @@ It initializes the app, includes all routers, and sets up middleware.
 """
 
 # Standard library
+import asyncio
 import importlib.util
 import logging
 import sys
+import threading
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Third-party
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 
 # Internal - Core
 from app.core.audit_middleware import AuditMiddleware
-from app.core.cache_middleware import CacheControlMiddleware, CookieOptimizationMiddleware, TrailingSlashMiddleware
+from app.core.cache_middleware import (
+    CacheControlMiddleware,
+    CookieOptimizationMiddleware,
+    SelectiveGZipMiddleware,
+    TrailingSlashMiddleware,
+)
 from app.core.config import settings
 from app.core.rate_limiter import RateLimitMiddleware
 from app.core.security import RequestIDMiddleware, SecurityHeadersMiddleware
@@ -27,6 +33,9 @@ from app.core.security import RequestIDMiddleware, SecurityHeadersMiddleware
 # Internal - Observability
 from app.observability import health_router, MetricsMiddleware
 
+# Internal - Evaluations
+from app.evaluations.quality_report import shutdown_report_pool
+
 # Import observability
 try:
     OBSERVABILITY_AVAILABLE = True
@@ -50,6 +59,40 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _prewarm() -> None:
+    """Pay one-off initialization costs before the first request has to."""
+    import io
+
+    import pandas as pd
+
+    try:
+        # pandas imports its pyarrow Parquet bridge on first use
+        buffer = io.BytesIO()
+        pd.DataFrame({"warmup": [0.0]}).to_parquet(buffer)
+        pd.read_parquet(buffer)
+        logger.info("✓ Prewarm complete")
+    except Exception as e:
+        logger.warning(f"Prewarm failed (first requests will be slower): {e}")
+
+
+def _compile_kernels() -> None:
+    """Compile numba kernels ahead of the first evaluation that needs them."""
+    from app.evaluations.privacy_tests import warm_up as warm_up_privacy
+    from app.evaluations.statistical_tests import warm_up as warm_up_statistical
+
+    # Only from the main thread (as under uvicorn): compiling a parallel
+    # kernel starts numba's thread pool, and started from another thread
+    # (e.g. TestClient's portal) it keeps the interpreter from exiting
+    if threading.current_thread() is not threading.main_thread():
+        return
+    try:
+        # Loaded from numba's on-disk cache after the first run
+        warm_up_privacy()
+        warm_up_statistical()
+    except Exception as e:
+        logger.warning(f"Kernel compilation failed (first evaluation will be slower): {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -71,8 +114,16 @@ async def lifespan(app: FastAPI):
             methods = ", ".join(route.methods)
             logger.info(f"  [{methods}] {route.path}")
     
+    _compile_kernels()
+    
+    # Runs in the background so it doesn't delay accepting requests
+    prewarm = asyncio.get_running_loop().run_in_executor(None, _prewarm)
+    
     yield
     
+    await prewarm
+    shutdown_report_pool()
+    
     # Shutdown
     logger.info("=" * 60)
     logger.info("👋 Shutting down Synthetic Data Studio Backend")
@@ -103,8 +154,9 @@ app.add_middleware(
     max_age=3600,  # Cache preflight responses for 1 hour
 )
 
-# Add GZip compression for responses > 1KB
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add GZip compression for responses > 1KB (file downloads are excluded so
+# they keep the zero-copy sendfile path)
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1000)
 
 # Add caching middleware (must be early in chain)
 app.add_middleware(CacheControlMiddleware)
@@ -8,9 +8,11 @@ from .metrics import (
     GENERATION_COUNT,
     EVALUATION_COUNT,
     ERROR_COUNT,
+    INSIGHTS_CACHE_LOOKUPS,
     track_generation,
     track_evaluation,
-    track_error
+    track_error,
+    track_insights_cache
 )
 from .health import router as health_router
 
@@ -22,8 +24,10 @@ __all__ = [
     "GENERATION_COUNT",
     "EVALUATION_COUNT",
     "ERROR_COUNT",
+    "INSIGHTS_CACHE_LOOKUPS",
     "track_generation",
     "track_evaluation",
     "track_error",
+    "track_insights_cache",
     "health_router"
 ]
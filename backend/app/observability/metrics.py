@@ -62,6 +62,12 @@ EVALUATION_COUNT = Counter(
     ["evaluation_type", "status"]
 )
 
+INSIGHTS_CACHE_LOOKUPS = Counter(
+    "insights_cache_lookups_total",
+    "LLM insights cache lookups",
+    ["result"]
+)
+
 ERROR_COUNT = Counter(
     "errors_total",
     "Total errors by type",
@@ -99,6 +105,11 @@ def track_evaluation(evaluation_type: str, status: str = "success"):
     EVALUATION_COUNT.labels(evaluation_type=evaluation_type, status=status).inc()
 
 
+def track_insights_cache(hit: bool):
+    """Track an LLM insights cache lookup (hit rate = hit / (hit + miss))."""
+    INSIGHTS_CACHE_LOOKUPS.labels(result="hit" if hit else "miss").inc()
+
+
 def track_error(error_type: str, endpoint: str):
     """Track an error occurrence."""
     ERROR_COUNT.labels(error_type=error_type, endpoint=endpoint).inc()
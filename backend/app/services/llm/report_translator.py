@@ -7,6 +7,7 @@ for business stakeholders.
 # Standard library
 import json
 import logging
+from functools import lru_cache
 from typing import Dict, Any
 
 # Local - Module
@@ -193,5 +194,17 @@ Consider: quality vs privacy, speed vs accuracy, use case requirements."""
                 "summary": "Comparison unavailable",
                 "winner": 1,
                 "trade_offs": ["Unable to generate comparison"],
-                "recommendation": "Review metrics manually"
+                "recommendation": "Review metrics manually",
+                "_metadata": {
+                    "provider": "fallback",
+                    "model": "rule-based",
+                    "latency_ms": 0
+                }
             }
+
+
+@lru_cache(maxsize=1)
+def get_report_translator() -> ReportTranslator:
+    """Shared ReportTranslator, so provider clients (and their connection
+    pools) are created once per process instead of once per request."""
+    return ReportTranslator()
@@ -12,8 +12,10 @@ Provides comprehensive statistical analysis of datasets including:
 
 # Standard library
 import logging
+import tempfile
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
 
 # Third-party
 import numpy as np
@@ -318,6 +320,301 @@ class DataProfiler:
         }
 
 
+class _DistinctHashCounter:
+    """
+    Exact count of distinct 64-bit hashes in bounded memory.
+    
+    Hashes are buffered in memory up to `max_buffered`. Past that, they are
+    spilled to temporary files partitioned by their top bits, and each
+    partition is deduplicated on its own by `count()`. Peak memory is the
+    buffer plus one partition, not one hash per row.
+    """
+    
+    PARTITION_BITS = 6
+    
+    def __init__(self, max_buffered: int):
+        self.max_buffered = max_buffered
+        self._buffer: List[np.ndarray] = []
+        self._buffered = 0
+        self._spill_dir: Optional[tempfile.TemporaryDirectory] = None
+    
+    def add(self, hashes: np.ndarray) -> None:
+        """Add a chunk's hashes, spilling to disk once the buffer is full."""
+        self._buffer.append(hashes)
+        self._buffered += len(hashes)
+        if self._buffered > self.max_buffered:
+            self._spill()
+    
+    def count(self) -> int:
+        """Number of distinct hashes added; removes any spill files."""
+        if self._spill_dir is None:
+            return len(np.unique(np.concatenate(self._buffer))) if self._buffer else 0
+        
+        self._spill()
+        try:
+            return sum(
+                len(np.unique(np.fromfile(path, dtype=np.uint64)))
+                for path in Path(self._spill_dir.name).iterdir()
+            )
+        finally:
+            self._spill_dir.cleanup()
+            self._spill_dir = None
+    
+    def _spill(self) -> None:
+        """Append the buffered hashes to their partition files."""
+        if not self._buffer:
+            return
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(prefix="profile-hashes-")
+        # Sorted, so every partition is one contiguous slice
+        hashes = np.unique(np.concatenate(self._buffer))
+        self._buffer, self._buffered = [], 0
+        
+        partitions = hashes >> np.uint64(64 - self.PARTITION_BITS)
+        bounds = np.searchsorted(partitions, np.arange((1 << self.PARTITION_BITS) + 1))
+        for partition, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+            if start < end:
+                with open(Path(self._spill_dir.name) / f"{partition:02d}.bin", "ab") as f:
+                    hashes[start:end].tofile(f)
+
+
+class StreamingDataProfiler:
+    """
+    Chunk-at-a-time profiling for datasets too large to load whole.
+    
+    Exact one-pass statistics are accumulated across chunks: row and missing
+    counts, numeric count/mean/std (Chan-Welford merge) and min/max, pairwise
+    Pearson correlations and duplicate rows (via 64-bit row hashes, spilled
+    to disk past DUPLICATE_HASH_BUFFER rows). Distinct counts are estimated
+    with a k-minimum-values sketch. Order statistics, outliers, histograms
+    and categorical breakdowns are computed by DataProfiler on a uniform row
+    sample. Peak memory is O(chunk + sample) instead of O(dataset).
+    """
+    
+    SAMPLE_SIZE = 100_000
+    KMV_SIZE = 4096
+    # Row hashes held in memory (8 bytes each) before spilling to disk
+    DUPLICATE_HASH_BUFFER = 4_000_000
+    
+    def __init__(self, chunks: Iterable[pd.DataFrame], sample_size: int = SAMPLE_SIZE):
+        self.chunks = chunks
+        self.sample_size = sample_size
+        self._rng = np.random.default_rng(42)
+    
+    def profile(self) -> Dict[str, Any]:
+        """
+        Consume all chunks and build the profile.
+        
+        Returns:
+            Profiling results in the same shape as DataProfiler.profile()
+        """
+        columns: List[str] = []
+        row_count = 0
+        memory_usage = 0
+        missing: Dict[str, int] = {}
+        moments: Dict[str, List[float]] = {}  # col -> [count, mean, M2, min, max]
+        kmv: Dict[str, np.ndarray] = {}
+        row_hashes = _DistinctHashCounter(self.DUPLICATE_HASH_BUFFER)
+        corr_state: Optional[Dict[str, Any]] = None
+        sample: Optional[pd.DataFrame] = None
+        sample_keys = np.empty(0)
+        
+        for chunk in self.chunks:
+            if len(chunk) == 0:
+                continue
+            if not columns:
+                columns = list(chunk.columns)
+            
+            row_count += len(chunk)
+            memory_usage += int(chunk.memory_usage(deep=True).sum())
+            
+            for col, count in chunk.isna().sum().items():
+                missing[col] = missing.get(col, 0) + int(count)
+            
+            for col in chunk.columns:
+                hashes = pd.util.hash_pandas_object(chunk[col].dropna(), index=False).to_numpy()
+                kmv[col] = self._merge_kmv(kmv.get(col), hashes)
+                
+                if pd.api.types.is_numeric_dtype(chunk[col]) and not pd.api.types.is_bool_dtype(chunk[col]):
+                    moments[col] = self._merge_moments(moments.get(col), chunk[col].dropna().to_numpy(dtype=float))
+            
+            row_hashes.add(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+            corr_state = self._merge_correlation_state(corr_state, chunk)
+            
+            # Bottom-k random keys give a uniform row sample that merges across chunks
+            keys = self._rng.random(len(chunk))
+            if sample is None:
+                sample, sample_keys = chunk, keys
+            else:
+                sample = pd.concat([sample, chunk], ignore_index=True)
+                sample_keys = np.concatenate([sample_keys, keys])
+            if len(sample) > self.sample_size:
+                keep = np.argpartition(sample_keys, self.sample_size)[:self.sample_size]
+                keep.sort()
+                sample = sample.iloc[keep].reset_index(drop=True)
+                sample_keys = sample_keys[keep]
+        
+        if sample is None:
+            return DataProfiler(pd.DataFrame(columns=columns)).profile()
+        
+        logger.info(f"Profiling {row_count} rows in chunks (sample of {len(sample)} rows)")
+        results = DataProfiler(sample).profile()
+        
+        # Replace sample-based figures with the exact / sketched ones
+        duplicate_count = row_count - row_hashes.count()
+        total_missing = sum(missing.values())
+        
+        results["dataset_summary"].update({
+            "row_count": row_count,
+            "memory_usage_bytes": memory_usage,
+            "duplicate_row_count": int(duplicate_count),
+            "total_missing_cells": int(total_missing),
+            "sampled": True,
+            "sample_size": len(sample),
+        })
+        results["duplicates"] = {
+            "duplicate_row_count": int(duplicate_count),
+            "duplicate_percentage": float(duplicate_count / row_count * 100),
+            "unique_row_count": int(row_count - duplicate_count)
+        }
+        results["missing_values"] = {
+            "total_missing_cells": int(total_missing),
+            "columns_with_missing": {
+                col: {"count": count, "percentage": float(count / row_count * 100)}
+                for col, count in sorted(missing.items(), key=lambda item: -item[1])
+                if count > 0
+            }
+        }
+        
+        for col, col_profile in results["columns"].items():
+            unique_count = self._estimate_distinct(kmv.get(col))
+            col_profile.update({
+                "missing_count": missing.get(col, 0),
+                "missing_percentage": float(missing.get(col, 0) / row_count * 100),
+                "unique_count": unique_count,
+                "cardinality": float(unique_count / row_count),
+            })
+            if col in moments and "mean" in col_profile:
+                count, mean, m2, col_min, col_max = moments[col]
+                col_profile.update({
+                    "mean": float(mean),
+                    "std": float(np.sqrt(m2 / (count - 1))) if count > 1 else float("nan"),
+                    "min": float(col_min),
+                    "max": float(col_max),
+                })
+        
+        correlations = self._finalize_correlations(corr_state)
+        if correlations is not None:
+            results["correlations"] = correlations
+        
+        return results
+    
+    @staticmethod
+    def _merge_moments(state: Optional[List[float]], values: np.ndarray) -> Optional[List[float]]:
+        """Merge a chunk into [count, mean, M2, min, max] (Chan et al.)."""
+        if len(values) == 0:
+            return state
+        n_b = len(values)
+        mean_b = float(values.mean())
+        m2_b = float(((values - mean_b) ** 2).sum())
+        min_b, max_b = float(values.min()), float(values.max())
+        if state is None:
+            return [n_b, mean_b, m2_b, min_b, max_b]
+        
+        n_a, mean_a, m2_a, min_a, max_a = state
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        return [
+            n,
+            mean_a + delta * n_b / n,
+            m2_a + m2_b + delta * delta * n_a * n_b / n,
+            min(min_a, min_b),
+            max(max_a, max_b),
+        ]
+    
+    def _merge_kmv(self, sketch: Optional[np.ndarray], hashes: np.ndarray) -> np.ndarray:
+        """Keep the KMV_SIZE smallest distinct hashes seen so far."""
+        merged = np.unique(hashes if sketch is None else np.concatenate([sketch, hashes]))
+        return merged[:self.KMV_SIZE]
+    
+    def _estimate_distinct(self, sketch: Optional[np.ndarray]) -> int:
+        """Distinct-count estimate from a KMV sketch (exact below KMV_SIZE)."""
+        if sketch is None or len(sketch) == 0:
+            return 0
+        if len(sketch) < self.KMV_SIZE:
+            return int(len(sketch))
+        kth = float(sketch[-1]) / float(np.iinfo(np.uint64).max)
+        return int((self.KMV_SIZE - 1) / kth)
+    
+    @staticmethod
+    def _merge_correlation_state(
+        state: Optional[Dict[str, Any]],
+        chunk: pd.DataFrame
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Accumulate pairwise-complete Pearson sums for the numeric columns.
+        
+        For every column pair only rows where both are present count, which
+        matches DataFrame.corr().
+        """
+        numeric_cols = list(chunk.select_dtypes(include=[np.number]).columns)
+        if state is None:
+            state = {"columns": numeric_cols if len(numeric_cols) >= 2 else None}
+        elif numeric_cols != state["columns"]:
+            # Column types drifted between chunks; drop streamed correlations
+            state["columns"] = None
+        if state["columns"] is None:
+            return state
+        
+        values = chunk[numeric_cols].to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        x = np.where(present, values, 0.0)
+        w = present.astype(float)
+        sums = {
+            "n": w.T @ w,        # rows where i and j are both present
+            "sx": x.T @ w,       # sum of x_i over those rows
+            "sxx": (x * x).T @ w,
+            "sxy": x.T @ x,
+        }
+        for key, value in sums.items():
+            state[key] = state[key] + value if key in state else value
+        return state
+    
+    @staticmethod
+    def _finalize_correlations(state: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Turn accumulated sums into the DataProfiler correlations block."""
+        if state is None or state["columns"] is None:
+            return None
+        
+        n, sx, sxx, sxy = state["n"], state["sx"], state["sxx"], state["sxy"]
+        sy = sx.T
+        syy = sxx.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = n * sxy - sx * sy
+            var_x = n * sxx - sx * sx
+            var_y = n * syy - sy * sy
+            corr = cov / np.sqrt(var_x * var_y)
+        corr = np.clip(corr, -1.0, 1.0)
+        
+        columns = state["columns"]
+        corr_matrix = pd.DataFrame(corr, index=columns, columns=columns)
+        high_corr_pairs = [
+            {
+                "column1": columns[i],
+                "column2": columns[j],
+                "correlation": float(corr[i, j])
+            }
+            for i in range(len(columns))
+            for j in range(i + 1, len(columns))
+            if abs(corr[i, j]) > 0.7
+        ]
+        
+        return {
+            "correlation_matrix": corr_matrix.to_dict(),
+            "highly_correlated_pairs": high_corr_pairs
+        }
+
+
 def profile_dataset(df: pd.DataFrame) -> Dict[str, Any]:
     """
     Convenience function to profile a dataset.
@@ -330,3 +627,17 @@ def profile_dataset(df: pd.DataFrame) -> Dict[str, Any]:
     """
     profiler = DataProfiler(df)
     return profiler.profile()
+
+
+def profile_dataset_chunks(chunks: Iterable[pd.DataFrame]) -> Dict[str, Any]:
+    """
+    Profile a dataset delivered as an iterator of DataFrame chunks.
+    
+    Args:
+        chunks: Iterable of DataFrames sharing the same columns
+        
+    Returns:
+        Profiling results (same shape as profile_dataset, with
+        dataset_summary.sampled set)
+    """
+    return StreamingDataProfiler(chunks).profile()
@@ -0,0 +1,135 @@
+"""Evaluation background tasks."""
+
+# Standard library
+import logging
+import uuid
+from datetime import datetime
+
+# Internal - Core
+from app.core.celery_app import celery_app
+
+# Internal - Module
+from app.tasks.base import DatabaseTask
+
+# Internal - Models (import all to ensure metadata is loaded)
+from app.audit.models import AuditLog
+from app.auth.models import User
+from app.compliance.models import ComplianceReport
+from app.datasets.models import Dataset
+from app.evaluations.models import Evaluation
+from app.generators.models import Generator
+from app.jobs.models import Job
+from app.projects.models import Project
+
+# Internal - Repositories
+from app.evaluations.repositories import create_evaluation
+
+# Internal - Services
+from app.datasets.loaders import read_dataset_file, resolve_dataset_path
+from app.evaluations.quality_report import QualityReportGenerator
+from app.evaluations.schemas import EvaluationRequest
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, base=DatabaseTask)
+def run_evaluation_task(
+    self,
+    evaluation_id: str,
+    job_id: str,
+    request_data: dict,
+    created_by: str
+):
+    """
+    Background task to run a comprehensive quality evaluation.
+
+    Args:
+        evaluation_id: ID to save the evaluation under (handed out when queued)
+        job_id: UUID of the tracking job
+        request_data: The EvaluationRequest, as a dict
+        created_by: UUID of the user who ran the evaluation
+    """
+    logger.info(f"Starting evaluation task {evaluation_id} (Job {job_id})")
+
+    db = self.db
+    job = None
+
+    try:
+        # 1. Update Job status to RUNNING
+        job = db.get(Job, uuid.UUID(job_id))
+        if job:
+            job.celery_task_id = self.request.id
+            job.started_at = datetime.utcnow()
+            job.status = "running"
+            db.add(job)
+            db.commit()
+        else:
+            logger.error(f"Job {job_id} not found")
+            return
+
+        # 2. Get Generator and the real / synthetic datasets
+        request = EvaluationRequest(**request_data)
+        generator = db.get(Generator, uuid.UUID(request.generator_id))
+        if not generator:
+            raise ValueError(f"Generator {request.generator_id} not found")
+
+        dataset = db.get(Dataset, uuid.UUID(request.dataset_id))
+        output_dataset = db.get(Dataset, generator.output_dataset_id) if generator.output_dataset_id else None
+        if not dataset or not output_dataset:
+            raise FileNotFoundError(f"Datasets for generator {request.generator_id} not found")
+
+        # 3. Load only the columns the report will use
+        needed_columns = QualityReportGenerator.required_columns(
+            target_column=request.target_column,
+            include_statistical=request.include_statistical,
+            include_ml_utility=request.include_ml_utility,
+            include_privacy=request.include_privacy,
+            statistical_columns=request.statistical_columns
+        )
+        real_data = read_dataset_file(resolve_dataset_path(dataset), needed_columns)
+        synthetic_data = read_dataset_file(resolve_dataset_path(output_dataset), needed_columns)
+
+        # 4. Generate the report
+        report = QualityReportGenerator(
+            real_data=real_data,
+            synthetic_data=synthetic_data,
+            generator_id=request.generator_id,
+            generator_type=generator.type
+        ).generate_full_report(
+            target_column=request.target_column,
+            sensitive_columns=request.sensitive_columns,
+            include_statistical=request.include_statistical,
+            include_ml_utility=request.include_ml_utility,
+            include_privacy=request.include_privacy,
+            statistical_columns=request.statistical_columns
+        )
+
+        # 5. Save it under the ID the client was given
+        create_evaluation(
+            db=db,
+            generator_id=request.generator_id,
+            dataset_id=request.dataset_id,
+            report=report,
+            created_by=created_by,
+            evaluation_id=evaluation_id
+        )
+
+        # 6. Update Job Status to COMPLETED
+        job.status = "completed"
+        job.completed_at = datetime.utcnow()
+        db.add(job)
+        db.commit()
+
+        logger.info(f"✓ Evaluation {evaluation_id} completed: {report['overall_assessment']['overall_quality']}")
+
+    except Exception as e:
+        logger.error(f"Evaluation failed: {e}", exc_info=True)
+        # Update Job to FAILED
+        if job:
+            db.rollback()
+            job.status = "failed"
+            job.error_message = str(e)[:500]  # Truncate long errors
+            job.completed_at = datetime.utcnow()
+            db.add(job)
+            db.commit()
+        raise
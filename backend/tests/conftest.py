@@ -25,7 +25,8 @@ from sqlmodel.pool import StaticPool
 
 # Local - Core
 from app.core.dependencies import get_db
-from app.main import app
+from app.database.database import json_serializer
+from app.main import _compile_kernels, app
 
 # Local - Services
 # No backend token issuance post-migration; tests use proxy headers instead
@@ -44,6 +45,7 @@ def engine_fixture():
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
+        json_serializer=json_serializer,  # Same JSON encoding as the app engine
     )
     SQLModel.metadata.create_all(engine)
     yield engine
@@ -104,6 +106,14 @@ def authenticated_client_fixture(client: TestClient, auth_headers: Dict[str, str
     return client
 
 
+@pytest.fixture(name="compiled_kernels", scope="session")
+def compiled_kernels_fixture() -> None:
+    """Compile numba kernels on the main thread, as the app does at startup"""
+    # Otherwise the first evaluation compiles them on a worker thread, and
+    # numba's thread pool started there keeps pytest from exiting
+    _compile_kernels()
+
+
 # Test Data Factories
 
 class TestDataFactory:
@@ -186,7 +196,7 @@ def assert_error_response(response, status_code: int, detail_contains: str = Non
 
 # Pytest hooks
 
-def pytest_configure(_config):
+def pytest_configure(config):
     """Configure pytest"""
     # Set environment variables for testing
     os.environ["TESTING"] = "1"
@@ -195,7 +205,7 @@ def pytest_configure(_config):
     os.environ["PROXY_SECRET"] = os.environ.get("PROXY_SECRET", "internal-proxy")
 
 
-def pytest_collection_modifyitems(_config, items):
+def pytest_collection_modifyitems(config, items):
     """Modify test collection"""
     # Add markers based on test path
     for item in items:
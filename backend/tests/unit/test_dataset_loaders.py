@@ -0,0 +1,247 @@
+"""
+Unit tests for Dataset loaders.
+
+Tests cover:
+- Parquet sidecars (written once, trusted only when fresh, projections)
+- In-process frame cache (invalidation, bounds)
+- Cached frames handed out as shallow copies
+- Chunked CSV reads typed like whole-file reads
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+# Standard library
+import os
+from pathlib import Path
+from typing import List
+
+# Third-party
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local - Module
+from app.datasets import loaders
+from app.datasets.loaders import (
+    iter_dataset_chunks,
+    parquet_sidecar_path,
+    parse_dataset_file,
+    read_dataset_file
+)
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def empty_frame_cache():
+    """Start every test with an empty DataFrame cache."""
+    loaders._frame_cache.clear()
+    yield
+    loaders._frame_cache.clear()
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> Path:
+    """CSV with integer, float, string, date, all-empty and multi-line columns."""
+    n = 2_500
+    pd.DataFrame({
+        "id": np.arange(n),
+        "score": np.linspace(0, 1, n),
+        "city": ["Paris", "Lyon"] * (n // 2),
+        "joined": ["2024-01-02"] * n,
+        "notes": [None] * n,
+        "address": ["1 Main St\nApt 2"] * n,
+    }).to_csv(tmp_path / "people.csv", index=False)
+    return tmp_path / "people.csv"
+
+
+@pytest.fixture
+def parsed(monkeypatch) -> List[Path]:
+    """Paths of source files actually parsed (not served from a sidecar or the cache)."""
+    calls = []
+    parse = loaders.parse_dataset_file
+
+    def counting_parse(file_path):
+        calls.append(Path(file_path))
+        return parse(file_path)
+
+    monkeypatch.setattr(loaders, "parse_dataset_file", counting_parse)
+    return calls
+
+
+def _age(path: Path, seconds: int = 10) -> None:
+    """Move a file's mtime back, so files written after it are newer."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+# ============================================================================
+# TESTS - PARQUET SIDECAR
+# ============================================================================
+
+class TestParquetSidecar:
+    """Tests for reads through the Parquet sidecar."""
+
+    def test_first_read_writes_sidecar(self, csv_path: Path, parsed: List[Path]):
+        """The source is parsed once; later loads read the sidecar instead."""
+        first = read_dataset_file(csv_path)
+        assert parquet_sidecar_path(csv_path).exists()
+
+        loaders._frame_cache.clear()
+        second = read_dataset_file(csv_path)
+
+        assert parsed == [csv_path]
+        pd.testing.assert_frame_equal(second, first)
+
+    def test_stale_sidecar_is_replaced(self, csv_path: Path, parsed: List[Path]):
+        """A source file newer than its sidecar is parsed again."""
+        read_dataset_file(csv_path)
+        _age(parquet_sidecar_path(csv_path))
+        csv_path.write_text("id,score\n1,0.5\n")
+
+        df = read_dataset_file(csv_path)
+
+        assert parsed == [csv_path, csv_path]
+        assert df.to_dict("list") == {"id": [1], "score": [0.5]}
+        assert parquet_sidecar_path(csv_path).stat().st_mtime_ns >= csv_path.stat().st_mtime_ns
+
+    def test_unreadable_sidecar_falls_back_to_source(self, csv_path: Path, parsed: List[Path]):
+        """A corrupt sidecar is ignored and rewritten from the source."""
+        sidecar = parquet_sidecar_path(csv_path)
+        sidecar.write_bytes(b"not parquet")
+
+        df = read_dataset_file(csv_path)
+
+        assert parsed == [csv_path]
+        assert len(df) == 2_500
+
+    @pytest.mark.parametrize("from_sidecar", [False, True])
+    def test_column_projection(self, csv_path: Path, from_sidecar: bool):
+        """Only the requested columns are loaded; unknown names are skipped."""
+        if from_sidecar:
+            read_dataset_file(csv_path)
+            loaders._frame_cache.clear()
+
+        df = read_dataset_file(csv_path, ["score", "missing", "city"])
+
+        assert list(df.columns) == ["score", "city"]
+
+    def test_chunks_from_sidecar(self, csv_path: Path):
+        """Chunked reads use a fresh sidecar and return the same rows."""
+        whole = read_dataset_file(csv_path)
+
+        chunks = list(iter_dataset_chunks(csv_path, chunksize=1_000))
+
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), whole)
+
+
+# ============================================================================
+# TESTS - CACHED READS
+# ============================================================================
+
+class TestReadDatasetFile:
+    """Tests for read_dataset_file's cached frames."""
+
+    def test_repeated_reads_are_cached(self, csv_path: Path, parsed: List[Path], monkeypatch):
+        """An unchanged file is loaded once, whether from source or sidecar."""
+        sidecar_reads = []
+        read_parquet = pd.read_parquet
+        monkeypatch.setattr(pd, "read_parquet", lambda *a, **k: sidecar_reads.append(a) or read_parquet(*a, **k))
+
+        for _ in range(3):
+            read_dataset_file(csv_path)
+
+        assert parsed == [csv_path]
+        assert sidecar_reads == []
+
+    def test_changed_file_is_reloaded(self, csv_path: Path, parsed: List[Path]):
+        """The cache is keyed by mtime and size, so rewritten files are reloaded."""
+        read_dataset_file(csv_path)
+        _age(parquet_sidecar_path(csv_path))
+        csv_path.write_text("id\n1\n")
+
+        assert list(read_dataset_file(csv_path).columns) == ["id"]
+        assert len(parsed) == 2
+
+    def test_cache_bounded_by_bytes(self):
+        """Frames are evicted least recently used first once over the byte budget."""
+        cache = loaders._FrameCache(max_entries=10, max_bytes=3_000)
+        frames = [pd.DataFrame({"x": np.zeros(100)}) for _ in range(3)]  # ~1 KB each
+
+        for i, df in enumerate(frames):
+            cache.put((i,), df)
+        cache.get((0,))
+        cache.put((3,), pd.DataFrame({"x": np.zeros(100)}))
+
+        assert cache.get((1,)) is None
+        assert cache.get((0,)) is frames[0]
+        assert cache.get((2,)) is frames[2]
+
+    def test_frames_over_budget_are_not_cached(self):
+        """A single frame larger than the byte budget is never cached."""
+        cache = loaders._FrameCache(max_entries=10, max_bytes=100)
+        cache.put(("big",), pd.DataFrame({"x": np.zeros(100)}))
+
+        assert cache.get(("big",)) is None
+
+    def test_column_changes_stay_with_the_caller(self, csv_path: Path):
+        """Adding and replacing columns doesn't leak into the cached frame."""
+        first = read_dataset_file(csv_path)
+        first["score"] = -1.0
+        first["extra"] = 1
+
+        second = read_dataset_file(csv_path)
+
+        assert "extra" not in second.columns
+        assert (second["score"] >= 0).all()
+
+    def test_cache_hit_shares_data(self, csv_path: Path):
+        """Cache hits are shallow copies rather than full copies of the data."""
+        first = read_dataset_file(csv_path)
+        second = read_dataset_file(csv_path)
+
+        assert first is not second
+        assert np.shares_memory(first["score"].to_numpy(), second["score"].to_numpy())
+
+
+# ============================================================================
+# TESTS - CHUNKED READS
+# ============================================================================
+
+class TestIterDatasetChunks:
+    """Tests for iter_dataset_chunks on CSV files."""
+
+    def test_chunks_match_whole_file_read(self, csv_path: Path):
+        """Chunks have the whole-file dtypes and concatenate to the same frame."""
+        whole = parse_dataset_file(csv_path)
+
+        chunks = list(iter_dataset_chunks(csv_path, chunksize=1_000))
+
+        assert [len(chunk) for chunk in chunks] == [1_000, 1_000, 500]
+        for chunk in chunks:
+            pd.testing.assert_series_equal(chunk.dtypes, whole.dtypes)
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), whole)
+
+    def test_type_change_after_first_block(self, tmp_path: Path, monkeypatch):
+        """A later block that doesn't fit the inferred types is read by pandas, without gaps."""
+        monkeypatch.setattr(loaders, "CSV_BLOCK_SIZE", 4_096)
+        lines = ["a,b"] + [f"{i},x" for i in range(3_000)] + ["1.5,y"] + [f"{i},z" for i in range(500)]
+        path = tmp_path / "drift.csv"
+        path.write_text("\n".join(lines) + "\n")
+
+        rows = pd.concat(iter_dataset_chunks(path, chunksize=700), ignore_index=True)
+
+        assert len(rows) == 3_501
+        assert rows["b"].tolist()[2_999:3_002] == ["x", "y", "z"]
+        assert rows["a"].iloc[3_000] == 1.5
+
+    def test_pandas_engine(self, csv_path: Path, monkeypatch):
+        """With FAST_CSV off, chunks come from the pandas C engine."""
+        monkeypatch.setattr(loaders.settings, "fast_csv", False)
+
+        chunks = list(iter_dataset_chunks(csv_path, chunksize=1_000))
+
+        assert sum(len(chunk) for chunk in chunks) == 2_500
@@ -7,6 +7,7 @@ Tests cover:
 - Dataset preview and statistics
 - Data validation
 - Access control
+- Profiles and PII flags reused across datasets with the same content
 """
 
 # ============================================================================
@@ -16,7 +17,8 @@ Tests cover:
 # Standard library
 import uuid
 import io
-from typing import Dict
+from pathlib import Path
+from typing import Dict, List
 
 # Third-party
 import pytest
@@ -24,8 +26,9 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 # Local - Module
+from app.datasets import routes as dataset_routes, services as dataset_services
 from app.datasets.models import Dataset
-from app.datasets.repositories import create_dataset, get_dataset_by_id
+from app.datasets.repositories import create_dataset, get_dataset_by_id, get_dataset_with_same_content
 
 # ============================================================================
 # FIXTURES
@@ -566,3 +569,75 @@ class TestDatasetEdgeCases:
         # Both should succeed or fail independently
         assert response1.status_code in [201, 400, 422]
         assert response2.status_code in [201, 400, 422]
+
+
+# ============================================================================
+# TESTS - SAME-CONTENT REUSE
+# ============================================================================
+
+class TestSameContentReuse:
+    """Tests for reusing analysis results of datasets with the same checksum."""
+
+    @pytest.fixture
+    def same_content_datasets(
+        self,
+        session: Session,
+        test_user,
+        sample_csv_content: str,
+        tmp_path: Path,
+        monkeypatch
+    ) -> List[Dataset]:
+        """Two uploads of the same file, under different names."""
+        monkeypatch.setattr(dataset_routes, "UPLOAD_DIR", tmp_path)
+        datasets = []
+        for name in ("first.csv", "second.csv"):
+            (tmp_path / name).write_text(sample_csv_content)
+            datasets.append(Dataset(
+                project_id=uuid.uuid4(),
+                name=name,
+                original_filename=name,
+                checksum="same-content",
+                uploader_id=test_user.id,
+            ))
+        session.add_all(datasets)
+        session.commit()
+        return datasets
+
+    def test_donor_skips_empty_results(self, session: Session, same_content_datasets: List[Dataset]):
+        """Datasets with no (or JSON null) results don't donate; the first real one does."""
+        first, second = same_content_datasets
+        empty = Dataset(project_id=uuid.uuid4(), name="empty", checksum="same-content", uploader_id=first.uploader_id)
+        session.add(empty)
+        session.commit()
+
+        assert get_dataset_with_same_content(session, second, "profiling_data") is None
+
+        first.profiling_data = {"dataset_summary": {"row_count": 5}}
+        session.add(first)
+        session.commit()
+
+        assert get_dataset_with_same_content(session, second, "profiling_data") == (
+            first.id, {"dataset_summary": {"row_count": 5}}
+        )
+
+    def test_profile_reused_and_restamped(
+        self,
+        session: Session,
+        same_content_datasets: List[Dataset],
+        monkeypatch
+    ):
+        """The second dataset gets the first one's profile, stamped with its own time."""
+        first, second = same_content_datasets
+        profile = dataset_services.profile_uploaded_dataset(str(first.id), session)
+        donor_profile = {**profile, "profiling_timestamp": "2000-01-01T00:00:00"}
+        first.profiling_data = donor_profile
+        session.add(first)
+        session.commit()
+        monkeypatch.setattr(dataset_services, "profile_dataset", None)
+
+        reused = dataset_services.profile_uploaded_dataset(str(second.id), session)
+
+        assert reused["dataset_summary"] == profile["dataset_summary"]
+        assert reused["profiling_timestamp"] > donor_profile["profiling_timestamp"]
+        session.expire_all()
+        assert session.get(Dataset, first.id).profiling_data == donor_profile
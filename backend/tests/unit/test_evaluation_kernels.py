@@ -0,0 +1,177 @@
+"""
+Unit tests for Evaluation numba kernels.
+
+Tests cover:
+- Euclidean DCR kernel against a cKDTree nearest-neighbour query
+- Column KS / Wasserstein kernel against scipy (ties, missing values, unequal sizes)
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+# Third-party
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.spatial import cKDTree
+from scipy.stats import ks_2samp, wasserstein_distance
+
+# Local - Module
+from app.evaluations import privacy_tests, statistical_tests
+from app.evaluations.privacy_tests import PrivacyEvaluator
+from app.evaluations.statistical_tests import StatisticalEvaluator
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def kernels(compiled_kernels):
+    """Compile the kernels on the main thread before any test calls them."""
+
+
+def _records(rows: int, features: int, seed: int) -> np.ndarray:
+    """Standardized float32 records, as _prepare_numerical returns them."""
+    return np.random.default_rng(seed).standard_normal((rows, features)).astype(np.float32)
+
+
+# ============================================================================
+# TESTS - DCR KERNEL
+# ============================================================================
+
+@pytest.mark.skipif(not privacy_tests.NUMBA_AVAILABLE, reason="numba not installed")
+class TestDcrEuclidean:
+    """Tests for the fused euclidean DCR kernel."""
+
+    @pytest.mark.parametrize("features", [16, 33])
+    def test_matches_kdtree(self, features: int):
+        """Each distance is the same as cKDTree's closest-record distance."""
+        synthetic = _records(300, features, seed=1)
+        real = _records(1_000, features, seed=2)
+        out = np.empty(len(synthetic), dtype=np.float64)
+
+        privacy_tests._dcr_euclidean(synthetic, real, out)
+
+        expected, _ = cKDTree(real).query(synthetic, k=1)
+        np.testing.assert_allclose(out, expected, rtol=1e-5)
+
+    def test_copied_records_are_at_distance_zero(self):
+        """Synthetic rows copied from the real data have a DCR of zero."""
+        real = _records(500, 20, seed=3)
+        synthetic = np.vstack([real[:10], _records(10, 20, seed=4)])
+        out = np.empty(len(synthetic), dtype=np.float64)
+
+        privacy_tests._dcr_euclidean(synthetic, real, out)
+
+        assert (out[:10] == 0).all()
+        assert (out[10:] > 0).all()
+
+
+class TestNearestDistances:
+    """Tests for PrivacyEvaluator._nearest_distances."""
+
+    @pytest.mark.parametrize("features", [4, privacy_tests._DCR_NUMBA_MIN_FEATURES])
+    def test_euclidean_on_either_side_of_kernel_threshold(self, features: int):
+        """KD-tree and kernel paths give the same distances."""
+        synthetic = _records(200, features, seed=5)
+        real = _records(800, features, seed=6)
+
+        distances = PrivacyEvaluator._nearest_distances(synthetic, real, "euclidean")
+
+        expected, _ = cKDTree(real).query(synthetic, k=1)
+        np.testing.assert_allclose(distances, expected, rtol=1e-5)
+
+    def test_uses_kernel_for_many_features(self, monkeypatch):
+        """Wide euclidean inputs go through the numba kernel, not the KD-tree."""
+        if not privacy_tests.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        calls = []
+        kernel = privacy_tests._dcr_euclidean
+        monkeypatch.setattr(privacy_tests, "_dcr_euclidean", lambda *args: calls.append(args) or kernel(*args))
+
+        PrivacyEvaluator._nearest_distances(_records(10, 16, 7), _records(20, 16, 8), "euclidean")
+
+        assert len(calls) == 1
+
+
+# ============================================================================
+# TESTS - COLUMN STATISTICS KERNEL
+# ============================================================================
+
+def _frames(real_rows: int, synth_rows: int) -> tuple:
+    """Real and synthetic frames with continuous, tied, skewed and missing values."""
+    rng = np.random.default_rng(9)
+
+    def frame(rows: int, shift: float) -> pd.DataFrame:
+        with_missing = rng.normal(shift, 2, rows)
+        with_missing[rng.choice(rows, rows // 10, replace=False)] = np.nan
+        return pd.DataFrame({
+            "continuous": rng.normal(shift, 1, rows),
+            "ties": rng.integers(0, 5, rows).astype(float),
+            "missing": with_missing,
+            "skewed": rng.exponential(1 + shift, rows),
+        })
+
+    return frame(real_rows, 0.0), frame(synth_rows, 0.3)
+
+
+@pytest.mark.skipif(not statistical_tests.NUMBA_AVAILABLE, reason="numba not installed")
+class TestColumnStats:
+    """Tests for the fused KS / Wasserstein column kernel."""
+
+    @pytest.mark.parametrize("real_rows,synth_rows", [(1_000, 1_000), (1_500, 600), (12_000, 11_000)])
+    def test_matches_scipy(self, real_rows: int, synth_rows: int):
+        """Distances and KS statistics match scipy on the non-missing values."""
+        real, synthetic = _frames(real_rows, synth_rows)
+        evaluator = StatisticalEvaluator(real, synthetic)
+        columns = sorted(real.columns)
+
+        out, real_counts, synth_counts = evaluator._column_stats(columns)
+
+        for c, column in enumerate(columns):
+            real_col, synth_col = real[column].dropna(), synthetic[column].dropna()
+            assert (real_counts[c], synth_counts[c]) == (len(real_col), len(synth_col))
+            assert out[c, 0] == pytest.approx(wasserstein_distance(real_col, synth_col), rel=1e-9)
+            assert out[c, 1] == pytest.approx(ks_2samp(real_col, synth_col).statistic, rel=1e-12)
+
+    def test_asymptotic_p_values_match_scipy(self):
+        """Batched p-values match ks_2samp for columns past the exact-method size."""
+        real, synthetic = _frames(12_000, 11_000)
+        evaluator = StatisticalEvaluator(real, synthetic)
+
+        ks_results, distances = evaluator.numerical_column_stats(list(real.columns))
+
+        assert set(ks_results) == set(distances) == set(real.columns)
+        for column, (statistic, p_value) in ks_results.items():
+            expected = ks_2samp(real[column].dropna(), synthetic[column].dropna())
+            assert statistic == pytest.approx(expected.statistic, rel=1e-12)
+            assert p_value == pytest.approx(expected.pvalue, rel=1e-6, abs=1e-300)
+
+    def test_exact_p_values_left_to_scipy(self):
+        """Columns small enough for ks_2samp's exact method get no batched KS result."""
+        real, synthetic = _frames(1_000, 800)
+
+        ks_results, distances = StatisticalEvaluator(real, synthetic).numerical_column_stats(list(real.columns))
+
+        assert ks_results == {}
+        assert set(distances) == set(real.columns)
+
+    def test_empty_column_is_nan(self):
+        """A column with no values on one side gets NaN statistics."""
+        real = pd.DataFrame({"x": [1.0, 2.0, 3.0], "y": [np.nan] * 3})
+        synthetic = pd.DataFrame({"x": [1.0, 2.5], "y": [1.0, 2.0]})
+
+        out, _, _ = StatisticalEvaluator(real, synthetic)._column_stats(["x", "y"])
+
+        assert out[0, 0] == pytest.approx(wasserstein_distance([1, 2, 3], [1, 2.5]))
+        assert np.isnan(out[1]).all()
+
+    def test_infinite_values(self):
+        """Infinite values keep KS statistics finite, as with scipy."""
+        real = pd.DataFrame({"x": [1.0, 2.0, np.inf, 4.0]})
+        synthetic = pd.DataFrame({"x": [-np.inf, 2.0, 3.0]})
+
+        out, _, _ = StatisticalEvaluator(real, synthetic)._column_stats(["x"])
+
+        assert out[0, 1] == pytest.approx(ks_2samp(real["x"], synthetic["x"]).statistic)
@@ -0,0 +1,793 @@
+"""
+Unit tests for Evaluations module.
+
+Tests cover:
+- Report storage (JSON column encoding)
+- Streamed evaluation listing
+- ETag revalidation (304) of evaluations and generator listings
+- Soft delete (first deletion kept on repeated DELETEs)
+- Queued vs inline evaluation runs
+- Background evaluation task
+- Batched quick evaluation (ownership, shared dataset loads)
+- Shared evaluation worker pool
+- LLM insights and comparisons cached by report content
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+# Standard library
+import uuid
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+# Third-party
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+# Local - Module
+from app.datasets.models import Dataset
+from app.evaluations import quality_report, routes as evaluation_routes
+from app.evaluations.models import Evaluation, InsightsCache
+from app.evaluations.repositories import delete_evaluation
+from app.evaluations.schemas import EvaluationResponse, EvaluationSummaryResponse
+from app.generators.models import Generator
+from app.jobs.models import Job
+from app.tasks.evaluations import run_evaluation_task
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def _write_dataset(session: Session, user_id: uuid.UUID, path: Path, seed: int) -> Dataset:
+    """Write a small mixed-type CSV and register it as a dataset."""
+    rng = np.random.default_rng(seed)
+    pd.DataFrame({
+        "age": rng.normal(40, 10, 200).round(1),
+        "income": rng.exponential(50000, 200).round(2),
+        "city": rng.choice(["Paris", "Lyon", "Nice"], 200),
+    }).to_csv(path, index=False)
+    dataset = Dataset(
+        project_id=uuid.uuid4(),
+        name=path.stem,
+        file_path=str(path),
+        checksum=f"{path.stem}-{seed}",
+        uploader_id=user_id,
+    )
+    session.add(dataset)
+    session.commit()
+    session.refresh(dataset)
+    return dataset
+
+
+def _create_generator(
+    session: Session,
+    owner_id: uuid.UUID,
+    dataset: Dataset,
+    output_dataset: Dataset
+) -> Generator:
+    """Create a completed generator with synthetic output."""
+    generator = Generator(
+        name="Test Generator",
+        type="ctgan",
+        created_by=owner_id,
+        status="completed",
+        dataset_id=dataset.id,
+        output_dataset_id=output_dataset.id,
+    )
+    session.add(generator)
+    session.commit()
+    session.refresh(generator)
+    return generator
+
+
+@pytest.fixture
+def real_dataset(session: Session, test_user, tmp_path: Path) -> Dataset:
+    """Real dataset backed by a CSV file."""
+    return _write_dataset(session, test_user.id, tmp_path / "real.csv", seed=0)
+
+
+@pytest.fixture
+def owned_generators(session: Session, test_user, real_dataset: Dataset, tmp_path: Path) -> List[Generator]:
+    """Two generators of the test user trained on the same real dataset."""
+    return [
+        _create_generator(
+            session,
+            test_user.id,
+            real_dataset,
+            _write_dataset(session, test_user.id, tmp_path / f"synthetic_{i}.csv", seed=i + 1)
+        )
+        for i in range(2)
+    ]
+
+
+@pytest.fixture
+def evaluation_request(owned_generators: List[Generator], real_dataset: Dataset) -> dict:
+    """A full evaluation request without the (slow) ML utility section."""
+    return {
+        "generator_id": str(owned_generators[0].id),
+        "dataset_id": str(real_dataset.id),
+        "include_ml_utility": False,
+    }
+
+
+@pytest.fixture
+def in_process_reports(monkeypatch, compiled_kernels):
+    """Run summary reports in the test process instead of worker processes."""
+    monkeypatch.setattr(evaluation_routes, "get_report_pool", lambda: None)
+
+
+# ============================================================================
+# TESTS - REPORT STORAGE
+# ============================================================================
+
+class TestReportStorage:
+    """Tests for storing evaluation reports in JSON columns."""
+
+    def test_non_finite_values_are_stored_as_null(
+        self,
+        session: Session,
+        owned_generators: List[Generator],
+        real_dataset: Dataset
+    ):
+        """NaN and Infinity become null, numpy values are written natively."""
+        evaluation = Evaluation(
+            generator_id=owned_generators[0].id,
+            dataset_id=real_dataset.id,
+            report={
+                "statistical_similarity": {"ks_statistic": float("nan"), "p_value": float("inf")},
+                "scores": np.array([0.5, 0.75]),
+                "row_count": np.int64(200),
+            },
+        )
+        session.add(evaluation)
+        session.commit()
+        session.expire_all()
+
+        stored = session.get(Evaluation, evaluation.id).report
+        assert stored["statistical_similarity"] == {"ks_statistic": None, "p_value": None}
+        assert stored["scores"] == [0.5, 0.75]
+        assert stored["row_count"] == 200
+
+
+# ============================================================================
+# TESTS - EVALUATION LISTING
+# ============================================================================
+
+class TestListEvaluations:
+    """Tests for GET /evaluations, streamed as a JSON array."""
+
+    @pytest.fixture
+    def stored_evaluations(
+        self,
+        session: Session,
+        owned_generators: List[Generator],
+        real_dataset: Dataset
+    ) -> List[Evaluation]:
+        """Three evaluations of the user's generators, oldest first."""
+        created_at = datetime(2024, 1, 1)
+        evaluations = [
+            Evaluation(
+                generator_id=owned_generators[i % 2].id,
+                dataset_id=real_dataset.id,
+                report={"overall_assessment": {"overall_score": i / 10}},
+                created_at=created_at + timedelta(hours=i),
+            )
+            for i in range(3)
+        ]
+        session.add_all(evaluations)
+        session.commit()
+        return evaluations
+
+    def test_lists_all_evaluations_newest_first(
+        self,
+        authenticated_client: TestClient,
+        stored_evaluations: List[Evaluation]
+    ):
+        """The whole array is streamed, newest first, matching the response model."""
+        response = authenticated_client.get("/evaluations")
+
+        assert response.status_code == 200
+        items = response.json()
+        assert [item["id"] for item in items] == [str(e.id) for e in reversed(stored_evaluations)]
+        for item, evaluation in zip(items, reversed(stored_evaluations)):
+            assert EvaluationResponse.model_validate(item).report == evaluation.report
+
+    def test_lists_without_reports(
+        self,
+        authenticated_client: TestClient,
+        stored_evaluations: List[Evaluation]
+    ):
+        """include_report=false leaves the reports out."""
+        response = authenticated_client.get("/evaluations", params={"include_report": "false"})
+
+        assert response.status_code == 200
+        items = response.json()
+        assert len(items) == len(stored_evaluations)
+        assert all("report" not in item for item in items)
+        for item in items:
+            EvaluationSummaryResponse.model_validate(item)
+
+    def test_excludes_other_users_and_deleted(
+        self,
+        authenticated_client: TestClient,
+        session: Session,
+        stored_evaluations: List[Evaluation],
+        real_dataset: Dataset
+    ):
+        """Soft-deleted evaluations and other users' generators are not listed."""
+        other_generator = _create_generator(session, uuid.uuid4(), real_dataset, real_dataset)
+        session.add(Evaluation(generator_id=other_generator.id, dataset_id=real_dataset.id))
+        stored_evaluations[0].deleted_at = datetime.utcnow()
+        session.add(stored_evaluations[0])
+        session.commit()
+
+        response = authenticated_client.get("/evaluations")
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == [
+            str(stored_evaluations[2].id),
+            str(stored_evaluations[1].id)
+        ]
+
+    def test_empty_listing(self, authenticated_client: TestClient):
+        """A user without evaluations gets an empty JSON array."""
+        response = authenticated_client.get("/evaluations")
+
+        assert response.status_code == 200
+        assert response.content == b"[]"
+
+
+# ============================================================================
+# TESTS - ETAG REVALIDATION
+# ============================================================================
+
+class TestEvaluationETags:
+    """Tests for ETag / If-None-Match on evaluation GETs."""
+
+    @pytest.fixture
+    def evaluation(self, session: Session, owned_generators: List[Generator], real_dataset: Dataset) -> Evaluation:
+        """A stored evaluation with its report hash."""
+        report = {"overall_assessment": {"overall_score": 0.8}}
+        evaluation = Evaluation(
+            generator_id=owned_generators[0].id,
+            dataset_id=real_dataset.id,
+            report=report,
+            artifact_hash=Evaluation.compute_report_hash(report),
+        )
+        session.add(evaluation)
+        session.commit()
+        return evaluation
+
+    def test_evaluation_etag_is_report_hash(self, authenticated_client: TestClient, evaluation: Evaluation):
+        """The ETag is the stored report hash, and the body is the full evaluation."""
+        response = authenticated_client.get(f"/evaluations/{evaluation.id}")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == f'W/"{evaluation.artifact_hash}"'
+        assert response.headers["cache-control"] == "private, no-cache, must-revalidate"
+        assert response.json()["report"] == evaluation.report
+
+    def test_evaluation_not_modified(self, authenticated_client: TestClient, evaluation: Evaluation, monkeypatch):
+        """A matching If-None-Match gets an empty 304 without building the body."""
+        monkeypatch.setattr(evaluation_routes, "_evaluation_response", None)
+        etag = f'W/"{evaluation.artifact_hash}"'
+
+        response = authenticated_client.get(
+            f"/evaluations/{evaluation.id}",
+            headers={"If-None-Match": f'W/"stale", {etag}'}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_evaluation_without_stored_hash(
+        self,
+        authenticated_client: TestClient,
+        session: Session,
+        evaluation: Evaluation
+    ):
+        """Evaluations saved without a hash get one computed from the report."""
+        expected = evaluation.artifact_hash
+        evaluation.artifact_hash = None
+        session.add(evaluation)
+        session.commit()
+
+        response = authenticated_client.get(f"/evaluations/{evaluation.id}")
+
+        assert response.headers["etag"] == f'W/"{expected}"'
+
+    def test_generator_listing_revalidation(
+        self,
+        authenticated_client: TestClient,
+        session: Session,
+        evaluation: Evaluation,
+        real_dataset: Dataset
+    ):
+        """The listing answers 304 until an evaluation is added to it, per representation."""
+        url = f"/evaluations/generator/{evaluation.generator_id}"
+        etag = authenticated_client.get(url).headers["etag"]
+
+        assert authenticated_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+        # Summaries are a different body than full reports
+        summaries = authenticated_client.get(
+            url,
+            params={"include_report": "false"},
+            headers={"If-None-Match": etag}
+        )
+        assert summaries.status_code == 200
+        assert summaries.headers["etag"] != etag
+
+        session.add(Evaluation(generator_id=evaluation.generator_id, dataset_id=real_dataset.id))
+        session.commit()
+        response = authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert len(response.json()) == 2
+
+
+# ============================================================================
+# TESTS - DELETE EVALUATION
+# ============================================================================
+
+class TestDeleteEvaluation:
+    """Tests for soft-deleting evaluations."""
+
+    @pytest.fixture
+    def evaluation(self, session: Session, owned_generators: List[Generator], real_dataset: Dataset) -> Evaluation:
+        """A stored evaluation of the user's generator."""
+        evaluation = Evaluation(generator_id=owned_generators[0].id, dataset_id=real_dataset.id)
+        session.add(evaluation)
+        session.commit()
+        return evaluation
+
+    def test_delete_marks_evaluation_deleted(
+        self,
+        authenticated_client: TestClient,
+        session: Session,
+        test_user,
+        evaluation: Evaluation
+    ):
+        """The row is kept, stamped with when and by whom it was deleted."""
+        response = authenticated_client.delete(f"/evaluations/{evaluation.id}")
+
+        assert response.status_code == 200
+        session.expire_all()
+        stored = session.get(Evaluation, evaluation.id)
+        assert stored.deleted_at is not None
+        assert stored.deleted_by == test_user.id
+
+    def test_repeated_delete_keeps_first_deletion(
+        self,
+        authenticated_client: TestClient,
+        session: Session,
+        evaluation: Evaluation
+    ):
+        """Deleting again is a 404 and leaves the recorded deletion unchanged."""
+        authenticated_client.delete(f"/evaluations/{evaluation.id}")
+        session.expire_all()
+        deleted_at = session.get(Evaluation, evaluation.id).deleted_at
+
+        response = authenticated_client.delete(f"/evaluations/{evaluation.id}")
+
+        assert response.status_code == 404
+        assert delete_evaluation(session, str(evaluation.id), deleted_by=str(uuid.uuid4())) is False
+        session.expire_all()
+        assert session.get(Evaluation, evaluation.id).deleted_at == deleted_at
+
+
+# ============================================================================
+# TESTS - RUN EVALUATION
+# ============================================================================
+
+class TestRunEvaluation:
+    """Tests for POST /evaluations/run."""
+
+    def test_queued_by_default(
+        self,
+        authenticated_client: TestClient,
+        session: Session,
+        evaluation_request: dict,
+        monkeypatch
+    ):
+        """Without sync the evaluation is queued: 202 with a job to poll."""
+        queued = []
+
+        def fake_delay(*args):
+            queued.append(args)
+            return SimpleNamespace(id="task-1")
+
+        monkeypatch.setattr(run_evaluation_task, "delay", fake_delay)
+
+        response = authenticated_client.post("/evaluations/run", json=evaluation_request)
+
+        assert response.status_code == 202
+        body = response.json()
+        assert body["task_id"] == "task-1"
+        evaluation_id, job_id, request_data, _ = queued[0]
+        assert (evaluation_id, job_id) == (body["evaluation_id"], body["job_id"])
+        assert request_data["generator_id"] == evaluation_request["generator_id"]
+
+        job = session.get(Job, uuid.UUID(body["job_id"]))
+        assert (job.status, job.celery_task_id) == ("queued", "task-1")
+
+    def test_queue_unavailable(
+        self,
+        authenticated_client: TestClient,
+        session: Session,
+        evaluation_request: dict,
+        monkeypatch
+    ):
+        """A broker that can't be reached fails the job and returns 503."""
+        def failing_delay(*args):
+            raise ConnectionError("broker down")
+
+        monkeypatch.setattr(run_evaluation_task, "delay", failing_delay)
+
+        response = authenticated_client.post("/evaluations/run", json=evaluation_request)
+
+        assert response.status_code == 503
+        job = session.exec(select(Job)).one()
+        assert job.status == "failed"
+
+    def test_sync_runs_inline(
+        self,
+        authenticated_client: TestClient,
+        session: Session,
+        evaluation_request: dict,
+        compiled_kernels,
+        monkeypatch
+    ):
+        """sync=true runs the evaluation in the request and returns 201 with the report."""
+        monkeypatch.setattr(run_evaluation_task, "delay", lambda *args: pytest.fail("queued"))
+
+        response = authenticated_client.post(
+            "/evaluations/run",
+            params={"sync": "true"},
+            json=evaluation_request
+        )
+
+        assert response.status_code == 201
+        body = EvaluationResponse.model_validate(response.json())
+        assert "overall_assessment" in body.report
+        assert session.get(Evaluation, uuid.UUID(body.id)) is not None
+
+
+# ============================================================================
+# TESTS - EVALUATION TASK
+# ============================================================================
+
+class TestRunEvaluationTask:
+    """Tests for the run_evaluation_task Celery task."""
+
+    @pytest.fixture
+    def queued_job(self, session: Session, test_user, real_dataset: Dataset) -> Job:
+        """Job tracking a queued evaluation."""
+        job = Job(
+            project_id=real_dataset.project_id,
+            initiated_by=test_user.id,
+            dataset_id=real_dataset.id,
+            type="evaluation",
+            status="queued"
+        )
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+        return job
+
+    @pytest.fixture(autouse=True)
+    def task_session(self, session: Session, monkeypatch):
+        """Give the task the test session instead of one on the app engine."""
+        monkeypatch.setattr(run_evaluation_task, "_db", session)
+
+    def test_saves_report_and_completes_job(
+        self,
+        session: Session,
+        test_user,
+        queued_job: Job,
+        evaluation_request: dict,
+        compiled_kernels
+    ):
+        """The report is saved under the handed-out ID and the job completed."""
+        evaluation_id = str(uuid.uuid4())
+
+        run_evaluation_task.run(evaluation_id, str(queued_job.id), evaluation_request, str(test_user.id))
+
+        evaluation = session.get(Evaluation, uuid.UUID(evaluation_id))
+        assert evaluation.created_by == test_user.id
+        assert evaluation.artifact_hash == Evaluation.compute_report_hash(evaluation.report)
+        session.refresh(queued_job)
+        assert queued_job.status == "completed"
+        assert queued_job.started_at is not None and queued_job.completed_at is not None
+
+    def test_marks_job_failed_on_error(
+        self,
+        session: Session,
+        test_user,
+        queued_job: Job,
+        owned_generators: List[Generator],
+        evaluation_request: dict
+    ):
+        """A failing evaluation marks the job failed and re-raises."""
+        output_dataset = session.get(Dataset, owned_generators[0].output_dataset_id)
+        Path(output_dataset.file_path).unlink()
+        evaluation_id = str(uuid.uuid4())
+
+        with pytest.raises(FileNotFoundError):
+            run_evaluation_task.run(evaluation_id, str(queued_job.id), evaluation_request, str(test_user.id))
+
+        session.refresh(queued_job)
+        assert queued_job.status == "failed"
+        assert output_dataset.file_path in queued_job.error_message
+        assert session.get(Evaluation, uuid.UUID(evaluation_id)) is None
+
+
+# ============================================================================
+# TESTS - QUICK EVALUATION BATCH
+# ============================================================================
+
+class TestQuickEvaluationBatch:
+    """Tests for POST /evaluations/quick/batch."""
+
+    def test_batch_loads_each_dataset_once(
+        self,
+        authenticated_client: TestClient,
+        owned_generators: List[Generator],
+        in_process_reports,
+        monkeypatch
+    ):
+        """Generators sharing a real dataset share a single load of its file."""
+        loaded = []
+        read_for_summary = evaluation_routes._read_for_summary
+
+        def counting_read(path):
+            loaded.append(Path(path))
+            return read_for_summary(path)
+
+        monkeypatch.setattr(evaluation_routes, "_read_for_summary", counting_read)
+        generator_ids = [str(g.id) for g in owned_generators]
+
+        response = authenticated_client.post(
+            "/evaluations/quick/batch",
+            json={"generator_ids": generator_ids + generator_ids[:1]}
+        )
+
+        assert response.status_code == 200
+        summaries = response.json()
+        assert [s["generator_id"] for s in summaries] == generator_ids + generator_ids[:1]
+        assert all("quality_level" in s for s in summaries)
+        # One real file shared by both generators, plus one output file each
+        assert len(loaded) == 3
+        assert len(set(loaded)) == 3
+
+    def test_batch_rejects_generators_of_other_users(
+        self,
+        authenticated_client: TestClient,
+        session: Session,
+        owned_generators: List[Generator],
+        real_dataset: Dataset,
+        in_process_reports
+    ):
+        """A batch with any generator the user doesn't own is rejected as a whole."""
+        other_generator = _create_generator(session, uuid.uuid4(), real_dataset, real_dataset)
+
+        response = authenticated_client.post(
+            "/evaluations/quick/batch",
+            json={"generator_ids": [str(owned_generators[0].id), str(other_generator.id)]}
+        )
+
+        assert response.status_code == 403
+        assert str(other_generator.id) in response.json()["detail"]
+
+    def test_batch_unknown_generator(self, authenticated_client: TestClient):
+        """Unknown generator IDs are reported as not found."""
+        missing_id = str(uuid.uuid4())
+        response = authenticated_client.post(
+            "/evaluations/quick/batch",
+            json={"generator_ids": [missing_id]}
+        )
+
+        assert response.status_code == 404
+        assert missing_id in response.json()["detail"]
+
+
+# ============================================================================
+# TESTS - EVALUATION WORKER POOL
+# ============================================================================
+
+class _BrokenPool:
+    """Stands in for a process pool whose worker died."""
+
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+class TestReportPool:
+    """Tests for the shared evaluation worker pool."""
+
+    def test_broken_pool_is_replaced_on_submit(self, monkeypatch):
+        """Submitting to a broken pool starts a new pool and runs the task there."""
+        monkeypatch.setattr(quality_report.settings, "eval_workers", 2)
+        broken = _BrokenPool()
+        monkeypatch.setattr(quality_report, "_report_pool", broken)
+        try:
+            future = quality_report.submit_report_task(sum, [1, 2, 3])
+            assert future.result(timeout=120) == 6
+            assert broken.shut_down
+            assert quality_report._report_pool is not broken
+        finally:
+            quality_report.shutdown_report_pool()
+
+    def test_no_pool_with_a_single_worker(self, monkeypatch):
+        """EVAL_WORKERS=1 runs evaluations in the calling process."""
+        monkeypatch.setattr(quality_report.settings, "eval_workers", 1)
+        assert quality_report.get_report_pool() is None
+
+
+# ============================================================================
+# TESTS - LLM INSIGHTS CACHE
+# ============================================================================
+
+class _FakeTranslator:
+    """Report translator that records the reports it is asked to explain."""
+
+    def __init__(self, provider: str = "groq"):
+        self.provider = provider
+        self.reports = []
+
+    async def translate_evaluation(self, report: dict) -> dict:
+        self.reports.append(report)
+        return {"executive_summary": f"call {len(self.reports)}", "_metadata": {"provider": self.provider}}
+
+    async def compare_evaluations(self, evaluations: List[dict]) -> dict:
+        self.reports.append([evaluation["metrics"] for evaluation in evaluations])
+        return {"recommendation": f"call {len(self.reports)}", "_metadata": {"provider": self.provider}}
+
+
+@pytest.fixture
+def translator(monkeypatch) -> _FakeTranslator:
+    """Fake LLM translator used by the explain and compare routes."""
+    fake = _FakeTranslator()
+    monkeypatch.setattr(evaluation_routes, "get_report_translator", lambda: fake)
+    return fake
+
+
+class TestInsightsCache:
+    """Tests for insights shared between evaluations with the same report."""
+
+    @pytest.fixture
+    def same_report_evaluations(
+        self,
+        session: Session,
+        owned_generators: List[Generator],
+        real_dataset: Dataset
+    ) -> List[Evaluation]:
+        """Two runs with the same results, generated at different times."""
+        evaluations = [
+            Evaluation(
+                generator_id=owned_generators[i].id,
+                dataset_id=real_dataset.id,
+                report={"overall_assessment": {"overall_score": 0.8}, "generated_at": f"2024-01-0{i + 1}"},
+            )
+            for i in range(2)
+        ]
+        session.add_all(evaluations)
+        session.commit()
+        return evaluations
+
+    def test_report_key_ignores_run_timestamp(self):
+        """Only the report content, not when it was generated, makes up the key."""
+        report = {"overall_assessment": {"overall_score": 0.8}, "generated_at": "2024-01-01"}
+
+        key = InsightsCache.compute_report_key(report)
+
+        assert key == InsightsCache.compute_report_key({**report, "generated_at": "2025-06-30"})
+        assert key != InsightsCache.compute_report_key({**report, "overall_assessment": {"overall_score": 0.7}})
+
+    def test_insights_shared_by_identical_reports(
+        self,
+        authenticated_client: TestClient,
+        session: Session,
+        translator: _FakeTranslator,
+        same_report_evaluations: List[Evaluation]
+    ):
+        """The second evaluation reuses the first one's insights without an LLM call."""
+        first, second = (
+            authenticated_client.post(f"/evaluations/{evaluation.id}/explain").json()
+            for evaluation in same_report_evaluations
+        )
+
+        assert len(translator.reports) == 1
+        assert second == first
+        session.expire_all()
+        assert session.get(Evaluation, same_report_evaluations[1].id).insights == first
+
+    def test_fallback_insights_not_shared(
+        self,
+        authenticated_client: TestClient,
+        translator: _FakeTranslator,
+        same_report_evaluations: List[Evaluation]
+    ):
+        """Rule-based fallback insights are kept per evaluation, not cached by content."""
+        translator.provider = "fallback"
+
+        for evaluation in same_report_evaluations:
+            assert authenticated_client.post(f"/evaluations/{evaluation.id}/explain").status_code == 200
+
+        assert len(translator.reports) == 2
+
+
+class TestComparisonCache:
+    """Tests for comparisons cached by the compared reports."""
+
+    @pytest.fixture
+    def compared_evaluations(
+        self,
+        session: Session,
+        owned_generators: List[Generator],
+        real_dataset: Dataset
+    ) -> List[Evaluation]:
+        """Evaluations of two generators with different scores."""
+        evaluations = [
+            Evaluation(
+                generator_id=generator.id,
+                dataset_id=real_dataset.id,
+                report={"overall_assessment": {"overall_score": score}},
+            )
+            for generator, score in zip(owned_generators, (0.6, 0.9))
+        ]
+        session.add_all(evaluations)
+        session.commit()
+        return evaluations
+
+    def test_comparison_key_follows_order_and_types(self):
+        """Position and generator type are part of the key; run timestamps are not."""
+        first = {"generator_type": "ctgan", "metrics": {"score": 0.6, "generated_at": "2024-01-01"}}
+        second = {"generator_type": "tvae", "metrics": {"score": 0.9}}
+
+        key = InsightsCache.compute_comparison_key([first, second])
+
+        assert key == InsightsCache.compute_comparison_key([
+            {**first, "metrics": {"score": 0.6, "generated_at": "2025-06-30"}},
+            second
+        ])
+        assert key != InsightsCache.compute_comparison_key([second, first])
+        assert key != InsightsCache.compute_comparison_key([{**first, "generator_type": "tvae"}, second])
+        assert key != InsightsCache.compute_report_key(first["metrics"])
+
+    def test_repeated_comparison_is_cached(
+        self,
+        authenticated_client: TestClient,
+        translator: _FakeTranslator,
+        compared_evaluations: List[Evaluation]
+    ):
+        """Comparing the same evaluations again makes no LLM call; another order does."""
+        ids = [str(evaluation.id) for evaluation in compared_evaluations]
+
+        first = authenticated_client.post("/evaluations/compare", json={"evaluation_ids": ids}).json()
+        again = authenticated_client.post("/evaluations/compare", json={"evaluation_ids": ids}).json()
+        assert again == first
+        assert len(translator.reports) == 1
+
+        reversed_order = authenticated_client.post(
+            "/evaluations/compare",
+            json={"evaluation_ids": ids[::-1]}
+        ).json()
+        assert reversed_order != first
+        assert len(translator.reports) == 2
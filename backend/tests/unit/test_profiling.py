@@ -0,0 +1,127 @@
+"""
+Unit tests for Profiling service.
+
+Tests cover:
+- Chunked profiling against whole-frame profiling
+- Duplicate counting with hashes spilled to disk
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+# Standard library
+from pathlib import Path
+
+# Third-party
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local - Module
+from app.datasets.loaders import iter_dataset_chunks
+from app.services.profiling import DataProfiler, StreamingDataProfiler, _DistinctHashCounter
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> Path:
+    """CSV of 5,000 rows with missing values, correlated and duplicate rows."""
+    rng = np.random.default_rng(7)
+    n = 4_500
+    age = rng.normal(40, 12, n).round()
+    df = pd.DataFrame({
+        "age": age,
+        "income": (age * 1_000 + rng.normal(0, 5_000, n)).round(2),
+        "score": rng.uniform(0, 1, n).round(3),
+        "city": rng.choice(["Paris", "Lyon", "Nice", "Lille"], n),
+    })
+    df.loc[rng.choice(n, 300, replace=False), "income"] = np.nan
+    df.loc[rng.choice(n, 200, replace=False), "city"] = None
+    # 500 exact copies of earlier rows, spread over the later chunks
+    df = pd.concat([df, df.sample(500, random_state=1)], ignore_index=True)
+
+    path = tmp_path / "people.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def _streamed_profile(path: Path, chunksize: int = 1_000) -> dict:
+    """Profile a file with StreamingDataProfiler, several chunks per file."""
+    return StreamingDataProfiler(iter_dataset_chunks(path, chunksize=chunksize)).profile()
+
+
+# ============================================================================
+# TESTS - STREAMING PROFILER
+# ============================================================================
+
+class TestStreamingDataProfiler:
+    """Tests for StreamingDataProfiler against DataProfiler."""
+
+    def test_matches_whole_frame_profile(self, csv_path: Path):
+        """Exact statistics match DataProfiler on the whole file."""
+        expected = DataProfiler(pd.read_csv(csv_path)).profile()
+        streamed = _streamed_profile(csv_path)
+
+        summary = streamed["dataset_summary"]
+        assert summary["sampled"] is True
+        for key in ("row_count", "duplicate_row_count", "total_missing_cells"):
+            assert summary[key] == expected["dataset_summary"][key]
+        assert streamed["duplicates"] == expected["duplicates"]
+        assert streamed["missing_values"] == expected["missing_values"]
+
+        for col, profile in expected["columns"].items():
+            streamed_col = streamed["columns"][col]
+            assert streamed_col["missing_count"] == profile["missing_count"]
+            # Exact while a column has fewer distinct values than the sketch
+            if profile["unique_count"] < StreamingDataProfiler.KMV_SIZE:
+                assert streamed_col["unique_count"] == profile["unique_count"]
+            else:
+                assert streamed_col["unique_count"] == pytest.approx(profile["unique_count"], rel=0.05)
+            for stat in ("mean", "std", "min", "max"):
+                if stat in profile:
+                    assert streamed_col[stat] == pytest.approx(profile[stat], rel=1e-9)
+
+        expected_corr = pd.DataFrame(expected["correlations"]["correlation_matrix"])
+        streamed_corr = pd.DataFrame(streamed["correlations"]["correlation_matrix"])
+        pd.testing.assert_frame_equal(
+            streamed_corr.loc[expected_corr.index, expected_corr.columns],
+            expected_corr,
+            rtol=1e-9
+        )
+
+    def test_spilled_duplicate_count(self, csv_path: Path, monkeypatch):
+        """Duplicates are counted exactly when row hashes spill to disk."""
+        expected = DataProfiler(pd.read_csv(csv_path)).profile()
+        monkeypatch.setattr(StreamingDataProfiler, "DUPLICATE_HASH_BUFFER", 1_500)
+
+        streamed = _streamed_profile(csv_path)
+
+        assert streamed["duplicates"] == expected["duplicates"]
+
+    def test_empty_file(self, tmp_path: Path):
+        """A header-only file profiles as an empty dataset."""
+        path = tmp_path / "empty.csv"
+        path.write_text("a,b\n")
+
+        streamed = _streamed_profile(path)
+
+        assert streamed["dataset_summary"]["row_count"] == 0
+
+
+class TestDistinctHashCounter:
+    """Tests for the bounded-memory distinct hash counter."""
+
+    @pytest.mark.parametrize("max_buffered", [10_000_000, 1_000, 1])
+    def test_counts_distinct_hashes(self, max_buffered: int):
+        """Same count whether hashes stay in memory or are spilled."""
+        rng = np.random.default_rng(3)
+        hashes = rng.integers(0, np.iinfo(np.uint64).max, 5_000, dtype=np.uint64)
+        counter = _DistinctHashCounter(max_buffered)
+        for chunk in np.array_split(np.concatenate([hashes, hashes[:1_200]]), 7):
+            counter.add(chunk)
+
+        assert counter.count() == 5_000
+        assert counter._spill_dir is None
@@ -810,7 +810,12 @@ class ApiClient {
       };
       statistical_columns?: string[];
     };
-  }): Promise<Evaluation> {
+  }): Promise<{
+    message: string;
+    evaluation_id: string;
+    job_id: string;
+    task_id?: string;
+  }> {
     return this.request("/evaluations/run", {
       method: "POST",
       body: JSON.stringify(data),